@@ -1,4 +1,7 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime
 from types import TracebackType
 from typing import Any, Self
@@ -6,11 +9,19 @@ from typing import Any, Self
 import httpx
 from pydantic import BaseModel
 
+from app.clients import http
 from app.config import get_settings
 from app.exceptions import AuthServiceError, AuthServiceNotFoundError
+from app.utils.concurrency import run_bounded
 
 logger = logging.getLogger(__name__)
 
+BULK_UPDATE_ENDPOINT = "/api/tokens/bulk"
+# Statuses meaning the Auth Service has no bulk endpoint, as opposed to a failed bulk call.
+BULK_UNSUPPORTED_STATUSES = frozenset({404, 405, 501})
+DEFAULT_TOKEN_PAGE_SIZE = 1000
+DEFAULT_ACCESS_LOG_PAGE_SIZE = 1000
+
 
 class AuthTokenCreate(BaseModel):
     """Request payload for creating a token in Auth Service."""
@@ -35,28 +46,96 @@ class AuthTokenUpdate(BaseModel):
     meta: dict[str, str] | None = None
 
 
+@dataclass
+class BulkUpdateResult:
+    """Outcome of ``AuthServiceClient.bulk_update_tokens``."""
+
+    updated: set[int] = field(default_factory=set)
+    not_found: set[int] = field(default_factory=set)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
+class AuthTokenIndex:
+    """
+    In-memory mirror of every Auth Service token, indexed for O(1) lookups.
+
+    Built once per full resync from ``AuthServiceClient.list_tokens`` so
+    recovering a user does not scan the token list. Keep it current with
+    ``add``/``discard`` while the run changes tokens.
+    """
+
+    def __init__(self, tokens: list[dict[str, Any]] | None = None) -> None:
+        self.by_id: dict[int, dict[str, Any]] = {}
+        self.by_token: dict[str, dict[str, Any]] = {}
+        self.by_user_id: dict[str, dict[int, dict[str, Any]]] = {}
+        for token in tokens or []:
+            self.add(token)
+
+    @classmethod
+    async def load(cls, client: "AuthServiceClient") -> Self:
+        index = cls(await client.list_tokens(concurrency=get_settings().auth_sync_concurrency))
+        logger.info("Indexed %d Auth Service tokens", len(index))
+        return index
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def add(self, token: dict[str, Any]) -> None:
+        token_id = token.get("id")
+        if not isinstance(token_id, int):
+            return
+        self.discard(token_id)
+        self.by_id[token_id] = token
+        if isinstance(token.get("token"), str):
+            self.by_token[token["token"]] = token
+        if token.get("user_id") is not None:
+            self.by_user_id.setdefault(str(token["user_id"]), {})[token_id] = token
+
+    def discard(self, token_id: int) -> None:
+        token = self.by_id.pop(token_id, None)
+        if token is None:
+            return
+        if self.by_token.get(token.get("token")) is token:
+            del self.by_token[token["token"]]
+        owned = self.by_user_id.get(str(token.get("user_id")))
+        if owned is not None:
+            owned.pop(token_id, None)
+            if not owned:
+                del self.by_user_id[str(token.get("user_id"))]
+
+    def get(self, token_id: int) -> dict[str, Any] | None:
+        return self.by_id.get(token_id)
+
+    def find_by_value(self, token: str) -> dict[str, Any] | None:
+        return self.by_token.get(token)
+
+    def for_user(self, user_id: str) -> list[dict[str, Any]]:
+        return list(self.by_user_id.get(user_id, {}).values())
+
+
 class AuthServiceClient:
     """Client for Auth Service API.
 
-    Use as an async context manager to share a single HTTP connection pool:
+    Use as an async context manager; requests go through the process-wide Auth
+    Service connection pool, which outlives the context:
 
         async with AuthServiceClient() as client:
             await client.create_token(data)
             await client.update_token(token_id, update_data)
     """
 
-    def __init__(self) -> None:
+    # Process-wide: None until the first bulk call tells whether the endpoint exists.
+    bulk_update_supported: bool | None = None
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         settings = get_settings()
         self.base_url = settings.auth_service_url.rstrip("/")
         self.api_key = settings.auth_service_api_key
-        self.timeout = settings.auth_service_timeout
+        self._http_client = http_client
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> Self:
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers={"X-API-Key": self.api_key, "Content-Type": "application/json"},
-        )
+        self._client = self._http_client or http.http_clients.get(http.AUTH)
         return self
 
     async def __aexit__(
@@ -65,9 +144,7 @@ class AuthServiceClient:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     async def _request(
         self,
@@ -83,7 +160,13 @@ class AuthServiceClient:
         url = f"{self.base_url}{path}"
 
         try:
-            response = await self._client.request(method, url, json=json, params=params)
+            response = await self._client.request(
+                method,
+                url,
+                json=json,
+                params=params,
+                headers={"X-API-Key": self.api_key},
+            )
 
             if response.status_code in accept_statuses:
                 return response
@@ -129,6 +212,88 @@ class AuthServiceClient:
         )
         logger.info("Updated auth token %d", auth_token_id)
 
+    async def bulk_update_tokens(
+        self, updates: list[tuple[int, AuthTokenUpdate]]
+    ) -> BulkUpdateResult:
+        """
+        Update many tokens with as few requests as possible.
+
+        Updates are sent to the bulk endpoint in chunks of
+        ``AUTH_BULK_UPDATE_SIZE``. When the Auth Service has no bulk endpoint,
+        bulk updates are disabled, or a bulk request fails, each token is
+        patched on its own with ``AUTH_SYNC_CONCURRENCY`` requests in flight.
+        A failing token does not fail the others; it is reported in the result.
+        """
+        settings = get_settings()
+        result = BulkUpdateResult()
+        chunk_size = settings.auth_bulk_update_size
+        if chunk_size > 0 and type(self).bulk_update_supported is not False:
+            remaining: list[tuple[int, AuthTokenUpdate]] = []
+            for start in range(0, len(updates), chunk_size):
+                chunk = updates[start : start + chunk_size]
+                if type(self).bulk_update_supported is False:
+                    remaining.extend(chunk)
+                    continue
+                if not await self._bulk_update_chunk(chunk, result):
+                    remaining.extend(chunk)
+            updates = remaining
+
+        async def patch(update: tuple[int, AuthTokenUpdate]) -> None:
+            auth_token_id, data = update
+            try:
+                await self.update_token(auth_token_id, data)
+            except AuthServiceNotFoundError:
+                result.not_found.add(auth_token_id)
+            except AuthServiceError as e:
+                result.failed[auth_token_id] = str(e)
+            else:
+                result.updated.add(auth_token_id)
+
+        await run_bounded(updates, patch, settings.auth_sync_concurrency)
+        return result
+
+    async def _bulk_update_chunk(
+        self, chunk: list[tuple[int, AuthTokenUpdate]], result: BulkUpdateResult
+    ) -> bool:
+        """Send one bulk request; returns False when its tokens must be patched one by one."""
+        try:
+            response = await self._request(
+                "POST",
+                BULK_UPDATE_ENDPOINT,
+                json={
+                    "updates": [
+                        {"id": auth_token_id, **data.model_dump(mode="json", exclude_none=True)}
+                        for auth_token_id, data in chunk
+                    ]
+                },
+                accept_statuses={200, *BULK_UNSUPPORTED_STATUSES},
+                operation=f"bulk update {len(chunk)} tokens",
+            )
+        except AuthServiceError as e:
+            logger.warning(
+                "Bulk token update failed, patching %d tokens one by one: %s", len(chunk), e
+            )
+            return False
+
+        if response.status_code in BULK_UNSUPPORTED_STATUSES:
+            logger.info("Auth Service has no bulk token update; patching tokens one by one")
+            type(self).bulk_update_supported = False
+            return False
+
+        type(self).bulk_update_supported = True
+        payload = response.json()
+        updated = set(payload.get("updated") or []) if isinstance(payload, dict) else set()
+        not_found = set(payload.get("not_found") or []) if isinstance(payload, dict) else set()
+        for auth_token_id, _data in chunk:
+            if auth_token_id in updated:
+                result.updated.add(auth_token_id)
+            elif auth_token_id in not_found:
+                result.not_found.add(auth_token_id)
+            else:
+                result.failed[auth_token_id] = "Missing from bulk update response"
+        logger.info("Bulk updated %d auth tokens", len(updated))
+        return True
+
     async def get_token(self, auth_token_id: int) -> dict[str, Any]:
         """Get a token record from Auth Service by ID."""
         return await self._request_json_object(
@@ -138,19 +303,62 @@ class AuthServiceClient:
             operation=f"get token {auth_token_id}",
         )
 
-    async def find_token_by_value(self, token: str, *, limit: int = 1000) -> dict[str, Any] | None:
-        """Find an Auth Service token record by token value."""
-        payload = await self._request_json_list(
+    async def list_tokens(
+        self, *, page_size: int | None = None, concurrency: int = 1
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every Auth Service token, following ``skip``/``limit`` pages to the end.
+
+        With ``concurrency`` above one, that many consecutive pages are
+        requested at once until a short page marks the end.
+        """
+        page_size = page_size or get_settings().auth_token_page_size or DEFAULT_TOKEN_PAGE_SIZE
+        concurrency = max(concurrency, 1)
+        tokens: list[dict[str, Any]] = []
+        skip = 0
+        while True:
+            pages = await asyncio.gather(
+                *(self._token_page(skip + offset * page_size, page_size) for offset in range(concurrency))
+            )
+            for page in pages:
+                tokens.extend(item for item in page if isinstance(item, dict))
+                if len(page) < page_size:
+                    return tokens
+            skip += concurrency * page_size
+
+    async def find_token_by_value(
+        self, token: str, *, page_size: int | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Find an Auth Service token record by token value.
+
+        Pages through the token list until the token is found. Bulk callers
+        should build an ``AuthTokenIndex`` once instead.
+        """
+        page_size = page_size or get_settings().auth_token_page_size or DEFAULT_TOKEN_PAGE_SIZE
+        async for page in self._token_pages(page_size):
+            for item in page:
+                if item.get("token") == token:
+                    return item
+        return None
+
+    async def _token_pages(self, page_size: int) -> AsyncIterator[list[dict[str, Any]]]:
+        skip = 0
+        while True:
+            payload = await self._token_page(skip, page_size)
+            yield [item for item in payload if isinstance(item, dict)]
+            if len(payload) < page_size:
+                return
+            skip += len(payload)
+
+    async def _token_page(self, skip: int, limit: int) -> list[Any]:
+        return await self._request_json_list(
             "GET",
             "/api/tokens",
-            params={"skip": 0, "limit": limit},
+            params={"skip": skip, "limit": limit},
             accept_statuses={200},
-            operation="find token by value",
+            operation="list tokens",
         )
-        for item in payload:
-            if isinstance(item, dict) and item.get("token") == token:
-                return item
-        return None
 
     async def delete_token(self, auth_token_id: int) -> None:
         """Delete a token from Auth Service."""
@@ -166,14 +374,27 @@ class AuthServiceClient:
         self,
         user_id: str,
         *,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        sort_by: str | None = None,
+        sort_dir: str | None = None,
         skip: int = 0,
         limit: int = 100,
     ) -> list[dict[str, Any]]:
         """Get active sessions for a user from Auth Service."""
+        params: dict[str, Any] = {"user_id": user_id, "skip": skip, "limit": limit}
+        if start_time:
+            params["start_time"] = start_time.isoformat()
+        if end_time:
+            params["end_time"] = end_time.isoformat()
+        if sort_by:
+            params["sort_by"] = sort_by
+            params["sort_dir"] = sort_dir or "desc"
+
         response = await self._request(
             "GET",
             "/api/sessions",
-            params={"user_id": user_id, "skip": skip, "limit": limit},
+            params=params,
             accept_statuses={200, 404},
             operation=f"get sessions for {user_id}",
         )
@@ -216,6 +437,47 @@ class AuthServiceClient:
             return payload
         raise AuthServiceError("Unexpected access logs response format")
 
+    async def access_log_pages(
+        self,
+        *,
+        user_id: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield access-log pages to the end of the range.
+
+        The next page is requested while the caller handles the current one,
+        so at most two pages are held at a time.
+        """
+        page_size = page_size or get_settings().auth_access_log_page_size or DEFAULT_ACCESS_LOG_PAGE_SIZE
+
+        def fetch(skip: int) -> asyncio.Task[list[dict[str, Any]]]:
+            return asyncio.create_task(
+                self.get_access_logs(
+                    user_id=user_id,
+                    start_time=start_time,
+                    end_time=end_time,
+                    skip=skip,
+                    limit=page_size,
+                )
+            )
+
+        skip = 0
+        pending: asyncio.Task[list[dict[str, Any]]] | None = fetch(skip)
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                if len(page) >= page_size:
+                    skip += len(page)
+                    pending = fetch(skip)
+                yield [item for item in page if isinstance(item, dict)]
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     async def get_health(self) -> dict[str, Any]:
         """Get Auth Service health payload."""
         return await self._request_json_object(
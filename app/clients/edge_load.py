@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+from app.clients.stream_provider import ProviderNodeStats, get_stream_provider
+from app.config import get_settings, split_list
+from app.exceptions import StreamProviderError
+from app.models import StreamSource
+from app.utils.hash_ring import HashRing
+
+logger = logging.getLogger(__name__)
+
+STALE_AFTER_REFRESHES = 3
+
+
+@dataclass(frozen=True)
+class EdgeLoad:
+    health: str
+    outgoing_kbit: int | None
+    total_clients: int | None
+    updated_at: float
+
+
+class EdgeLoadTable:
+    """
+    Process-wide view of edge load used to steer playlists away from hot edges.
+
+    An edge is taken out of rotation when it is down, draining, or reaches
+    ``EDGE_MAX_OUTGOING_KBIT`` / ``EDGE_MAX_CLIENTS``. A saturated edge comes
+    back only once both figures fall below ``EDGE_RESUME_RATIO`` of the limits,
+    so it does not flap around the threshold. Edges without recent stats are
+    treated as available.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._loads: dict[str, EdgeLoad] = {}
+        self._saturated: set[str] = set()
+
+    def update(self, nodes: Iterable[ProviderNodeStats]) -> None:
+        settings = get_settings()
+        now = self._clock()
+        for node in nodes:
+            if node.url is None:
+                continue
+            url = node.url.rstrip("/")
+            self._loads[url] = EdgeLoad(
+                health=node.health,
+                outgoing_kbit=node.outgoing_kbit,
+                total_clients=node.total_clients,
+                updated_at=now,
+            )
+            ratio = settings.edge_resume_ratio if url in self._saturated else 1.0
+            if node.health == "down" or self._over_limit(node, ratio):
+                if url not in self._saturated:
+                    logger.warning("Edge %s saturated, routing new playlists elsewhere", url)
+                self._saturated.add(url)
+            elif url in self._saturated:
+                logger.info("Edge %s cooled down, back in rotation", url)
+                self._saturated.discard(url)
+
+    def is_available(self, url: str) -> bool:
+        settings = get_settings()
+        if url in {drained.rstrip("/") for drained in split_list(settings.edge_drain_urls)}:
+            return False
+        load = self._loads.get(url)
+        max_age = settings.edge_load_refresh_seconds * STALE_AFTER_REFRESHES
+        if load is None or self._clock() - load.updated_at > max_age:
+            return True
+        return url not in self._saturated
+
+    def pick(self, ring: HashRing, token: str) -> str:
+        """
+        Return the token's edge, or the next available edge along the ring.
+
+        Falls back to the token's own edge when no edge is available, so a
+        playlist is always built.
+        """
+        for url in ring.iter_nodes(token):
+            if self.is_available(url):
+                return url
+        return ring.node_for(token)
+
+    def get(self, url: str) -> EdgeLoad | None:
+        return self._loads.get(url)
+
+    def clear(self) -> None:
+        self._loads.clear()
+        self._saturated.clear()
+
+    @staticmethod
+    def _over_limit(node: ProviderNodeStats, ratio: float) -> bool:
+        settings = get_settings()
+        limits = (
+            (node.outgoing_kbit, settings.edge_max_outgoing_kbit),
+            (node.total_clients, settings.edge_max_clients),
+        )
+        return any(
+            value is not None and limit is not None and value >= limit * ratio
+            for value, limit in limits
+        )
+
+
+class EdgeLoadRefresher:
+    """Background task that keeps ``edge_loads`` current from provider stats."""
+
+    def __init__(self, table: EdgeLoadTable) -> None:
+        self.table = table
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        settings = get_settings()
+        multi_edge = (
+            len(split_list(settings.flussonic_edge_urls)) > 1
+            or len(split_list(settings.wmspanel_edge_server_ids)) > 1
+        )
+        if settings.edge_load_refresh_seconds <= 0 or not multi_edge or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._run(settings.edge_load_refresh_seconds))
+        logger.info("Edge load refresh started (every %gs)", settings.edge_load_refresh_seconds)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def refresh_once(self) -> None:
+        """Probe the edge nodes only; stream listings are left to the dashboard."""
+        for source in StreamSource:
+            try:
+                nodes = await get_stream_provider(source).get_node_stats()
+            except StreamProviderError as e:
+                logger.debug("Skipping edge load refresh for %s: %s", source.value, e)
+                continue
+            self.table.update(nodes)
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                await self.refresh_once()
+            except Exception:
+                logger.exception("Edge load refresh failed")
+            await asyncio.sleep(interval)
+
+
+edge_loads = EdgeLoadTable()
+edge_load_refresher = EdgeLoadRefresher(edge_loads)
@@ -3,6 +3,7 @@ from typing import Any
 
 import httpx
 
+from app.clients import http
 from app.config import get_settings
 from app.exceptions import EpgServiceError
 
@@ -12,11 +13,15 @@ logger = logging.getLogger(__name__)
 class EpgServiceClient:
     """Client for EPG Service API."""
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         settings = get_settings()
         self.base_url = settings.epg_service_url.rstrip("/")
         self.timeout = settings.epg_service_timeout
         self.fetch_timeout = settings.epg_service_fetch_timeout
+        self._http_client = http_client
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._http_client or http.http_clients.get(http.EPG)
 
     async def get_dashboard_stats(self) -> dict[str, Any]:
         """Fetch normalized dashboard stats from EPG Service."""
@@ -105,8 +110,7 @@ class EpgServiceClient:
         request_timeout = timeout if timeout is not None else self.timeout
 
         try:
-            async with httpx.AsyncClient(timeout=request_timeout) as client:
-                response = await client.request(method, url)
+            response = await self._client().request(method, url, timeout=request_timeout)
 
             if response.status_code in accept_statuses:
                 return response
@@ -1,20 +1,27 @@
 import asyncio
 import logging
-import time
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
 
-from app.config import SECONDS_PER_DAY, get_settings
+from app.config import SECONDS_PER_DAY, get_settings, split_list
+from app.clients import http
+from app.clients.edge_load import edge_loads
 from app.clients.stream_provider import (
     ProviderActiveSourceCounters,
     ProviderDashboardStats,
+    ProviderNodeStats,
     ProviderStream,
+    combine_node_health,
+    sum_node_values,
 )
 from app.exceptions import FlussonicError
 from app.models import StreamSource
+from app.utils.concurrency import within_budget
+from app.utils.hash_ring import get_hash_ring
+from app.utils.probe_cache import ProbeCache
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +31,7 @@ ONLINE24_HOST_MARKER = "online24"
 RESTREAM_HOST = "restream.pw"
 RESTREAM_IP = "185.96.80.44"
 ACTIVE_SOURCE_COUNTERS_CACHE_TTL_SECONDS = 30.0
+STREAM_STATS_MAX_STALE_SECONDS = 600.0
 
 
 @dataclass(frozen=True)
@@ -33,14 +41,10 @@ class _StreamDerivedStats:
     active_source_counters: ProviderActiveSourceCounters
 
 
-@dataclass(frozen=True)
-class _StreamStatsCacheEntry:
-    expires_at: float
-    stats: _StreamDerivedStats
-
-
-_stream_stats_cache: dict[str, _StreamStatsCacheEntry] = {}
-_stream_stats_cache_lock = asyncio.Lock()
+_stream_stats_cache: ProbeCache[_StreamDerivedStats] = ProbeCache(
+    ttl=ACTIVE_SOURCE_COUNTERS_CACHE_TTL_SECONDS,
+    max_stale=STREAM_STATS_MAX_STALE_SECONDS,
+)
 
 
 class FlussonicClient:
@@ -49,61 +53,163 @@ class FlussonicClient:
     source = StreamSource.FLUSSONIC
     STREAMS_ENDPOINT = "/streamer/api/v3/streams"
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         settings = get_settings()
         if not settings.flussonic_url or not settings.flussonic_username or not settings.flussonic_password:
             raise FlussonicError("Not configured")
 
         self.base_url = settings.flussonic_url.rstrip("/")
+        self.edge_urls = tuple(
+            url.rstrip("/") for url in split_list(settings.flussonic_edge_urls)
+        ) or (self.base_url,)
         self.username = settings.flussonic_username
         self.password = settings.flussonic_password
-        self.timeout = settings.flussonic_timeout
         self.page_limit = settings.flussonic_page_limit
+        self._http_client = http_client
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._http_client or http.http_clients.get(http.FLUSSONIC)
 
     def build_stream_url(self, stream_name: str, token: str) -> str:
-        return f"{self.base_url}/{stream_name}/video.m3u8?token={token}"
+        return f"{self.edge_for(token)}/{stream_name}/video.m3u8?token={token}"
+
+    def edge_for(self, token: str) -> str:
+        """
+        Pick the edge serving a subscriber.
+
+        A token maps to the same edge while that edge is in rotation; a
+        saturated or draining edge hands its tokens to the next edge on the ring.
+        """
+        if len(self.edge_urls) == 1:
+            return self.edge_urls[0]
+        return edge_loads.pick(get_hash_ring(self.edge_urls), token)
 
     async def get_dashboard_stats(self) -> ProviderDashboardStats:
         """
         Fetch Flussonic dashboard stats.
 
         Includes health status, incoming/outgoing traffic and source counters.
+        Every edge node is probed for readiness and traffic, and the stream
+        listing is read from the origin; all parts are fetched concurrently,
+        each within its own timeout budget. A part that fails or times out is
+        left empty and reported in ``error`` instead of failing the whole card.
+        Traffic and client counts are summed across nodes.
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            auth = httpx.BasicAuth(self.username, self.password)
-            health_probe_ok = await self._check_v3_health(client, auth)
-            stats = await self._get_v3_server_stats(client, auth)
-            stream_stats = await self._get_cached_stream_stats(client, auth)
+        settings = get_settings()
+        client = self._client()
+        auth = httpx.BasicAuth(self.username, self.password)
+        nodes, stream_stats = await asyncio.gather(
+            self.get_node_stats(),
+            within_budget(
+                self._get_cached_stream_stats(client, auth),
+                settings.flussonic_dashboard_streams_timeout,
+                "fetch Flussonic streams",
+                FlussonicError,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(nodes, BaseException):
+            raise nodes
+        if isinstance(stream_stats, BaseException) and not isinstance(stream_stats, FlussonicError):
+            raise stream_stats
+
+        errors = [
+            node.error if len(nodes) == 1 else f"{node.name}: {node.error}"
+            for node in nodes
+            if node.error
+        ]
+        if isinstance(stream_stats, FlussonicError):
+            errors.append(str(stream_stats))
+            if all(node.health == "down" and node.outgoing_kbit is None for node in nodes):
+                raise FlussonicError("; ".join(errors))
+            stream_stats = None
+
+        total_sources = None
+        broken_sources = None
+        good_sources = None
+        active_source_counters = None
+        if stream_stats is not None:
+            total_sources = stream_stats.total_sources
+            broken_sources = stream_stats.broken_sources
+            good_sources = max(total_sources - broken_sources, 0)
+            active_source_counters = stream_stats.active_source_counters
+
+        health = combine_node_health(nodes)
+        if health == "up" and errors:
+            health = "degraded"
 
-        total_sources = stream_stats.total_sources
-        broken_sources = stream_stats.broken_sources
-        good_sources = max(total_sources - broken_sources, 0)
+        return ProviderDashboardStats(
+            health=health,
+            incoming_kbit=sum_node_values([node.incoming_kbit for node in nodes]),
+            outgoing_kbit=sum_node_values([node.outgoing_kbit for node in nodes]),
+            total_clients=sum_node_values([node.total_clients for node in nodes]),
+            total_sources=total_sources,
+            good_sources=good_sources,
+            broken_sources=broken_sources,
+            active_source_counters=active_source_counters,
+            error="; ".join(errors) or None,
+            nodes=tuple(nodes),
+        )
+
+    async def get_node_stats(self) -> list[ProviderNodeStats]:
+        """Probe every edge node for readiness and traffic, without the stream listing."""
+        client = self._client()
+        auth = httpx.BasicAuth(self.username, self.password)
+        return list(
+            await asyncio.gather(*(self._get_node_stats(client, auth, edge_url) for edge_url in self.edge_urls))
+        )
+
+    async def _get_node_stats(
+        self, client: httpx.AsyncClient, auth: httpx.BasicAuth, node_url: str
+    ) -> ProviderNodeStats:
+        """Probe one Flussonic node for readiness and traffic stats."""
+        settings = get_settings()
+        health_probe_ok, stats = await asyncio.gather(
+            within_budget(
+                self._check_v3_health(client, auth, node_url),
+                settings.flussonic_dashboard_readiness_timeout,
+                "Flussonic health probe",
+                FlussonicError,
+            ),
+            within_budget(
+                self._get_v3_server_stats(client, auth, node_url),
+                settings.flussonic_dashboard_stats_timeout,
+                "fetch Flussonic stats",
+                FlussonicError,
+            ),
+            return_exceptions=True,
+        )
+
+        parts = (health_probe_ok, stats)
+        for part in parts:
+            if isinstance(part, BaseException) and not isinstance(part, FlussonicError):
+                raise part
+        errors = [str(part) for part in parts if isinstance(part, FlussonicError)]
+        stats = stats if isinstance(stats, dict) else {}
 
         streamer_status = stats.get("streamer_status")
         health = "up"
-        if not health_probe_ok:
+        if health_probe_ok is not True:
             health = "down"
-        elif isinstance(streamer_status, str) and streamer_status != "running":
+        elif errors or (isinstance(streamer_status, str) and streamer_status != "running"):
             health = "degraded"
 
-        return ProviderDashboardStats(
+        return ProviderNodeStats(
+            name=urlparse(node_url).netloc or node_url,
+            url=node_url,
             health=health,
             incoming_kbit=self._as_int(stats.get("input_kbit")),
             outgoing_kbit=self._as_int(stats.get("output_kbit")),
             total_clients=self._as_int(stats.get("total_clients")),
-            total_sources=total_sources,
-            good_sources=good_sources,
-            broken_sources=broken_sources,
-            active_source_counters=stream_stats.active_source_counters,
+            error="; ".join(errors) or None,
         )
 
     async def get_streams(self) -> list[ProviderStream]:
         """
         Fetch all streams from Flussonic V3.
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            auth = httpx.BasicAuth(self.username, self.password)
-            items = await self._get_v3_stream_items(client, auth)
+        auth = httpx.BasicAuth(self.username, self.password)
+        items = await self._get_v3_stream_items(self._client(), auth)
 
         return [
             stream
@@ -112,10 +218,10 @@ class FlussonicClient:
         ]
 
     async def _check_v3_health(
-        self, client: httpx.AsyncClient, auth: httpx.BasicAuth
+        self, client: httpx.AsyncClient, auth: httpx.BasicAuth, node_url: str
     ) -> bool:
         """Check the Flussonic V3 readiness endpoint."""
-        url = f"{self.base_url}{V3_READINESS_ENDPOINT}"
+        url = f"{node_url}{V3_READINESS_ENDPOINT}"
         try:
             response = await client.get(url, auth=auth)
             return response.status_code == 200
@@ -127,13 +233,14 @@ class FlussonicClient:
             return False
 
     async def _get_v3_server_stats(
-        self, client: httpx.AsyncClient, auth: httpx.BasicAuth
+        self, client: httpx.AsyncClient, auth: httpx.BasicAuth, node_url: str
     ) -> dict[str, Any]:
         """Fetch server stats from Flussonic v3 API."""
         return await self._get_v3_json(
             client,
             auth,
             V3_STATS_ENDPOINT,
+            base_url=node_url,
             operation="fetch Flussonic stats",
             response_description="Flussonic stats",
         )
@@ -191,8 +298,9 @@ class FlussonicClient:
         operation: str,
         response_description: str,
         params: dict[str, int | str] | None = None,
+        base_url: str | None = None,
     ) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
+        url = f"{base_url or self.base_url}{path}"
         try:
             response = await client.get(url, auth=auth, params=params)
             if response.status_code != 200:
@@ -218,29 +326,15 @@ class FlussonicClient:
     async def _get_cached_stream_stats(
         self, client: httpx.AsyncClient, auth: httpx.BasicAuth
     ) -> _StreamDerivedStats:
-        cache_key = self.base_url
-        now = time.monotonic()
-        cached = _stream_stats_cache.get(cache_key)
-        if cached is not None and cached.expires_at > now:
-            return cached.stats
-
-        async with _stream_stats_cache_lock:
-            now = time.monotonic()
-            cached = _stream_stats_cache.get(cache_key)
-            if cached is not None and cached.expires_at > now:
-                return cached.stats
-
+        async def fetch() -> _StreamDerivedStats:
             items = await self._get_v3_stream_items(client, auth)
-            stream_stats = _StreamDerivedStats(
+            return _StreamDerivedStats(
                 total_sources=len(items),
                 broken_sources=self._count_broken_sources(items),
                 active_source_counters=self._count_active_source_counters(items),
             )
-            _stream_stats_cache[cache_key] = _StreamStatsCacheEntry(
-                expires_at=now + ACTIVE_SOURCE_COUNTERS_CACHE_TTL_SECONDS,
-                stats=stream_stats,
-            )
-            return stream_stats
+
+        return await _stream_stats_cache.get(self.base_url, fetch)
 
     def _extract_v3_items(self, data: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract stream items from a Flussonic V3 response page."""
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+import httpx
+
+from app.clients.resilience import CircuitBreaker, CircuitStatus, ResilientTransport, RetryBudget
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+FLUSSONIC = "flussonic"
+NIMBLE = "nimble"
+AUTH = "auth"
+EPG = "epg"
+RUTV = "rutv"
+LOGOS = "logos"
+
+LOGO_DOWNLOAD_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+
+
+class HttpClientRegistry:
+    """Process-wide pooled HTTP clients, one connection pool per outbound service.
+
+    Clients are opened in the application lifespan and closed on shutdown. Outside
+    the lifespan (scripts, tests) they are created lazily on first use. A client is
+    bound to the event loop that created it and is rebuilt if used from another loop.
+
+    Every pooled client goes through a per-service circuit breaker and retry
+    budget, which outlive client rebuilds.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, _PooledClient] = {}
+        self._overrides: dict[str, httpx.AsyncClient] = {}
+        # Clients replaced because they belong to another loop; closed in aclose().
+        self._retired: list[httpx.AsyncClient] = []
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._budgets: dict[str, RetryBudget] = {}
+
+    def get(self, service: str) -> httpx.AsyncClient:
+        """Return the pooled client for a service."""
+        override = self._overrides.get(service)
+        if override is not None:
+            return override
+
+        loop = asyncio.get_running_loop()
+        pooled = self._clients.get(service)
+        if pooled is None or pooled.loop is not loop or pooled.client.is_closed:
+            if pooled is not None and not pooled.client.is_closed:
+                self._retired.append(pooled.client)
+            pooled = _PooledClient(client=self._build(service, get_settings()), loop=loop)
+            self._clients[service] = pooled
+        return pooled.client
+
+    def circuits(self) -> list[CircuitStatus]:
+        """Breaker state of every service that has made a request."""
+        return [breaker.status() for breaker in self._breakers.values()]
+
+    def override(self, service: str, client: httpx.AsyncClient | None) -> None:
+        """Route a service through a caller-owned client (tests, benchmarks)."""
+        if client is None:
+            self._overrides.pop(service, None)
+        else:
+            self._overrides[service] = client
+
+    async def open(
+        self,
+        services: tuple[str, ...] = (FLUSSONIC, NIMBLE, AUTH, EPG, RUTV, LOGOS),
+    ) -> None:
+        """Create the pools up front so the first request does not pay for it."""
+        for service in services:
+            self.get(service)
+        logger.info("Opened pooled HTTP clients: %s", ", ".join(services))
+
+    async def aclose(self) -> None:
+        """Close every pooled client owned by the registry."""
+        clients, self._clients = self._clients, {}
+        retired, self._retired = self._retired, []
+        for client in [pooled.client for pooled in clients.values()] + retired:
+            try:
+                await client.aclose()
+            except RuntimeError as e:
+                logger.debug("Skipping close of HTTP client bound to a finished loop: %s", e)
+
+    def _build(self, service: str, settings: Settings) -> httpx.AsyncClient:
+        timeouts: dict[str, float | httpx.Timeout] = {
+            FLUSSONIC: settings.flussonic_timeout,
+            NIMBLE: settings.nimble_timeout,
+            AUTH: settings.auth_service_timeout,
+            EPG: settings.epg_service_timeout,
+            RUTV: settings.rutv_site_timeout,
+            LOGOS: LOGO_DOWNLOAD_TIMEOUT,
+        }
+        if service not in timeouts:
+            raise ValueError(f"Unknown HTTP client service: {service}")
+
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                keepalive_expiry=settings.http_keepalive_expiry,
+            ),
+            http2=settings.http2 and _http2_available(),
+        )
+        breaker = self._breakers.get(service)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                service,
+                failure_threshold=settings.http_breaker_failure_threshold,
+                reset_timeout=settings.http_breaker_reset_seconds,
+            )
+            self._breakers[service] = breaker
+        budget = self._budgets.setdefault(service, RetryBudget(settings.http_retry_budget_ratio))
+
+        options: dict[str, Any] = {
+            "transport": ResilientTransport(
+                transport,
+                breaker,
+                budget,
+                max_retries=settings.http_retry_attempts,
+                backoff=settings.http_retry_backoff,
+            ),
+            "timeout": timeouts[service],
+        }
+        if service == LOGOS:
+            options["follow_redirects"] = True
+
+        return httpx.AsyncClient(**options)
+
+
+@cache
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP2 is enabled but the 'h2' package is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+http_clients = HttpClientRegistry()
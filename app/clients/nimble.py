@@ -1,13 +1,24 @@
+import asyncio
 import logging
 from typing import Any
 from urllib.parse import urlencode
 
 import httpx
 
-from app.clients.stream_provider import ProviderDashboardStats, ProviderStream
-from app.config import get_settings
+from app.clients import http
+from app.clients.edge_load import edge_loads
+from app.clients.stream_provider import (
+    ProviderDashboardStats,
+    ProviderNodeStats,
+    ProviderStream,
+    combine_node_health,
+    sum_node_values,
+)
+from app.config import get_settings, split_list
 from app.exceptions import NimbleError
 from app.models import StreamSource
+from app.utils.concurrency import within_budget
+from app.utils.hash_ring import get_hash_ring
 
 logger = logging.getLogger(__name__)
 
@@ -33,38 +44,65 @@ class NimbleClient:
 
     source = StreamSource.NIMBLE
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         settings = get_settings()
+        playback_urls = split_list(settings.nimble_playback_urls)
+        if settings.nimble_playback_url and not playback_urls:
+            playback_urls = [settings.nimble_playback_url]
         if (
             not settings.wmspanel_api_url
             or not settings.wmspanel_client_id
             or not settings.wmspanel_api_key
             or not settings.wmspanel_server_id
-            or not settings.nimble_playback_url
+            or not playback_urls
         ):
             raise NimbleError("Not configured")
 
+        edge_server_ids = split_list(settings.wmspanel_edge_server_ids)
+        if edge_server_ids and len(edge_server_ids) != len(playback_urls):
+            raise NimbleError("WMSPANEL_EDGE_SERVER_IDS must list one server per Nimble playback URL")
+
         self.base_url = settings.wmspanel_api_url.rstrip("/")
         self.client_id = settings.wmspanel_client_id
         self.api_key = settings.wmspanel_api_key
         self.server_id = settings.wmspanel_server_id
-        self.timeout = settings.nimble_timeout
-        self.playback_url = settings.nimble_playback_url.rstrip("/")
+        self.playback_urls = tuple(url.rstrip("/") for url in playback_urls)
+        self.playback_url = self.playback_urls[0]
+        # Servers whose traffic is shown on the dashboard, with the edge each one serves.
+        self.stats_servers: tuple[tuple[str, str | None], ...] = (
+            tuple(zip(edge_server_ids, self.playback_urls))
+            if edge_server_ids
+            else ((self.server_id, self.playback_url if len(self.playback_urls) == 1 else None),)
+        )
         self.application = settings.nimble_application.strip("/")
         self.playlist_path = settings.nimble_playlist_path.lstrip("/")
         self.token_query_param = settings.nimble_token_query_param
+        self._http_client = http_client
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._http_client or http.http_clients.get(http.NIMBLE)
 
     def build_stream_url(self, stream_name: str, token: str) -> str:
         query = urlencode({self.token_query_param: token})
-        return f"{self.playback_url}/{self.application}/{stream_name}/{self.playlist_path}?{query}"
+        return f"{self.edge_for(token)}/{self.application}/{stream_name}/{self.playlist_path}?{query}"
+
+    def edge_for(self, token: str) -> str:
+        """
+        Pick the edge serving a subscriber.
+
+        A token maps to the same edge while that edge is in rotation; a
+        saturated or draining edge hands its tokens to the next edge on the ring.
+        """
+        if len(self.playback_urls) == 1:
+            return self.playback_url
+        return edge_loads.pick(get_hash_ring(self.playback_urls), token)
 
     async def get_streams(self) -> list[ProviderStream]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = await self._get_json(
-                client,
-                LIVE_STREAMS_ENDPOINT_TEMPLATE.format(server_id=self.server_id),
-                "get Nimble streams from WMSPanel",
-            )
+        payload = await self._get_json(
+            self._client(),
+            LIVE_STREAMS_ENDPOINT_TEMPLATE.format(server_id=self.server_id),
+            "get Nimble streams from WMSPanel",
+        )
 
         streams = [
             stream
@@ -81,25 +119,111 @@ class NimbleClient:
         return streams
 
     async def get_dashboard_stats(self) -> ProviderDashboardStats:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            server_payload = await self._get_json(
-                client,
-                SERVER_ENDPOINT_TEMPLATE.format(server_id=self.server_id),
-                "get Nimble server details from WMSPanel",
-            )
-            streams_payload = await self._get_json(
-                client,
-                LIVE_STREAMS_ENDPOINT_TEMPLATE.format(server_id=self.server_id),
+        """
+        Fetch Nimble dashboard stats from WMSPanel.
+
+        Server details for every edge server and the live streams of the
+        primary server are fetched concurrently, each within its own timeout
+        budget; if one of them fails the others are still shown and the
+        failure is reported in ``error``. Traffic and client counts are summed
+        across servers.
+        """
+        settings = get_settings()
+        client = self._client()
+        server_parts, streams_part = await asyncio.gather(
+            self._get_servers(client),
+            within_budget(
+                self._get_application_streams(client),
+                settings.nimble_dashboard_streams_timeout,
                 "get Nimble live streams from WMSPanel",
-            )
-
-        server = self._extract_server_payload(server_payload)
-        application_streams = list(self._iter_application_streams(streams_payload))
-        total_sources = len(application_streams)
-        broken_sources = sum(1 for item in application_streams if self._is_broken_stream(item))
-        good_sources = max(total_sources - broken_sources, 0)
+                NimbleError,
+            ),
+            return_exceptions=True,
+        )
+        if isinstance(server_parts, BaseException):
+            raise server_parts
+
+        parts = (*server_parts, streams_part)
+        for part in parts:
+            if isinstance(part, BaseException) and not isinstance(part, NimbleError):
+                raise part
+        errors = [
+            str(part) if len(server_parts) == 1 else f"{server_id}: {part}"
+            for (server_id, _url), part in zip(self.stats_servers, server_parts)
+            if isinstance(part, NimbleError)
+        ]
+        if isinstance(streams_part, NimbleError):
+            errors.append(str(streams_part))
+        if all(isinstance(part, NimbleError) for part in parts):
+            raise NimbleError("; ".join(errors))
+
+        nodes = [
+            self._node_stats(server_id, url, part)
+            for (server_id, url), part in zip(self.stats_servers, server_parts)
+        ]
+        health = combine_node_health(nodes)
+        if errors and health == "up":
+            health = "degraded"
+
+        total_sources = None
+        broken_sources = None
+        good_sources = None
+        if isinstance(streams_part, list):
+            total_sources = len(streams_part)
+            broken_sources = sum(1 for item in streams_part if self._is_broken_stream(item))
+            good_sources = max(total_sources - broken_sources, 0)
 
         return ProviderDashboardStats(
+            health=health,
+            incoming_kbit=sum_node_values([node.incoming_kbit for node in nodes]),
+            outgoing_kbit=sum_node_values([node.outgoing_kbit for node in nodes]),
+            total_clients=sum_node_values([node.total_clients for node in nodes]),
+            total_sources=total_sources,
+            good_sources=good_sources,
+            broken_sources=broken_sources,
+            error="; ".join(errors) or None,
+            nodes=tuple(nodes),
+        )
+
+    async def get_node_stats(self) -> list[ProviderNodeStats]:
+        """Fetch server details of every edge server, without the live stream listing."""
+        servers = await self._get_servers(self._client())
+        return [
+            self._node_stats(server_id, url, server)
+            for (server_id, url), server in zip(self.stats_servers, servers)
+        ]
+
+    async def _get_servers(self, client: httpx.AsyncClient) -> list[dict[str, Any] | NimbleError]:
+        """Server details per ``stats_servers`` entry, or the ``NimbleError`` it failed with."""
+        settings = get_settings()
+        servers = await asyncio.gather(
+            *(
+                within_budget(
+                    self._get_server(client, server_id),
+                    settings.nimble_dashboard_server_timeout,
+                    "get Nimble server details from WMSPanel",
+                    NimbleError,
+                )
+                for server_id, _url in self.stats_servers
+            ),
+            return_exceptions=True,
+        )
+        for server in servers:
+            if isinstance(server, BaseException) and not isinstance(server, NimbleError):
+                raise server
+        return list(servers)
+
+    def _node_stats(
+        self,
+        server_id: str,
+        url: str | None,
+        server: dict[str, Any] | NimbleError,
+    ) -> ProviderNodeStats:
+        if isinstance(server, NimbleError):
+            return ProviderNodeStats(name=server_id, url=url, health="degraded", error=str(server))
+        return ProviderNodeStats(
+            name=server_id,
+            url=url,
             health=self._derive_health(server),
             incoming_kbit=self._find_first_int(
                 server,
@@ -122,11 +246,24 @@ class NimbleClient:
                 "viewers",
                 "active_clients",
             ),
-            total_sources=total_sources,
-            good_sources=good_sources,
-            broken_sources=broken_sources,
         )
 
+    async def _get_server(self, client: httpx.AsyncClient, server_id: str) -> dict[str, Any]:
+        payload = await self._get_json(
+            client,
+            SERVER_ENDPOINT_TEMPLATE.format(server_id=server_id),
+            "get Nimble server details from WMSPanel",
+        )
+        return self._extract_server_payload(payload)
+
+    async def _get_application_streams(self, client: httpx.AsyncClient) -> list[dict[str, Any]]:
+        payload = await self._get_json(
+            client,
+            LIVE_STREAMS_ENDPOINT_TEMPLATE.format(server_id=self.server_id),
+            "get Nimble live streams from WMSPanel",
+        )
+        return self._iter_application_streams(payload)
+
     async def _get_json(
         self,
         client: httpx.AsyncClient,
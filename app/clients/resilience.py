@@ -0,0 +1,199 @@
+import asyncio
+import enum
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Gateway-level failures: the upstream is unhealthy rather than rejecting the request.
+FAILURE_STATUSES = frozenset({502, 503, 504})
+# Errors raised before the upstream could act on the request. Read timeouts are
+# not retried: a hung upstream would otherwise hold the caller for several timeouts.
+RETRYABLE_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+MAX_BACKOFF_SECONDS = 5.0
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Raised instead of calling a service whose circuit is open."""
+
+
+@dataclass(frozen=True)
+class CircuitStatus:
+    service: str
+    state: CircuitState
+    consecutive_failures: int
+    retry_in: float | None
+
+
+class CircuitBreaker:
+    """
+    Per-service circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail immediately. Once ``reset_timeout`` has passed a single probe
+    request is let through (half-open); its success closes the circuit and its
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        service: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.service = service
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+
+    def before_request(self, request: httpx.Request) -> None:
+        if self._state is CircuitState.CLOSED:
+            return
+
+        now = self._clock()
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probe_started_at = None
+
+        # A probe that never reported back (e.g. cancelled) must not block the circuit forever.
+        probe_running = (
+            self._probe_started_at is not None and now - self._probe_started_at < self.reset_timeout
+        )
+        if self._state is CircuitState.HALF_OPEN and not probe_running:
+            self._probe_started_at = now
+            return
+
+        raise CircuitOpenError(f"Circuit open for {self.service}", request=request)
+
+    def record_success(self) -> None:
+        if self._state is not CircuitState.CLOSED:
+            logger.info("Circuit for %s closed", self.service)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state is not CircuitState.OPEN:
+                logger.warning(
+                    "Circuit for %s opened after %d consecutive failures", self.service, self._failures
+                )
+            self._state = CircuitState.OPEN
+            self._opened_at = self._clock()
+            self._probe_started_at = None
+
+    def status(self) -> CircuitStatus:
+        retry_in = None
+        if self._state is CircuitState.OPEN:
+            retry_in = max(self.reset_timeout - (self._clock() - self._opened_at), 0.0)
+        return CircuitStatus(
+            service=self.service,
+            state=self._state,
+            consecutive_failures=self._failures,
+            retry_in=retry_in,
+        )
+
+
+class RetryBudget:
+    """
+    Token bucket capping retries to a share of recent requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one, so
+    during an outage retries add at most ``ratio`` extra load on top of a
+    small ``reserve`` that lets occasional failures retry while traffic is low.
+    """
+
+    def __init__(self, ratio: float, reserve: float = 10) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = reserve
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, self.reserve)
+
+    def try_spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class ResilientTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper adding a circuit breaker and budgeted, jittered retries.
+
+    Only idempotent methods are retried, and only on connection failures and
+    gateway errors. Every transport error and gateway error counts against the
+    breaker.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        breaker: CircuitBreaker,
+        budget: RetryBudget,
+        max_retries: int,
+        backoff: float,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._transport = transport
+        self.breaker = breaker
+        self.budget = budget
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._sleep = sleep
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.budget.deposit()
+        attempt = 0
+        while True:
+            self.breaker.before_request(request)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                self.breaker.record_failure()
+                if not isinstance(e, RETRYABLE_ERRORS) or not self._should_retry(request, attempt):
+                    raise
+            else:
+                if response.status_code not in FAILURE_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                if not self._should_retry(request, attempt):
+                    return response
+                await response.aclose()
+
+            attempt += 1
+            delay = random.uniform(0, min(self.backoff * 2**attempt, MAX_BACKOFF_SECONDS))
+            logger.debug(
+                "Retrying %s %s in %.2fs (attempt %d)", request.method, request.url, delay, attempt
+            )
+            await self._sleep(delay)
+
+    def _should_retry(self, request: httpx.Request, attempt: int) -> bool:
+        return (
+            request.method in RETRYABLE_METHODS
+            and attempt < self.max_retries
+            and self.budget.try_spend()
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
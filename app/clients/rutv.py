@@ -3,6 +3,7 @@ from typing import Any
 
 import httpx
 
+from app.clients import http
 from app.config import get_settings
 from app.exceptions import RutvServiceError
 
@@ -12,11 +13,14 @@ logger = logging.getLogger(__name__)
 class RutvClient:
     """Client for RUTV site health and stats endpoints."""
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         settings = get_settings()
         self.base_url = settings.rutv_site_url.rstrip("/")
         self.stats_token = settings.rutv_stats_token
-        self.timeout = settings.rutv_site_timeout
+        self._http_client = http_client
+
+    def _client(self) -> httpx.AsyncClient:
+        return self._http_client or http.http_clients.get(http.RUTV)
 
     async def get_dashboard_stats(self) -> dict[str, Any]:
         """Fetch normalized dashboard stats from RUTV."""
@@ -76,8 +80,7 @@ class RutvClient:
         url = f"{self.base_url}{path}"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers)
+            response = await self._client().get(url, headers=headers)
 
             if response.status_code == 200:
                 payload = response.json()
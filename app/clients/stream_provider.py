@@ -18,6 +18,17 @@ class ProviderActiveSourceCounters:
     other: int
 
 
+@dataclass(frozen=True)
+class ProviderNodeStats:
+    name: str
+    health: str
+    url: str | None = None
+    incoming_kbit: int | None = None
+    outgoing_kbit: int | None = None
+    total_clients: int | None = None
+    error: str | None = None
+
+
 @dataclass(frozen=True)
 class ProviderDashboardStats:
     health: str
@@ -29,6 +40,7 @@ class ProviderDashboardStats:
     broken_sources: int | None = None
     active_source_counters: ProviderActiveSourceCounters | None = None
     error: str | None = None
+    nodes: tuple[ProviderNodeStats, ...] = ()
 
 
 class StreamProvider(Protocol):
@@ -38,10 +50,29 @@ class StreamProvider(Protocol):
     async def get_dashboard_stats(self) -> ProviderDashboardStats:
         ...
 
+    async def get_node_stats(self) -> list[ProviderNodeStats]:
+        ...
+
     def build_stream_url(self, stream_name: str, token: str) -> str:
         ...
 
 
+def combine_node_health(nodes: list[ProviderNodeStats]) -> str:
+    """A cluster is up when every node is up and down only when every node is down."""
+    healths = {node.health for node in nodes}
+    if healths == {"up"}:
+        return "up"
+    if healths == {"down"}:
+        return "down"
+    return "degraded"
+
+
+def sum_node_values(values: list[int | None]) -> int | None:
+    """Sum what the nodes reported, or ``None`` when no node reported anything."""
+    reported = [value for value in values if value is not None]
+    return sum(reported) if reported else None
+
+
 def get_stream_provider(source: StreamSource) -> StreamProvider:
     match source:
         case StreamSource.FLUSSONIC:
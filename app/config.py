@@ -10,6 +10,19 @@ SECONDS_PER_DAY = 86400
 MINUTES_PER_DAY = 1440
 
 
+def split_list(value: str | None) -> list[str]:
+    """Split a comma-separated setting into its non-empty items."""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _async_driver_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -21,29 +34,55 @@ class Settings(BaseSettings):
     # Database
     database_url: str = Field(min_length=1)
 
+    # Optional read replica for read-only requests.
+    database_read_url: str | None = None
+
     @property
     def async_database_url(self) -> str:
         """Convert standard postgresql:// URL to async driver format."""
-        url = self.database_url
-        if url.startswith("postgresql://"):
-            return url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        return url
+        return _async_driver_url(self.database_url)
+
+    @property
+    def async_database_read_url(self) -> str | None:
+        return _async_driver_url(self.database_read_url) if self.database_read_url else None
 
     db_pool_size: int
     db_max_overflow: int
     db_pool_timeout: int
     db_echo: bool
+    db_read_pool_size: int = 10
+    db_read_max_overflow: int = 20
+    db_read_max_lag_seconds: float = 5
+    db_read_check_seconds: float = 5
+    sql_instrumentation_enabled: bool = True
+    sql_slow_request_ms: float = 500
+    sql_statement_warn_count: int = 50
 
     # Security
     secret_key: str = Field(min_length=1)
     session_timeout: int
 
+    # Outbound HTTP connection pools (one pool per external service)
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30
+    http2: bool = False
+    http_breaker_failure_threshold: int = 5
+    http_breaker_reset_seconds: float = 30
+    http_retry_attempts: int = 2
+    http_retry_backoff: float = 0.2
+    http_retry_budget_ratio: float = 0.2
+
     # Flussonic
     flussonic_url: str | None = None
     flussonic_username: str | None = None
     flussonic_password: str | None = None
     flussonic_timeout: float = 60
     flussonic_page_limit: int = 500
+    flussonic_edge_urls: str | None = None
+    flussonic_dashboard_readiness_timeout: float = 5
+    flussonic_dashboard_stats_timeout: float = 10
+    flussonic_dashboard_streams_timeout: float = 30
 
     # Nimble via WMSPanel
     wmspanel_api_url: str | None = None
@@ -51,15 +90,42 @@ class Settings(BaseSettings):
     wmspanel_api_key: str | None = None
     wmspanel_server_id: str | None = None
     nimble_timeout: float = 30
+    nimble_dashboard_server_timeout: float = 10
+    nimble_dashboard_streams_timeout: float = 20
     nimble_playback_url: str | None = None
+    nimble_playback_urls: str | None = None
+    wmspanel_edge_server_ids: str | None = None
     nimble_application: str = "live"
     nimble_playlist_path: str = "playlist.m3u8"
     nimble_token_query_param: str = "token"
 
+    # Edge load routing
+    edge_load_refresh_seconds: float = 15
+    edge_max_outgoing_kbit: int | None = None
+    edge_max_clients: int | None = None
+    edge_resume_ratio: float = 0.8
+    edge_drain_urls: str | None = None
+
     # Auth Service
     auth_service_url: str = Field(min_length=1)
     auth_service_api_key: str = Field(min_length=1)
     auth_service_timeout: float
+    auth_sync_batch_size: int = 100
+    auth_sync_concurrency: int = 8
+    auth_bulk_update_size: int = 200
+    auth_token_page_size: int = 1000
+    auth_sessions_pushdown: bool = False
+    auth_access_log_page_size: int = 1000
+    auth_sessions_cache_seconds: float = 10
+    auth_sessions_cache_max_users: int = 200
+    auth_resync_debounce_seconds: float = 0
+    auth_resync_max_wait_seconds: float = 30
+    auth_outbox_enabled: bool = False
+    auth_outbox_poll_seconds: float = 2
+    auth_outbox_batch_size: int = 500
+    auth_outbox_retry_seconds: float = 5
+    auth_outbox_max_retry_seconds: float = 600
+    channel_sync_max_orphan_ratio: float = 0.5
 
     # EPG Service
     epg_service_url: str = Field(min_length=1)
@@ -71,6 +137,13 @@ class Settings(BaseSettings):
     rutv_stats_token: str = Field(min_length=1)
     rutv_site_timeout: float
 
+    # Dashboard
+    dashboard_overview_timeout: float = 35
+    dashboard_probe_cache_ttl: float = 15
+    dashboard_probe_max_stale: float = 300
+    dashboard_counters_enabled: bool = False
+    dashboard_counters_resync_seconds: float = 60
+
     # Server
     base_url: str = Field(min_length=1)
     api_host: str = Field(min_length=1)
@@ -79,6 +152,8 @@ class Settings(BaseSettings):
     # Pagination
     pagination_default_per_page: int
     pagination_max_per_page: int
+    pagination_count_cap: int = 10000
+    list_count_cache_seconds: float = 0
     lookup_default_limit: int
     lookup_max_limit: int
 
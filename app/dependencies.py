@@ -5,10 +5,12 @@ from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import Settings, get_settings
-from app.services.database import get_db
+from app.services.database import get_db, get_read_db
 
 # Type aliases for dependency injection
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+# Read-only requests: replica when configured and caught up, otherwise primary.
+ReadDBSession = Annotated[AsyncSession, Depends(get_read_db)]
 AppSettings = Annotated[Settings, Depends(get_settings)]
 
 
@@ -1,5 +1,6 @@
 import logging
 from contextlib import asynccontextmanager
+from functools import partial
 from pathlib import Path
 from typing import AsyncGenerator
 
@@ -7,10 +8,18 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from app.clients.edge_load import edge_load_refresher
+from app.clients.http import http_clients
 from app.config import get_settings, setup_logging
 from app.exceptions import PlaylistServiceError
 from app.routes import api_router, pages_router
-from app.services.database import engine
+from app.services.auth_outbox import auth_outbox_drainer
+from app.services.auth_sync import resync_users
+from app.services.dashboard_stats import install_dashboard_counter_listeners
+from app.services.database import async_session_factory, engine, read_engine
+from app.services.resync_queue import auth_resync_queue
+from app.utils.count_cache import install_count_cache_listeners
+from app.utils.sql_stats import SqlTimingMiddleware
 
 # Initialize logging
 setup_logging()
@@ -21,9 +30,23 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager."""
     logger.info("Playlist Service starting up")
+    await http_clients.open()
+    if get_settings().dashboard_counters_enabled:
+        install_dashboard_counter_listeners()
+    if get_settings().list_count_cache_seconds > 0:
+        install_count_cache_listeners()
+    edge_load_refresher.start()
+    auth_outbox_drainer.start(async_session_factory)
+    auth_resync_queue.start(partial(resync_users, async_session_factory))
     yield
     logger.info("Playlist Service shutting down")
+    await auth_resync_queue.stop()
+    await auth_outbox_drainer.stop()
+    await edge_load_refresher.stop()
+    await http_clients.aclose()
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
 
 
 app = FastAPI(
@@ -32,6 +55,7 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
 )
+app.add_middleware(SqlTimingMiddleware)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MEDIA_ROOT = BASE_DIR / "media"
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String, Table, Text, UniqueConstraint, func
+from sqlalchemy import Column, Enum, ForeignKey, Index, Integer, String, Table, Text, UniqueConstraint, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -29,6 +29,12 @@ class UserStatus(str, enum.Enum):
     DISABLED = "disabled"
 
 
+class AuthSyncAction(str, enum.Enum):
+    SYNC = "sync"
+    RECREATE = "recreate"
+    DELETE = "delete"
+
+
 def value_enum(enum_cls: type[enum.Enum]) -> Enum:
     return Enum(
         enum_cls,
@@ -38,6 +44,16 @@ def value_enum(enum_cls: type[enum.Enum]) -> Enum:
     )
 
 
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index serving ILIKE '%term%' search; PostgreSQL only (pg_trgm)."""
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
 # Association tables
 package_channels = Table(
     "package_channels",
@@ -101,7 +117,7 @@ class Group(Base, TimestampMixin):
         "Channel",
         secondary=group_channels,
         back_populates="groups",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -109,6 +125,10 @@ class Channel(Base, TimestampMixin):
     __tablename__ = "channels"
     __table_args__ = (
         UniqueConstraint("source", "stream_name", name="uq_channels_source_stream_name"),
+        trigram_index("channels", "stream_name"),
+        trigram_index("channels", "display_name"),
+        trigram_index("channels", "tvg_name"),
+        trigram_index("channels", "tvg_id"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -136,9 +156,9 @@ class Channel(Base, TimestampMixin):
         "Group",
         secondary=group_channels,
         back_populates="channels",
-        lazy="selectin",
+        lazy="raise",
     )
-    packages: Mapped[list["Package"]] = relationship("Package", secondary=package_channels, back_populates="channels", lazy="selectin")
+    packages: Mapped[list["Package"]] = relationship("Package", secondary=package_channels, back_populates="channels", lazy="raise")
 
 
 class Package(Base, TimestampMixin):
@@ -148,8 +168,8 @@ class Package(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    channels: Mapped[list["Channel"]] = relationship("Channel", secondary=package_channels, back_populates="packages", lazy="selectin")
-    tariffs: Mapped[list["Tariff"]] = relationship("Tariff", secondary=tariff_packages, back_populates="packages", lazy="selectin")
+    channels: Mapped[list["Channel"]] = relationship("Channel", secondary=package_channels, back_populates="packages", lazy="raise")
+    tariffs: Mapped[list["Tariff"]] = relationship("Tariff", secondary=tariff_packages, back_populates="packages", lazy="raise")
 
 
 class Tariff(Base, TimestampMixin):
@@ -159,11 +179,16 @@ class Tariff(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    packages: Mapped[list["Package"]] = relationship("Package", secondary=tariff_packages, back_populates="tariffs", lazy="selectin")
+    packages: Mapped[list["Package"]] = relationship("Package", secondary=tariff_packages, back_populates="tariffs", lazy="raise")
 
 
 class User(Base, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        trigram_index("users", "first_name"),
+        trigram_index("users", "last_name"),
+        trigram_index("users", "agreement_number"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -177,9 +202,27 @@ class User(Base, TimestampMixin):
     max_sessions: Mapped[int] = mapped_column(default=1, nullable=False)
     token: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     auth_token_id: Mapped[int | None] = mapped_column(nullable=True)
+    # Hash of the token state last pushed to Auth Service; see AuthSyncService._fingerprint.
+    auth_sync_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
     valid_from: Mapped[datetime | None] = mapped_column(nullable=True)
     valid_until: Mapped[datetime | None] = mapped_column(nullable=True)
 
-    tariffs: Mapped[list["Tariff"]] = relationship("Tariff", secondary=user_tariffs, lazy="selectin")
-    packages: Mapped[list["Package"]] = relationship("Package", secondary=user_packages, lazy="selectin")
-    channels: Mapped[list["Channel"]] = relationship("Channel", secondary=user_channels, lazy="selectin")
+    tariffs: Mapped[list["Tariff"]] = relationship("Tariff", secondary=user_tariffs, lazy="raise")
+    packages: Mapped[list["Package"]] = relationship("Package", secondary=user_packages, lazy="raise")
+    channels: Mapped[list["Channel"]] = relationship("Channel", secondary=user_channels, lazy="raise")
+
+
+class AuthSyncOutbox(Base):
+    """Pending Auth Service push, written in the same transaction as the change."""
+
+    __tablename__ = "auth_sync_outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    # No foreign key: delete entries outlive their user.
+    user_id: Mapped[int] = mapped_column(nullable=False, index=True)
+    action: Mapped[AuthSyncAction] = mapped_column(value_enum(AuthSyncAction), nullable=False)
+    auth_token_id: Mapped[int | None] = mapped_column(nullable=True)
+    attempts: Mapped[int] = mapped_column(default=0, nullable=False)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+    next_attempt_at: Mapped[datetime] = mapped_column(nullable=False, index=True)
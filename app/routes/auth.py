@@ -1,6 +1,12 @@
 from fastapi import APIRouter, Response
 
-from app.dependencies import AppSettings, CurrentAdminId, DBSession, create_session_token
+from app.dependencies import (
+    AppSettings,
+    CurrentAdminId,
+    DBSession,
+    ReadDBSession,
+    create_session_token,
+)
 from app.schemas import AdminResponse, ErrorResponse, LoginRequest, MessageResponse, SuccessResponse
 from app.services.admin_auth import AdminAuthService
 
@@ -49,7 +55,7 @@ async def logout(response: Response) -> MessageResponse:
 )
 async def get_current_admin(
     admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[AdminResponse]:
     """Get current authenticated admin info."""
     service = AdminAuthService(db)
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, File, Query, UploadFile
 from sqlalchemy import func, select
 
-from app.dependencies import CurrentAdminId, DBSession
+from app.dependencies import CurrentAdminId, DBSession, ReadDBSession
 from app.exceptions import ValidationError
 from app.models import Channel, StreamSource, SyncStatus
 from app.schemas import (
@@ -21,10 +21,11 @@ from app.schemas import (
     SyncResultResponse,
 )
 from app.services.channel_service import ChannelService
+from app.services.load_profiles import BARE
 from app.services.auth_sync import AuthSyncService
 from app.services.channel_sync import ChannelSyncService
 from app.services.logo_service import is_safe_logo_path, resolve_logo_path, save_logo_file, save_logo_url
-from app.utils.pagination import PaginationParams
+from app.utils.pagination import CountMode, PaginationParams
 
 router = APIRouter()
 
@@ -32,9 +33,11 @@ router = APIRouter()
 @router.get("", response_model=PaginatedResponse[ChannelResponse])
 async def list_channels(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    count: CountMode = "exact",
     search: str | None = None,
     group_id: int | None = None,
     package_id: int | None = None,
@@ -53,7 +56,7 @@ async def list_channels(
         raise ValidationError("Choose either a package or 'without package', not both")
 
     service = ChannelService(db)
-    pagination = PaginationParams(page=page, per_page=per_page)
+    pagination = PaginationParams(page=page, per_page=per_page, cursor=cursor, count=count)
 
     result = await service.get_paginated(
         pagination=pagination,
@@ -75,6 +78,9 @@ async def list_channels(
             page=result.page,
             per_page=result.per_page,
             pages=result.pages,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+            total_capped=result.total_capped,
         )
     )
 
@@ -83,7 +89,7 @@ async def list_channels(
 async def get_channel(
     channel_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[ChannelResponse]:
     """Get a single channel by ID."""
     service = ChannelService(db)
@@ -118,7 +124,7 @@ async def upload_channel_logo(
 ) -> SuccessResponse[LogoUploadResponse]:
     """Upload channel logo and return its URL."""
     service = ChannelService(db)
-    channel = await service.get_by_id(channel_id)
+    channel = await service.get_by_id(channel_id, BARE)
     logo_url = await save_logo_file(file, stream_name=channel.stream_name, channel_id=channel_id)
     channel = await service.update(channel_id, tvg_logo=logo_url)
     return SuccessResponse(data=LogoUploadResponse(url=channel.tvg_logo or logo_url))
@@ -133,7 +139,7 @@ async def upload_channel_logo_url(
 ) -> SuccessResponse[LogoUploadResponse]:
     """Download channel logo from URL and return its local URL."""
     service = ChannelService(db)
-    channel = await service.get_by_id(channel_id)
+    channel = await service.get_by_id(channel_id, BARE)
     logo_url = await save_logo_url(data.url, stream_name=channel.stream_name, channel_id=channel_id)
     channel = await service.update(channel_id, tvg_logo=logo_url)
     return SuccessResponse(data=LogoUploadResponse(url=channel.tvg_logo or logo_url))
@@ -148,7 +154,7 @@ async def delete_channel_logo(
 ) -> MessageResponse:
     """Remove a channel logo, optionally deleting the local file."""
     service = ChannelService(db)
-    channel = await service.get_by_id(channel_id)
+    channel = await service.get_by_id(channel_id, BARE)
     logo_url = channel.tvg_logo
 
     if channel.tvg_logo:
@@ -232,7 +238,7 @@ async def update_channel_packages(
 
     channel = await service.update_packages(channel_id, data.package_ids)
     affected_user_ids = await auth_sync.get_user_ids_for_packages(list(affected_package_ids))
-    await auth_sync.sync_users_by_ids(affected_user_ids)
+    await auth_sync.request_users_sync(affected_user_ids)
     return SuccessResponse(data=ChannelResponse.model_validate(channel))
 
 
@@ -264,6 +270,9 @@ async def sync_channels(
             new=result.new,
             updated=result.updated,
             orphaned=result.orphaned,
+            revived=result.revived,
+            auth_users_synced=result.auth_users_synced,
+            auth_propagation_skipped=result.auth_propagation_skipped,
         )
     )
 
@@ -272,7 +281,7 @@ async def sync_channels(
 async def get_cascade_info(
     channel_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[ChannelCascadeInfo]:
     """Get cascade delete information for a channel."""
     service = ChannelService(db)
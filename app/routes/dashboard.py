@@ -1,94 +1,140 @@
+import asyncio
+import logging
 from datetime import UTC, datetime
+from functools import cache
+from typing import Any
 
 from fastapi import APIRouter
-from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.stream_provider import get_stream_provider
 from app.clients.auth_service import AuthServiceClient
 from app.clients.epg_service import EpgServiceClient
+from app.clients.http import http_clients
 from app.clients.rutv import RutvClient
-from app.dependencies import CurrentAdminId, DBSession
+from app.config import get_settings
+from app.dependencies import CurrentAdminId, ReadDBSession
 from app.exceptions import AuthServiceError, EpgServiceError, RutvServiceError, StreamProviderError
-from app.models import Channel, Group, Package, StreamSource, SyncStatus, Tariff, User, UserStatus
+from app.models import StreamSource
 from app.schemas import (
     ActiveSourceCounters,
     AuthDashboardStats,
+    AuthOutboxStats,
+    AuthResyncQueueStats,
+    CircuitBreakerStatus,
+    DashboardOverview,
+    DashboardSection,
     DashboardStats,
     EpgDashboardStats,
     MessageResponse,
     RutvDashboardStats,
     StreamProviderDashboardStats,
+    StreamProviderNodeStats,
     SuccessResponse,
 )
+from app.services.auth_outbox import AuthOutboxService
+from app.services.dashboard_stats import DashboardService
+from app.services.resync_queue import auth_resync_queue
+from app.utils.probe_cache import ProbeCache
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+@router.get("/overview", response_model=SuccessResponse[DashboardOverview])
+async def get_overview(
+    _admin_id: CurrentAdminId,
+) -> SuccessResponse[DashboardOverview]:
+    """
+    Get every external service section in one request.
+
+    Probes are gathered concurrently under a global deadline; probes still
+    running at the deadline are cancelled and reported as ``timeout``. The DB
+    counters are not part of the overview; they are served by ``/stats``.
+    """
+    deadline = get_settings().dashboard_overview_timeout
+    probes: dict[str, asyncio.Task[Any]] = {
+        "flussonic": asyncio.create_task(_get_provider_stats(StreamSource.FLUSSONIC)),
+        "nimble": asyncio.create_task(_get_provider_stats(StreamSource.NIMBLE)),
+        "auth": asyncio.create_task(_get_auth_stats()),
+        "epg": asyncio.create_task(_get_epg_stats()),
+        "rutv": asyncio.create_task(_get_rutv_stats()),
+    }
+    _done, pending = await asyncio.wait(probes.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    sections: dict[str, DashboardSection[Any]] = {}
+    for name, task in probes.items():
+        if task in pending:
+            sections[name] = DashboardSection(
+                status="timeout",
+                error=f"Timed out after {deadline:g}s",
+            )
+        else:
+            sections[name] = _section(name, task)
+
+    circuits = [
+        CircuitBreakerStatus(
+            service=circuit.service,
+            state=circuit.state.value,
+            consecutive_failures=circuit.consecutive_failures,
+            retry_in=circuit.retry_in,
+        )
+        for circuit in http_clients.circuits()
+    ]
+    return SuccessResponse(data=DashboardOverview(**sections, circuits=circuits))
+
+
+def _section(name: str, task: asyncio.Task[Any]) -> DashboardSection[Any]:
+    error = task.exception()
+    if error is not None:
+        logger.error("Dashboard section %s failed", name, exc_info=error)
+        return DashboardSection(status="error", error="Internal error")
+    return DashboardSection(status="ok", data=task.result())
+
+
 @router.get("/stats", response_model=SuccessResponse[DashboardStats])
 async def get_stats(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[DashboardStats]:
     """Get dashboard statistics."""
-    # Channels
-    stmt = select(func.count()).select_from(Channel)
-    result = await db.execute(stmt)
-    channels_total = result.scalar() or 0
-
-    stmt = select(func.count()).select_from(Channel).where(Channel.sync_status == SyncStatus.SYNCED)
-    result = await db.execute(stmt)
-    channels_synced = result.scalar() or 0
-
-    channels_orphaned = channels_total - channels_synced
-
-    # Groups
-    stmt = select(func.count()).select_from(Group)
-    result = await db.execute(stmt)
-    groups = result.scalar() or 0
-
-    # Packages
-    stmt = select(func.count()).select_from(Package)
-    result = await db.execute(stmt)
-    packages = result.scalar() or 0
-
-    # Tariffs
-    stmt = select(func.count()).select_from(Tariff)
-    result = await db.execute(stmt)
-    tariffs = result.scalar() or 0
-
-    # Users
-    stmt = select(func.count()).select_from(User)
-    result = await db.execute(stmt)
-    users = result.scalar() or 0
-
-    stmt = select(func.count()).select_from(User).where(User.status == UserStatus.ENABLED)
-    result = await db.execute(stmt)
-    users_enabled = result.scalar() or 0
-
-    users_disabled = users - users_enabled
-
-    # Last sync time
-    stmt = select(func.max(Channel.last_seen_at))
-    result = await db.execute(stmt)
-    last_sync = result.scalar()
-
-    stats = DashboardStats(
-        channels_total=channels_total,
-        channels_synced=channels_synced,
-        channels_orphaned=channels_orphaned,
-        groups=groups,
-        packages=packages,
-        tariffs=tariffs,
-        users=users,
-        users_enabled=users_enabled,
-        users_disabled=users_disabled,
-        last_sync=last_sync,
+    return SuccessResponse(data=await _collect_stats(db))
+
+
+async def _collect_stats(db: AsyncSession) -> DashboardStats:
+    counts = await DashboardService(db).get_counts()
+    return DashboardStats(
+        channels_total=counts.channels_total,
+        channels_synced=counts.channels_synced,
+        channels_orphaned=counts.channels_orphaned,
+        groups=counts.groups,
+        packages=counts.packages,
+        tariffs=counts.tariffs,
+        users=counts.users,
+        users_enabled=counts.users_enabled,
+        users_disabled=counts.users_disabled,
+        last_sync=counts.last_sync,
     )
 
-    return SuccessResponse(data=stats)
+
+@cache
+def _get_probe_cache() -> ProbeCache[Any]:
+    settings = get_settings()
+    return ProbeCache(
+        ttl=settings.dashboard_probe_cache_ttl,
+        max_stale=settings.dashboard_probe_max_stale,
+    )
 
 
 async def _get_provider_stats(source: StreamSource) -> StreamProviderDashboardStats:
+    return await _get_probe_cache().get(source.value, lambda: _probe_provider_stats(source))
+
+
+async def _probe_provider_stats(source: StreamSource) -> StreamProviderDashboardStats:
     checked_at = datetime.now(UTC)
 
     try:
@@ -113,6 +159,18 @@ async def _get_provider_stats(source: StreamSource) -> StreamProviderDashboardSt
                 else None
             ),
             error=payload.error,
+            nodes=[
+                StreamProviderNodeStats(
+                    name=node.name,
+                    health=node.health,
+                    url=node.url,
+                    incoming_kbit=node.incoming_kbit,
+                    outgoing_kbit=node.outgoing_kbit,
+                    total_clients=node.total_clients,
+                    error=node.error,
+                )
+                for node in payload.nodes
+            ],
         )
     except StreamProviderError as e:
         stats = StreamProviderDashboardStats(
@@ -143,6 +201,30 @@ async def get_nimble_stats(
 @router.get("/auth", response_model=SuccessResponse[AuthDashboardStats])
 async def get_auth_stats(_admin_id: CurrentAdminId) -> SuccessResponse[AuthDashboardStats]:
     """Get Auth service health and active token/session stats for dashboard."""
+    return SuccessResponse(data=await _get_auth_stats())
+
+
+@router.get("/auth-sync", response_model=SuccessResponse[AuthOutboxStats])
+async def get_auth_sync_stats(
+    _admin_id: CurrentAdminId,
+    db: ReadDBSession,
+) -> SuccessResponse[AuthOutboxStats]:
+    """Get the Auth sync outbox backlog and lag, and the debounced resync queue."""
+    stats = await AuthOutboxService(db).stats()
+    return SuccessResponse(
+        data=AuthOutboxStats(
+            enabled=get_settings().auth_outbox_enabled,
+            resync_queue=AuthResyncQueueStats(**vars(auth_resync_queue.stats())),
+            **vars(stats),
+        )
+    )
+
+
+async def _get_auth_stats() -> AuthDashboardStats:
+    return await _get_probe_cache().get("auth", _probe_auth_stats)
+
+
+async def _probe_auth_stats() -> AuthDashboardStats:
     checked_at = datetime.now(UTC)
 
     try:
@@ -163,12 +245,20 @@ async def get_auth_stats(_admin_id: CurrentAdminId) -> SuccessResponse[AuthDashb
             error=str(e),
         )
 
-    return SuccessResponse(data=stats)
+    return stats
 
 
 @router.get("/epg", response_model=SuccessResponse[EpgDashboardStats])
 async def get_epg_stats(_admin_id: CurrentAdminId) -> SuccessResponse[EpgDashboardStats]:
     """Get EPG service health and update stats for dashboard."""
+    return SuccessResponse(data=await _get_epg_stats())
+
+
+async def _get_epg_stats() -> EpgDashboardStats:
+    return await _get_probe_cache().get("epg", _probe_epg_stats)
+
+
+async def _probe_epg_stats() -> EpgDashboardStats:
     client = EpgServiceClient()
 
     try:
@@ -190,12 +280,20 @@ async def get_epg_stats(_admin_id: CurrentAdminId) -> SuccessResponse[EpgDashboa
             error=str(e),
         )
 
-    return SuccessResponse(data=stats)
+    return stats
 
 
 @router.get("/rutv", response_model=SuccessResponse[RutvDashboardStats])
 async def get_rutv_stats(_admin_id: CurrentAdminId) -> SuccessResponse[RutvDashboardStats]:
     """Get RUTV site health and stats for dashboard."""
+    return SuccessResponse(data=await _get_rutv_stats())
+
+
+async def _get_rutv_stats() -> RutvDashboardStats:
+    return await _get_probe_cache().get("rutv", _probe_rutv_stats)
+
+
+async def _probe_rutv_stats() -> RutvDashboardStats:
     checked_at = datetime.now(UTC)
     client = RutvClient()
 
@@ -218,7 +316,7 @@ async def get_rutv_stats(_admin_id: CurrentAdminId) -> SuccessResponse[RutvDashb
             error=str(e),
         )
 
-    return SuccessResponse(data=stats)
+    return stats
 
 
 @router.post("/epg/update", response_model=MessageResponse)
@@ -226,6 +324,7 @@ async def update_epg_now(_admin_id: CurrentAdminId) -> MessageResponse:
     """Trigger EPG service update immediately."""
     client = EpgServiceClient()
     payload = await client.trigger_fetch()
+    _get_probe_cache().invalidate("epg")
 
     message = payload.get("message")
     if not isinstance(message, str) or not message.strip():
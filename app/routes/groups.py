@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.dependencies import CurrentAdminId, DBSession
+from app.dependencies import CurrentAdminId, DBSession, ReadDBSession
 from app.schemas import (
     GroupCreate,
     GroupResponse,
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("", response_model=SuccessResponse[list[GroupWithCount]])
 async def list_groups(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[GroupWithCount]]:
     """List all groups with channel counts."""
     service = GroupService(db)
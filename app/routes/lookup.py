@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Query
 
-from app.dependencies import CurrentAdminId, DBSession
+from app.dependencies import CurrentAdminId, ReadDBSession
 from app.models import StreamSource
 from app.schemas import ChannelLookup, GroupLookup, PackageLookup, SuccessResponse, TariffLookup
 from app.services.channel_service import ChannelService
@@ -14,7 +14,7 @@ router = APIRouter()
 @router.get("/groups", response_model=SuccessResponse[list[GroupLookup]])
 async def lookup_groups(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[GroupLookup]]:
     """Get all groups for dropdown."""
     service = GroupService(db)
@@ -27,7 +27,7 @@ async def lookup_groups(
 @router.get("/packages", response_model=SuccessResponse[list[PackageLookup]])
 async def lookup_packages(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[PackageLookup]]:
     """Get all packages for dropdown."""
     service = PackageService(db)
@@ -40,7 +40,7 @@ async def lookup_packages(
 @router.get("/tariffs", response_model=SuccessResponse[list[TariffLookup]])
 async def lookup_tariffs(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[TariffLookup]]:
     """Get all tariffs for dropdown."""
     service = TariffService(db)
@@ -53,7 +53,7 @@ async def lookup_tariffs(
 @router.get("/channels", response_model=SuccessResponse[list[ChannelLookup]])
 async def lookup_channels(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
     search: str = Query("", min_length=0),
     limit: int = Query(50, ge=1, le=1000),
     source: StreamSource | None = None,
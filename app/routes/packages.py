@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.dependencies import CurrentAdminId, DBSession
+from app.dependencies import CurrentAdminId, DBSession, ReadDBSession
 from app.schemas import (
     MessageResponse,
     PackageCreate,
@@ -20,7 +20,7 @@ router = APIRouter()
 @router.get("", response_model=SuccessResponse[list[PackageWithCount]])
 async def list_packages(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[PackageWithCount]]:
     """List all packages with channel counts."""
     service = PackageService(db)
@@ -45,7 +45,7 @@ async def list_packages(
 async def get_package(
     package_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[PackageDetail]:
     """Get a single package with assigned channels."""
     service = PackageService(db)
@@ -94,7 +94,7 @@ async def delete_package(
     affected_user_ids = await auth_sync.get_user_ids_for_packages([package_id])
 
     info = await service.delete(package_id)
-    await auth_sync.sync_users_by_ids(affected_user_ids)
+    await auth_sync.request_users_sync(affected_user_ids)
     return SuccessResponse(data=PackageDeleteInfo(**info))
 
 
@@ -111,5 +111,5 @@ async def remove_package_channel(
     affected_user_ids = await auth_sync.get_user_ids_for_packages([package_id])
 
     await service.remove_channel(package_id, channel_id)
-    await auth_sync.sync_users_by_ids(affected_user_ids)
+    await auth_sync.request_users_sync(affected_user_ids)
     return MessageResponse(message="Channel removed from package")
@@ -3,7 +3,7 @@ from pathlib import Path
 from fastapi import APIRouter
 from fastapi.responses import HTMLResponse, PlainTextResponse
 
-from app.dependencies import DBSession
+from app.dependencies import ReadDBSession
 from app.exceptions import NotFoundError
 from app.services.playlist_generator import PlaylistGenerator
 from app.services.user_service import UserService
@@ -15,7 +15,7 @@ SPA_HTML_HEADERS = {"Cache-Control": "no-store"}
 
 
 @router.get("/{playlist_name}.m3u8", response_class=PlainTextResponse)
-async def public_playlist(playlist_name: str, db: DBSession) -> PlainTextResponse:
+async def public_playlist(playlist_name: str, db: ReadDBSession) -> PlainTextResponse:
     """Serve a public playlist by filename."""
     generator = PlaylistGenerator()
     user_service = UserService(db)
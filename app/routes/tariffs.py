@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.dependencies import CurrentAdminId, DBSession
+from app.dependencies import CurrentAdminId, DBSession, ReadDBSession
 from app.schemas import (
     SuccessResponse,
     TariffCreate,
@@ -18,7 +18,7 @@ router = APIRouter()
 @router.get("", response_model=SuccessResponse[list[TariffWithCount]])
 async def list_tariffs(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[TariffWithCount]]:
     """List all tariffs with package and channel counts."""
     service = TariffService(db)
@@ -75,7 +75,7 @@ async def update_tariff(
         description=data.description,
         package_ids=data.package_ids,
     )
-    await auth_sync.sync_users_by_ids(affected_user_ids)
+    await auth_sync.request_users_sync(affected_user_ids)
     return SuccessResponse(data=TariffResponse.model_validate(tariff))
 
 
@@ -91,5 +91,5 @@ async def delete_tariff(
     affected_user_ids = await auth_sync.get_user_ids_for_tariffs([tariff_id])
 
     info = await service.delete(tariff_id)
-    await auth_sync.sync_users_by_ids(affected_user_ids)
+    await auth_sync.request_users_sync(affected_user_ids)
     return SuccessResponse(data=TariffDeleteInfo(**info))
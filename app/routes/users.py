@@ -1,11 +1,18 @@
-from datetime import datetime
-from typing import Any
+import csv
+import io
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timezone
+from functools import cache
+from typing import Any, Literal
 
 from fastapi import APIRouter, Query
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from app.clients.auth_service import AuthServiceClient
-from app.dependencies import CurrentAdminId, DBSession
+from app.config import get_settings
+from app.dependencies import CurrentAdminId, DBSession, ReadDBSession
 from app.exceptions import ValidationError
 from app.models import UserStatus
 from app.schemas import (
@@ -23,29 +30,37 @@ from app.schemas import (
     UserUpdate,
 )
 from app.services.auth_sync import AuthSyncService
+from app.services.load_profiles import BARE, USER_PLAYLIST
 from app.services.playlist_generator import PlaylistGenerator
 from app.services.user_service import UserService
 from app.utils.log_mapping import (
+    ACCESS_LOG_EXPORT_FIELDS,
     ACCESS_LOG_SORT_FIELDS,
     SESSION_LOG_SORT_FIELDS,
+    SESSION_SORT_PUSHDOWN,
+    SessionList,
     map_access_log_entry,
     map_session_log_entry,
     normalize_datetime,
     normalize_sort_dir,
-    parse_datetime,
     sort_items,
 )
-from app.utils.pagination import PaginationParams
+from app.utils.pagination import CountMode, PaginationParams
+from app.utils.ttl_cache import TTLCache
 
 router = APIRouter()
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 
 @router.get("", response_model=PaginatedResponse[UserListItem])
 async def list_users(
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    count: CountMode = "exact",
     search: str | None = None,
     status: UserStatus | None = None,
     tariff_id: int | None = None,
@@ -54,7 +69,7 @@ async def list_users(
 ) -> PaginatedResponse[UserListItem]:
     """List users with pagination and filters."""
     service = UserService(db)
-    pagination = PaginationParams(page=page, per_page=per_page)
+    pagination = PaginationParams(page=page, per_page=per_page, cursor=cursor, count=count)
 
     result = await service.get_paginated(
         pagination=pagination,
@@ -72,6 +87,9 @@ async def list_users(
             page=result.page,
             per_page=result.per_page,
             pages=result.pages,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+            total_capped=result.total_capped,
         )
     )
 
@@ -80,7 +98,7 @@ async def list_users(
 async def get_user(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[UserResponse]:
     """Get a single user by ID."""
     service = UserService(db)
@@ -248,7 +266,7 @@ async def regenerate_token(
 async def get_resolved_channels(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[list[ResolvedChannel]]:
     """Get resolved channel list for a user."""
     service = UserService(db)
@@ -273,13 +291,13 @@ async def get_resolved_channels(
 async def download_playlist(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> PlainTextResponse:
     """Download M3U playlist file for a user."""
     user_service = UserService(db)
     generator = PlaylistGenerator()
 
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_by_id(user_id, USER_PLAYLIST)
     channels = await user_service.resolve_channels(user_id)
 
     content = generator.generate(user, channels)
@@ -296,13 +314,13 @@ async def download_playlist(
 async def preview_playlist(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
 ) -> SuccessResponse[PlaylistPreview]:
     """Preview playlist content for a user."""
     user_service = UserService(db)
     generator = PlaylistGenerator()
 
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_by_id(user_id, USER_PLAYLIST)
     channels = await user_service.resolve_channels(user_id)
 
     content = generator.generate(user, channels)
@@ -317,11 +335,26 @@ async def preview_playlist(
     )
 
 
+@cache
+def _get_sessions_cache() -> TTLCache[SessionList]:
+    settings = get_settings()
+    return TTLCache(
+        ttl=settings.auth_sessions_cache_seconds,
+        max_entries=settings.auth_sessions_cache_max_users,
+    )
+
+
+async def _fetch_session_list(user_id: str) -> SessionList:
+    async with AuthServiceClient() as auth_client:
+        sessions = await auth_client.get_user_sessions(user_id=user_id, skip=0, limit=1000)
+    return SessionList.parse(sessions)
+
+
 @router.get("/{user_id}/sessions", response_model=SuccessResponse[PaginatedData[SessionEntry]])
 async def get_user_sessions(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=1000),
     sort_by: str = "started_at",
@@ -331,46 +364,44 @@ async def get_user_sessions(
 ) -> SuccessResponse[PaginatedData[SessionEntry]]:
     """Get active sessions (live state) for a user from Auth Service."""
     user_service = UserService(db)
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_by_id(user_id, BARE)
 
     sort_dir = normalize_sort_dir(sort_dir)
     if sort_by not in SESSION_LOG_SORT_FIELDS:
         sort_by = "started_at"
 
-    async with AuthServiceClient() as auth_client:
-        sessions = await auth_client.get_user_sessions(
-            user_id=str(user.id),
-            skip=0,
-            limit=1000,
+    if get_settings().auth_sessions_pushdown:
+        skip = (page - 1) * per_page
+        pushdown_sort = SESSION_SORT_PUSHDOWN.get(sort_by)
+        if sort_by == "duration":
+            sort_dir = "asc" if sort_dir == "desc" else "desc"
+        async with AuthServiceClient() as auth_client:
+            sessions = await auth_client.get_user_sessions(
+                user_id=str(user.id),
+                start_time=from_date,
+                end_time=to_date,
+                sort_by=pushdown_sort,
+                sort_dir=sort_dir if pushdown_sort else None,
+                skip=skip,
+                limit=per_page + 1,
+            )
+        has_more = len(sessions) > per_page
+        sessions = sessions[:per_page]
+        total = skip + len(sessions) + (1 if has_more else 0)
+        pages = 0 if total == 0 else (page + 1 if has_more else page)
+    else:
+        session_list = await _get_sessions_cache().get(
+            str(user.id), lambda: _fetch_session_list(str(user.id))
         )
+        sessions = session_list.select(
+            sort_by, sort_dir, normalize_datetime(from_date), normalize_datetime(to_date)
+        )
+        total = len(sessions)
+        pages = 0 if total == 0 else (total + per_page - 1) // per_page
+        start = (page - 1) * per_page
+        sessions = sessions[start : start + per_page]
 
-    from_dt = normalize_datetime(from_date)
-    to_dt = normalize_datetime(to_date)
-    filtered_sessions: list[dict[str, Any]] = []
-    for session in sessions:
-        started_at = session.get("started_at")
-        if isinstance(started_at, str):
-            started_dt = normalize_datetime(parse_datetime(started_at))
-        elif isinstance(started_at, datetime):
-            started_dt = normalize_datetime(started_at)
-        else:
-            started_dt = None
-
-        if from_dt and started_dt and started_dt < from_dt:
-            continue
-        if to_dt and started_dt and started_dt > to_dt:
-            continue
-        filtered_sessions.append(session)
-
-    items = [map_session_log_entry(session) for session in filtered_sessions]
-    if sort_by != "started_at" or sort_dir != "desc":
-        items = sort_items(items, sort_by, sort_dir, {"started_at", "ended_at"})
-
-    total = len(items)
-    pages = 0 if total == 0 else (total + per_page - 1) // per_page
-    start = (page - 1) * per_page
-    end = start + per_page
-    items = items[start:end]
+    items = [map_session_log_entry(session) for session in sessions]
 
     return SuccessResponse(
         data=PaginatedData(
@@ -387,7 +418,7 @@ async def get_user_sessions(
 async def get_user_access_logs(
     user_id: int,
     _admin_id: CurrentAdminId,
-    db: DBSession,
+    db: ReadDBSession,
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=1000),
     sort_by: str = "accessed_at",
@@ -397,7 +428,7 @@ async def get_user_access_logs(
 ) -> SuccessResponse[PaginatedData[AccessLogEntry]]:
     """Get access log entries (immutable audit trail) for a user from Auth Service."""
     user_service = UserService(db)
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_by_id(user_id, BARE)
 
     sort_dir = normalize_sort_dir(sort_dir)
     if sort_by not in ACCESS_LOG_SORT_FIELDS:
@@ -432,3 +463,87 @@ async def get_user_access_logs(
             pages=pages,
         )
     )
+
+
+@router.get("/{user_id}/access-logs/export")
+async def export_user_access_logs(
+    user_id: int,
+    _admin_id: CurrentAdminId,
+    db: ReadDBSession,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    from_date: datetime | None = Query(None),
+    to_date: datetime | None = Query(None),
+    channel: str | None = Query(None),
+    ip: str | None = Query(None),
+) -> StreamingResponse:
+    """Stream a user's access logs over any date range as NDJSON or CSV."""
+    user_service = UserService(db)
+    user = await user_service.get_by_id(user_id, BARE)
+
+    # Pin the open end so entries logged during the export do not shift the pages.
+    to_date = to_date or datetime.now(timezone.utc).replace(tzinfo=None)
+    entries = _access_log_export_entries(str(user.id), from_date, to_date, channel, ip)
+    # Fetch the first page before answering, so an unreachable Auth Service
+    # is reported as an error response rather than an empty export.
+    first_page = await anext(entries, [])
+
+    return StreamingResponse(
+        _render_access_log_export(first_page, entries, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="access-logs-user-{user.id}.{format}"'
+            )
+        },
+    )
+
+
+async def _access_log_export_entries(
+    user_id: str,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    channel: str | None,
+    ip: str | None,
+) -> AsyncGenerator[list[dict[str, Any]], None]:
+    """Mapped access-log entries matching the filters, one Auth page at a time."""
+    async with AuthServiceClient() as auth_client, aclosing(
+        auth_client.access_log_pages(user_id=user_id, start_time=from_date, end_time=to_date)
+    ) as pages:
+        async for page in pages:
+            entries = [map_access_log_entry(log) for log in page]
+            yield [
+                entry
+                for entry in entries
+                if (channel is None or entry["channel"] == channel)
+                and (ip is None or entry["ip"] == ip)
+            ]
+
+
+async def _render_access_log_export(
+    first_page: list[dict[str, Any]],
+    pages: AsyncGenerator[list[dict[str, Any]], None],
+    format: str,
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=ACCESS_LOG_EXPORT_FIELDS)
+    if format == "csv":
+        writer.writeheader()
+
+    def render(page: list[dict[str, Any]]) -> str:
+        if format == "csv":
+            writer.writerows(page)
+        else:
+            buffer.writelines(json.dumps(entry, default=str) + "\n" for entry in page)
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    try:
+        if chunk := render(first_page):
+            yield chunk
+        async for page in pages:
+            if page:
+                yield render(page)
+    finally:
+        await pages.aclose()
@@ -7,6 +7,7 @@ from app.models import StreamSource, SyncStatus, UserStatus
 
 T = TypeVar("T")
 Health = Literal["up", "degraded", "down"]
+SectionStatus = Literal["ok", "error", "timeout"]
 
 
 class OrmModel(BaseModel):
@@ -39,10 +40,16 @@ class ErrorResponse(BaseModel):
 
 class PaginatedData(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    # None when the list was requested with count=none.
+    total: int | None
     page: int
     per_page: int
-    pages: int
+    pages: int | None
+    has_more: bool | None = None
+    # Opaque; pass back as ``cursor`` to fetch the page after this one.
+    next_cursor: str | None = None
+    # total stopped at PAGINATION_COUNT_CAP (count=capped); there are more.
+    total_capped: bool = False
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -96,6 +103,16 @@ class ActiveSourceCounters(BaseModel):
     other: int
 
 
+class StreamProviderNodeStats(BaseModel):
+    name: str
+    health: Health
+    url: str | None = None
+    incoming_kbit: int | None = None
+    outgoing_kbit: int | None = None
+    total_clients: int | None = None
+    error: str | None = None
+
+
 class StreamProviderDashboardStats(BaseModel):
     health: Health
     checked_at: datetime
@@ -107,6 +124,7 @@ class StreamProviderDashboardStats(BaseModel):
     broken_sources: int | None = None
     active_source_counters: ActiveSourceCounters | None = None
     error: str | None = None
+    nodes: list[StreamProviderNodeStats] = []
 
 
 class AuthDashboardStats(BaseModel):
@@ -117,6 +135,25 @@ class AuthDashboardStats(BaseModel):
     error: str | None = None
 
 
+class AuthResyncQueueStats(BaseModel):
+    enabled: bool
+    depth: int
+    requested: int
+    pushed: int
+    merge_ratio: float | None = None
+
+
+class AuthOutboxStats(BaseModel):
+    enabled: bool
+    pending: int
+    pending_users: int
+    retrying: int
+    oldest_created_at: datetime | None = None
+    lag_seconds: float | None = None
+    last_error: str | None = None
+    resync_queue: AuthResyncQueueStats | None = None
+
+
 class EpgDashboardStats(BaseModel):
     health: Health
     checked_at: datetime
@@ -138,6 +175,28 @@ class RutvDashboardStats(BaseModel):
     error: str | None = None
 
 
+class DashboardSection(BaseModel, Generic[T]):
+    status: SectionStatus
+    data: T | None = None
+    error: str | None = None
+
+
+class CircuitBreakerStatus(BaseModel):
+    service: str
+    state: Literal["closed", "open", "half_open"]
+    consecutive_failures: int
+    retry_in: float | None = None
+
+
+class DashboardOverview(BaseModel):
+    flussonic: DashboardSection[StreamProviderDashboardStats]
+    nimble: DashboardSection[StreamProviderDashboardStats]
+    auth: DashboardSection[AuthDashboardStats]
+    epg: DashboardSection[EpgDashboardStats]
+    rutv: DashboardSection[RutvDashboardStats]
+    circuits: list[CircuitBreakerStatus] = []
+
+
 # Group
 class GroupCreate(BaseModel):
     name: str
@@ -278,6 +337,9 @@ class SyncResultResponse(BaseModel):
     new: int
     updated: int
     orphaned: int
+    revived: int = 0
+    auth_users_synced: int = 0
+    auth_propagation_skipped: bool = False
 
 
 class ChannelLookup(OrmModel):
@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.auth_service import AuthServiceClient
+from app.config import get_settings
+from app.exceptions import AuthServiceError
+from app.models import AuthSyncAction, AuthSyncOutbox, User
+from app.services.auth_sync import AuthSyncService
+from app.utils.concurrency import run_bounded
+
+logger = logging.getLogger(__name__)
+
+# Applied per user when several entries are pending: the strongest action wins.
+ACTION_PRIORITY = {AuthSyncAction.SYNC: 0, AuthSyncAction.RECREATE: 1, AuthSyncAction.DELETE: 2}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class OutboxStats:
+    pending: int
+    pending_users: int
+    retrying: int
+    oldest_created_at: datetime | None
+    lag_seconds: float | None
+    last_error: str | None
+
+
+class AuthOutboxService:
+    """Drain the Auth sync outbox and report its backlog."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.auth_sync = AuthSyncService(db)
+
+    async def drain(self, *, now: datetime | None = None) -> Counter[str]:
+        """
+        Push one batch of due outbox entries to Auth Service.
+
+        Entries are collapsed per user, so a user edited many times is pushed
+        once with its current state. Entries of pushed users are removed;
+        entries of failed users are retried with exponential backoff. The
+        caller commits.
+        """
+        settings = get_settings()
+        now = now or _utcnow()
+        result = await self.db.execute(
+            select(AuthSyncOutbox)
+            .where(AuthSyncOutbox.next_attempt_at <= now)
+            .order_by(AuthSyncOutbox.id)
+            .limit(max(settings.auth_outbox_batch_size, 1))
+            .with_for_update(skip_locked=True)
+        )
+        entries = list(result.scalars().all())
+        if not entries:
+            return Counter()
+
+        by_user: dict[int, list[AuthSyncOutbox]] = {}
+        for entry in entries:
+            by_user.setdefault(entry.user_id, []).append(entry)
+        planned = {
+            user_id: max(user_entries, key=lambda entry: ACTION_PRIORITY[entry.action])
+            for user_id, user_entries in by_user.items()
+        }
+
+        failures: dict[int, str] = {}
+        async with AuthServiceClient() as client:
+            deletes = [entry for entry in planned.values() if entry.action is AuthSyncAction.DELETE]
+            await self._delete_tokens(client, deletes, failures)
+            recreate_ids = [
+                user_id
+                for user_id, entry in planned.items()
+                if entry.action is AuthSyncAction.RECREATE
+            ]
+            await self._recreate_users(client, recreate_ids, failures)
+        sync_ids = [
+            user_id for user_id, entry in planned.items() if entry.action is AuthSyncAction.SYNC
+        ]
+        if sync_ids:
+            await self.auth_sync.sync_users_by_ids(sync_ids, failures=failures)
+
+        done_ids = [entry.id for entry in entries if entry.user_id not in failures]
+        if done_ids:
+            await self.db.execute(delete(AuthSyncOutbox).where(AuthSyncOutbox.id.in_(done_ids)))
+        for entry in entries:
+            if entry.user_id in failures:
+                entry.attempts += 1
+                entry.last_error = failures[entry.user_id]
+                entry.next_attempt_at = now + self._backoff(entry.attempts)
+        await self.db.flush()
+
+        counts = Counter(
+            entries=len(entries),
+            users=len(planned),
+            synced=len(planned) - len(failures),
+            failed=len(failures),
+        )
+        logger.info(
+            "Drained Auth outbox: %d entries for %d users, %d failed",
+            counts["entries"],
+            counts["users"],
+            counts["failed"],
+        )
+        return counts
+
+    async def _delete_tokens(
+        self,
+        client: AuthServiceClient,
+        entries: list[AuthSyncOutbox],
+        failures: dict[int, str],
+    ) -> None:
+        async def delete_token(entry: AuthSyncOutbox) -> None:
+            if entry.auth_token_id is None:
+                return
+            try:
+                await client.delete_token(entry.auth_token_id)
+            except AuthServiceError as e:
+                logger.warning("Failed to delete Auth token of user %d: %s", entry.user_id, e)
+                failures[entry.user_id] = str(e)
+
+        await run_bounded(entries, delete_token, get_settings().auth_sync_concurrency)
+
+    async def _recreate_users(
+        self,
+        client: AuthServiceClient,
+        user_ids: list[int],
+        failures: dict[int, str],
+    ) -> None:
+        if not user_ids:
+            return
+        result = await self.db.execute(select(User).where(User.id.in_(user_ids)))
+        users = list(result.scalars().all())
+
+        async def recreate(user: User) -> None:
+            try:
+                await self.auth_sync._do_recreate(client, user)
+            except AuthServiceError as e:
+                logger.warning("Failed to recreate Auth token of user %d: %s", user.id, e)
+                failures[user.id] = str(e)
+
+        await run_bounded(users, recreate, get_settings().auth_sync_concurrency)
+
+    @staticmethod
+    def _backoff(attempts: int) -> timedelta:
+        settings = get_settings()
+        seconds = settings.auth_outbox_retry_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, settings.auth_outbox_max_retry_seconds))
+
+    async def stats(self, *, now: datetime | None = None) -> OutboxStats:
+        now = now or _utcnow()
+        row = (
+            await self.db.execute(
+                select(
+                    func.count(AuthSyncOutbox.id),
+                    func.count(func.distinct(AuthSyncOutbox.user_id)),
+                    func.count(AuthSyncOutbox.id).filter(AuthSyncOutbox.attempts > 0),
+                    func.min(AuthSyncOutbox.created_at),
+                )
+            )
+        ).one()
+        pending, pending_users, retrying, oldest = row
+        last_error = await self.db.scalar(
+            select(AuthSyncOutbox.last_error)
+            .where(AuthSyncOutbox.last_error.is_not(None))
+            .order_by(AuthSyncOutbox.next_attempt_at.desc())
+            .limit(1)
+        )
+        return OutboxStats(
+            pending=pending,
+            pending_users=pending_users,
+            retrying=retrying,
+            oldest_created_at=oldest,
+            lag_seconds=(now - oldest).total_seconds() if oldest is not None else None,
+            last_error=last_error,
+        )
+
+
+class AuthOutboxDrainer:
+    """Background task that keeps draining the Auth sync outbox."""
+
+    def __init__(self) -> None:
+        self._session_factory: Callable[[], AsyncSession] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self, session_factory: Callable[[], AsyncSession]) -> None:
+        settings = get_settings()
+        if not settings.auth_outbox_enabled or self._task is not None:
+            return
+        self._session_factory = session_factory
+        self._task = asyncio.create_task(self._run(settings.auth_outbox_poll_seconds))
+        logger.info("Auth outbox drainer started (polling every %gs)", settings.auth_outbox_poll_seconds)
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def drain_once(self) -> Counter[str]:
+        async with self._session_factory() as session:
+            counts = await AuthOutboxService(session).drain()
+            await session.commit()
+        return counts
+
+    async def _run(self, interval: float) -> None:
+        while True:
+            try:
+                counts = await self.drain_once()
+            except Exception:
+                logger.exception("Auth outbox drain failed")
+                counts = Counter()
+            # Keep going while full batches come back; otherwise wait for new entries.
+            if counts["entries"] < get_settings().auth_outbox_batch_size:
+                await asyncio.sleep(interval)
+
+
+auth_outbox_drainer = AuthOutboxDrainer()
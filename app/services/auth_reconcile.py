@@ -0,0 +1,309 @@
+import hashlib
+import json
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Self
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.clients.auth_service import AuthServiceClient, AuthTokenIndex
+from app.config import get_settings
+from app.exceptions import AuthServiceError
+from app.models import User, UserStatus
+from app.services.auth_sync import AuthSyncService
+from app.services.user_service import UserService
+from app.utils.concurrency import run_bounded
+
+logger = logging.getLogger(__name__)
+
+CREATE = "create"
+PATCH = "patch"
+RECREATE = "recreate"
+DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class ReconcileAction:
+    """One step of a reconciliation plan; serialized as a JSON line."""
+
+    action: str
+    user_id: int | None
+    auth_token_id: int | None
+    reason: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.action}:{self.user_id or ''}:{self.auth_token_id or ''}"
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, line: str) -> Self:
+        return cls(**json.loads(line))
+
+
+@dataclass(frozen=True)
+class DesiredToken:
+    user_id: int
+    token: str
+    auth_token_id: int | None
+    status: str
+    max_sessions: int
+    valid_from: datetime | None
+    valid_until: datetime | None
+    allowed_streams: list[str]
+
+
+class CheckpointMismatchError(RuntimeError):
+    """A checkpoint file records progress of a different plan."""
+
+
+def plan_digest(plan: list[ReconcileAction]) -> str:
+    return hashlib.sha256("".join(f"{step.to_json()}\n" for step in plan).encode()).hexdigest()
+
+
+class Checkpoint:
+    """
+    Append-only file of applied plan keys, so an interrupted apply can resume.
+
+    The first line holds the digest of the plan being applied; resuming with
+    any other plan raises ``CheckpointMismatchError`` instead of skipping its
+    steps whose keys happen to match.
+    """
+
+    _HEADER = "plan "
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.plan_digest: str | None = None
+        self.done: set[str] = set()
+        if path is not None and path.exists():
+            for line in path.read_text().splitlines():
+                line = line.strip()
+                if line.startswith(self._HEADER):
+                    self.plan_digest = line.removeprefix(self._HEADER)
+                elif line:
+                    self.done.add(line)
+
+    def bind(self, digest: str) -> None:
+        """Start or resume recording ``digest``'s plan."""
+        if self.plan_digest is None and not self.done:
+            self.plan_digest = digest
+            if self.path is not None:
+                self.path.write_text(f"{self._HEADER}{digest}\n")
+        elif self.plan_digest != digest:
+            raise CheckpointMismatchError(
+                f"Checkpoint {self.path} belongs to another plan; "
+                "resume with the original --plan-file or use a new checkpoint"
+            )
+
+    def record(self, key: str) -> None:
+        self.done.add(key)
+        if self.path is not None:
+            with self.path.open("a") as handle:
+                handle.write(f"{key}\n")
+
+
+def _normalize_datetime(value: object) -> str | None:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _record_hash(
+    status: object, max_sessions: object, valid_until: object, allowed_streams: Iterable[str]
+) -> str:
+    """Hash of the token fields a PATCH can change, comparable across both sides."""
+    payload = json.dumps(
+        [status, max_sessions, _normalize_datetime(valid_until), sorted(allowed_streams)]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AuthReconciler:
+    """
+    Diff every Playlist user against a full pull of Auth Service tokens.
+
+    ``plan`` produces create/patch/recreate/delete steps without changing
+    anything; ``apply`` carries them out with ``AUTH_SYNC_CONCURRENCY``
+    requests in flight, recording each finished step in a checkpoint.
+    Only tokens are reconciled: sessions and access logs hold no state
+    Playlist owns, and their ``user_id`` values are normalized in the Auth
+    database by ``scripts/auth_identity_maintenance.py --apply``.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.auth_sync = AuthSyncService(db)
+
+    async def load_desired(self) -> list[DesiredToken]:
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.token,
+                User.auth_token_id,
+                User.status,
+                User.max_sessions,
+                User.valid_from,
+                User.valid_until,
+            ).order_by(User.id)
+        )
+        rows = result.all()
+        streams = await UserService(self.db).resolve_channels_for_users(
+            [row.id for row in rows], exclude_orphaned=True
+        )
+        return [
+            DesiredToken(
+                user_id=row.id,
+                token=row.token,
+                auth_token_id=row.auth_token_id,
+                status="active" if row.status == UserStatus.ENABLED else "suspended",
+                max_sessions=row.max_sessions,
+                valid_from=row.valid_from,
+                valid_until=row.valid_until,
+                allowed_streams=streams[row.id],
+            )
+            for row in rows
+        ]
+
+    async def plan(self, index: AuthTokenIndex | None = None) -> list[ReconcileAction]:
+        if index is None:
+            async with AuthServiceClient() as client:
+                index = await AuthTokenIndex.load(client)
+        desired = await self.load_desired()
+        return self.diff(desired, index)
+
+    def diff(self, desired: list[DesiredToken], index: AuthTokenIndex) -> list[ReconcileAction]:
+        actions: list[ReconcileAction] = []
+        for user in desired:
+            step = self._diff_user(user, index)
+            if step is not None:
+                actions.append(step)
+
+        playlist_tokens = {user.token for user in desired}
+        referenced_ids = {user.auth_token_id for user in desired if user.auth_token_id is not None}
+        for token_id, token in sorted(index.by_id.items()):
+            if token.get("token") not in playlist_tokens and token_id not in referenced_ids:
+                actions.append(ReconcileAction(DELETE, None, token_id, "token unknown to Playlist"))
+        return actions
+
+    def _diff_user(self, user: DesiredToken, index: AuthTokenIndex) -> ReconcileAction | None:
+        def step(action: str, reason: str) -> ReconcileAction:
+            return ReconcileAction(action, user.user_id, user.auth_token_id, reason)
+
+        existing = index.find_by_value(user.token)
+        if existing is None:
+            return step(CREATE, "no Auth token with this value")
+        if existing.get("id") != user.auth_token_id:
+            return step(RECREATE, f"token is stored as Auth token {existing.get('id')}")
+        if existing.get("user_id") != str(user.user_id):
+            return step(RECREATE, f"Auth token belongs to user_id {existing.get('user_id')!r}")
+        if user.valid_until is None and existing.get("valid_until") is not None:
+            return step(RECREATE, "valid_until must be cleared")
+        if user.valid_from is not None and _normalize_datetime(
+            existing.get("valid_from")
+        ) != _normalize_datetime(user.valid_from):
+            return step(RECREATE, "valid_from differs")
+
+        desired_hash = _record_hash(
+            user.status, user.max_sessions, user.valid_until, user.allowed_streams
+        )
+        actual_hash = _record_hash(
+            existing.get("status"),
+            existing.get("max_sessions"),
+            existing.get("valid_until"),
+            existing.get("allowed_streams") or [],
+        )
+        if desired_hash != actual_hash:
+            return step(PATCH, "token fields differ")
+        return None
+
+    async def apply(
+        self,
+        plan: list[ReconcileAction],
+        *,
+        checkpoint: Checkpoint | None = None,
+        progress: Callable[[int, int], None] | None = None,
+        index: AuthTokenIndex | None = None,
+    ) -> Counter[str]:
+        """
+        Carry out ``plan``, skipping steps already in ``checkpoint``, which
+        must have been started for this same plan. Pass the ``index`` the
+        plan was made from to reuse it instead of pulling every token again.
+
+        Steps run in batches of ``AUTH_SYNC_BATCH_SIZE``; each batch is
+        committed before its steps are checkpointed, so a resumed run never
+        skips a step whose Playlist side was lost. User steps go through the
+        same verified sync as a full resync, so a step planned from an
+        outdated pull still ends in the right state. Returns counts per
+        action plus ``failed`` and ``skipped``.
+        """
+        settings = get_settings()
+        checkpoint = checkpoint or Checkpoint(None)
+        checkpoint.bind(plan_digest(plan))
+        pending = [step for step in plan if step.key not in checkpoint.done]
+        counts: Counter[str] = Counter(skipped=len(plan) - len(pending))
+        batch_size = max(settings.auth_sync_batch_size, 1)
+
+        async with AuthServiceClient() as client:
+            if index is None:
+                index = await AuthTokenIndex.load(client)
+            playlist_tokens = set((await self.db.execute(select(User.token))).scalars().all())
+            with self.auth_sync.using_token_index(index):
+                for start in range(0, len(pending), batch_size):
+                    batch = pending[start : start + batch_size]
+                    user_ids = [step.user_id for step in batch if step.user_id is not None]
+                    result = await self.db.execute(select(User).where(User.id.in_(user_ids)))
+                    users = {user.id: user for user in result.scalars().all()}
+
+                    async def run(step: ReconcileAction) -> str:
+                        try:
+                            await self._apply_step(client, step, users, index, playlist_tokens)
+                        except AuthServiceError as e:
+                            logger.warning("Reconcile step %s failed: %s", step.key, e)
+                            return "failed"
+                        return step.action
+
+                    async with self.auth_sync.prefetched_streams(list(users)):
+                        results = await run_bounded(batch, run, settings.auth_sync_concurrency)
+                    await self.db.commit()
+                    for step, outcome in zip(batch, results):
+                        counts[outcome] += 1
+                        if outcome != "failed":
+                            checkpoint.record(step.key)
+                    if progress is not None:
+                        progress(start + len(batch), len(pending))
+        return counts
+
+    async def _apply_step(
+        self,
+        client: AuthServiceClient,
+        step: ReconcileAction,
+        users: dict[int, User],
+        index: AuthTokenIndex,
+        playlist_tokens: set[str],
+    ) -> None:
+        if step.action == DELETE:
+            token = index.get(step.auth_token_id)
+            # Gone already, or claimed by a Playlist user since the plan was made.
+            if token is None or token.get("token") in playlist_tokens:
+                return
+            await self.auth_sync.delete_auth_token(client, step.auth_token_id)
+            return
+        user = users.get(step.user_id)
+        if user is None:
+            return
+        await self.auth_sync.repair_user(client, user, playlist_tokens=playlist_tokens)
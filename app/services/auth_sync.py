@@ -1,13 +1,41 @@
+import asyncio
+import hashlib
+import json
 import logging
-from datetime import datetime
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.clients.auth_service import AuthServiceClient, AuthTokenCreate, AuthTokenUpdate
+from collections import Counter
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+from sqlalchemy import select, union
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.clients.auth_service import (
+    AuthServiceClient,
+    AuthTokenCreate,
+    AuthTokenIndex,
+    AuthTokenUpdate,
+)
+from app.config import get_settings
 from app.exceptions import AuthServiceError, AuthServiceNotFoundError
-from app.models import Channel, User, UserStatus, tariff_packages, user_packages, user_tariffs
+from app.models import (
+    AuthSyncAction,
+    AuthSyncOutbox,
+    Channel,
+    SyncStatus,
+    User,
+    UserStatus,
+    package_channels,
+    tariff_packages,
+    user_channels,
+    user_packages,
+    user_tariffs,
+)
+from app.services.resync_queue import auth_resync_queue
 from app.services.user_service import UserService
+from app.utils.concurrency import run_bounded
 
 logger = logging.getLogger(__name__)
 
@@ -18,14 +46,94 @@ class AuthSyncService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
         self.user_service = UserService(db)
+        # AsyncSession does not allow concurrent operations; concurrent Auth pushes
+        # serialize their database access through this lock.
+        self._db_lock = asyncio.Lock()
+        # Set for the duration of a full resync; lookups then skip the Auth round trip.
+        self._token_index: AuthTokenIndex | None = None
+        # Allowed streams of the batch being pushed, resolved with one query per batch.
+        self._batch_streams: dict[int, list[str]] = {}
 
     def _map_status(self, status: UserStatus) -> str:
         """Map internal status to Auth Service status."""
         return "active" if status == UserStatus.ENABLED else "suspended"
 
     def _build_allowed_streams(self, channels: list[Channel]) -> list[str]:
-        """Build provider-agnostic allowed stream names without duplicates."""
-        return list(dict.fromkeys(ch.stream_name for ch in channels))
+        """Build provider-agnostic allowed stream names without duplicates.
+
+        Orphaned channels no longer exist on their provider and are not granted.
+        """
+        return list(
+            dict.fromkeys(
+                ch.stream_name for ch in channels if ch.sync_status != SyncStatus.ORPHANED
+            )
+        )
+
+    @contextmanager
+    def using_token_index(self, index: AuthTokenIndex) -> Iterator[None]:
+        """Resolve token lookups from ``index`` instead of Auth Service while active."""
+        self._token_index = index
+        try:
+            yield
+        finally:
+            self._token_index = None
+
+    @asynccontextmanager
+    async def prefetched_streams(self, user_ids: list[int]) -> AsyncIterator[None]:
+        """Resolve allowed streams of ``user_ids`` with one query for the duration of a batch."""
+        async with self._db_lock:
+            self._batch_streams = await self.user_service.resolve_channels_for_users(
+                user_ids, exclude_orphaned=True
+            )
+        try:
+            yield
+        finally:
+            self._batch_streams = {}
+
+    def _fingerprint(self, user: User, allowed_streams: list[str]) -> str:
+        """Hash of everything pushed to Auth Service for ``user``; equal hashes need no push."""
+        payload = json.dumps(
+            [
+                user.token,
+                user.auth_token_id,
+                self._map_status(user.status),
+                user.max_sessions,
+                user.valid_from.isoformat() if user.valid_from else None,
+                user.valid_until.isoformat() if user.valid_until else None,
+                sorted(allowed_streams),
+            ]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def _resolve_allowed_streams(self, user: User) -> list[str]:
+        if user.id in self._batch_streams:
+            return self._batch_streams[user.id]
+        async with self._db_lock:
+            channels = await self.user_service.resolve_channels(user.id)
+        return self._build_allowed_streams(channels)
+
+    async def _store_auth_token_id(self, user_id: int, auth_token_id: int | None) -> None:
+        async with self._db_lock:
+            await self.user_service.set_auth_token_id(user_id, auth_token_id)
+
+    async def _get_token(self, client: AuthServiceClient, auth_token_id: int) -> dict[str, Any]:
+        if self._token_index is not None:
+            token = self._token_index.get(auth_token_id)
+            if token is not None:
+                return token
+        return await client.get_token(auth_token_id)
+
+    async def _find_token_by_value(
+        self, client: AuthServiceClient, token: str
+    ) -> dict[str, Any] | None:
+        if self._token_index is not None:
+            return self._token_index.find_by_value(token)
+        return await client.find_token_by_value(token)
+
+    async def _delete_token(self, client: AuthServiceClient, auth_token_id: int) -> None:
+        await client.delete_token(auth_token_id)
+        if self._token_index is not None:
+            self._token_index.discard(auth_token_id)
 
     def _parse_auth_datetime(self, value: object) -> datetime | None:
         if not isinstance(value, str):
@@ -42,6 +150,44 @@ class AuthSyncService:
             return left.replace(tzinfo=None) == right.replace(tzinfo=None)
         return left == right
 
+    async def enqueue(
+        self,
+        user_ids: Iterable[int],
+        action: AuthSyncAction = AuthSyncAction.SYNC,
+        *,
+        auth_token_id: int | None = None,
+    ) -> None:
+        """Queue Auth pushes in the outbox as part of the caller's transaction."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.db.add_all(
+            AuthSyncOutbox(
+                user_id=user_id,
+                action=action,
+                auth_token_id=auth_token_id,
+                created_at=now,
+                next_attempt_at=now,
+            )
+            for user_id in dict.fromkeys(user_ids)
+        )
+        await self.db.flush()
+
+    async def request_users_sync(self, user_ids: list[int]) -> None:
+        """
+        Sync users after an entitlement change.
+
+        With ``AUTH_OUTBOX_ENABLED`` the users are queued for the outbox
+        drainer. With ``AUTH_RESYNC_DEBOUNCE_SECONDS`` they join the debounced
+        resync queue once this transaction commits. Otherwise they are pushed
+        to Auth Service right away.
+        """
+        if get_settings().auth_outbox_enabled:
+            await self.enqueue(user_ids)
+            return
+        if auth_resync_queue.enabled:
+            auth_resync_queue.add_after_commit(self.db, user_ids)
+            return
+        await self.sync_users_by_ids(user_ids)
+
     async def get_user_ids_for_packages(self, package_ids: list[int]) -> list[int]:
         """Find users whose resolved channels can change when packages change."""
         if not package_ids:
@@ -72,16 +218,195 @@ class AuthSyncService:
         result = await self.db.execute(stmt)
         return sorted(result.scalars().all())
 
-    async def sync_users_by_ids(self, user_ids: list[int]) -> None:
-        """Refresh Auth Service tokens for all provided user IDs."""
-        for user_id in dict.fromkeys(user_ids):
-            user = await self.user_service.get_by_id(user_id)
-            await self.sync_user_update(user)
+    async def get_user_ids_for_channels(self, channel_ids: Iterable[int]) -> list[int]:
+        """Find users entitled to any of the channels directly, via packages or via tariffs."""
+        channel_ids = list(channel_ids)
+        if not channel_ids:
+            return []
+
+        direct_users = select(user_channels.c.user_id).where(
+            user_channels.c.channel_id.in_(channel_ids)
+        )
+        package_users = (
+            select(user_packages.c.user_id)
+            .join(package_channels, package_channels.c.package_id == user_packages.c.package_id)
+            .where(package_channels.c.channel_id.in_(channel_ids))
+        )
+        tariff_users = (
+            select(user_tariffs.c.user_id)
+            .join(tariff_packages, tariff_packages.c.tariff_id == user_tariffs.c.tariff_id)
+            .join(package_channels, package_channels.c.package_id == tariff_packages.c.package_id)
+            .where(package_channels.c.channel_id.in_(channel_ids))
+        )
+        stmt = union(direct_users, package_users, tariff_users)
+        result = await self.db.execute(stmt)
+        return sorted(set(result.scalars().all()))
+
+    async def propagate_channel_changes(self, channel_ids: Iterable[int]) -> int:
+        """
+        Push Auth updates only to users entitled to channels whose status changed.
+
+        Users are loaded in batches and pushed with bounded concurrency over one
+        Auth Service connection pool. Returns the number of users synced successfully.
+        """
+        user_ids = await self.get_user_ids_for_channels(channel_ids)
+        if not user_ids:
+            return 0
+
+        actions = await self._sync_in_batches(
+            user_ids,
+            self._sync_user_verified,
+            "Failed to propagate channel changes to user %d: %s",
+        )
+        synced = len(user_ids) - actions["failed"] - actions["missing"]
+        logger.info(
+            "Propagated channel changes to %d of %d affected users", synced, len(user_ids)
+        )
+        return synced
+
+    async def sync_users_by_ids(
+        self,
+        user_ids: list[int],
+        *,
+        failures: dict[int, str] | None = None,
+        force: bool = False,
+    ) -> dict[str, int]:
+        """
+        Refresh Auth Service tokens for all provided user IDs.
+
+        Users are pushed with bounded concurrency over one Auth Service
+        connection pool; a failing user is logged and counted without stopping
+        the others, and its error is recorded in ``failures`` when given.
+        Users whose state matches their last pushed fingerprint are skipped
+        unless ``force`` is set. Returns counts per action, like
+        ``sync_all_users``.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        actions = await self._sync_in_batches(
+            user_ids,
+            partial(self._sync_user_refresh, force=force),
+            "Failed to sync user %d update to Auth Service: %s",
+            failures=failures,
+        )
+        return self._summarize(len(user_ids), actions)
+
+    async def _sync_in_batches(
+        self,
+        user_ids: list[int],
+        sync_one: Callable[..., Awaitable[str]],
+        failure_message: str,
+        *,
+        failures: dict[int, str] | None = None,
+    ) -> Counter[str]:
+        """
+        Load users in batches and run ``sync_one`` for them with bounded concurrency.
+
+        ``sync_one`` is called as ``sync_one(client, user, deferred=...)`` and
+        may queue its token patch in ``deferred`` instead of sending it; the
+        queued patches of a batch go out together in one bulk update.
+
+        Returns how often each action was taken. Users that fail with an Auth
+        Service error count as ``failed``; IDs that no longer exist count as
+        ``missing``.
+        """
+        settings = get_settings()
+        batch_size = max(settings.auth_sync_batch_size, 1)
+        actions: Counter[str] = Counter()
+        if failures is None:
+            failures = {}
+
+        async with AuthServiceClient() as client:
+            deferred: list[tuple[User, AuthTokenUpdate]] = []
+
+            async def push(user: User) -> str:
+                try:
+                    action = await sync_one(client, user, deferred=deferred)
+                except AuthServiceError as e:
+                    logger.warning(failure_message, user.id, e)
+                    failures[user.id] = str(e)
+                    return "failed"
+                logger.debug("Auth sync for user %d completed with action %s", user.id, action)
+                return action
+
+            for start in range(0, len(user_ids), batch_size):
+                batch_ids = user_ids[start : start + batch_size]
+                async with self._db_lock:
+                    result = await self.db.execute(
+                        select(User).where(User.id.in_(batch_ids)).order_by(User.id)
+                    )
+                    users = list(result.scalars().all())
+                actions["missing"] += len(batch_ids) - len(users)
+                async with self.prefetched_streams([user.id for user in users]):
+                    results = await run_bounded(users, push, settings.auth_sync_concurrency)
+                    actions.update(action for action in results if action != "deferred")
+                    if deferred:
+                        actions.update(
+                            await self._send_deferred_patches(
+                                client, deferred, failure_message, failures
+                            )
+                        )
+                        deferred.clear()
+
+        return actions
+
+    async def _send_deferred_patches(
+        self,
+        client: AuthServiceClient,
+        deferred: list[tuple[User, AuthTokenUpdate]],
+        failure_message: str,
+        failures: dict[int, str],
+    ) -> Counter[str]:
+        """Bulk-send queued token patches, recreating tokens Auth Service no longer has."""
+        result = await client.bulk_update_tokens(
+            [(user.auth_token_id, data) for user, data in deferred]
+        )
+        actions: Counter[str] = Counter(patched=len(result.updated))
+        missing: list[User] = []
+        for user, data in deferred:
+            if user.auth_token_id in result.updated:
+                user.auth_sync_fingerprint = self._fingerprint(user, data.allowed_streams)
+            elif user.auth_token_id in result.not_found:
+                missing.append(user)
+            elif user.auth_token_id in result.failed:
+                logger.warning(failure_message, user.id, result.failed[user.auth_token_id])
+                failures[user.id] = result.failed[user.auth_token_id]
+                actions["failed"] += 1
+
+        async def recreate(user: User) -> str:
+            try:
+                await self._do_recreate(client, user)
+            except AuthServiceError as e:
+                logger.warning(failure_message, user.id, e)
+                failures[user.id] = str(e)
+                return "failed"
+            return "recreated"
+
+        actions.update(await run_bounded(missing, recreate, get_settings().auth_sync_concurrency))
+        return actions
+
+    def _summarize(self, total: int, actions: Counter[str]) -> dict[str, int]:
+        summary = {"total": total}
+        for action in ("patched", "unchanged", "recreated", "recovered", "mismatched", "failed"):
+            summary[action] = actions[action]
+        return summary
+
+    async def _sync_user_refresh(
+        self,
+        client: AuthServiceClient,
+        user: User,
+        *,
+        deferred: list[tuple[User, AuthTokenUpdate]] | None = None,
+        force: bool = False,
+    ) -> str:
+        """Recreate a user's token when it was never created, otherwise verify and patch it."""
+        if user.auth_token_id is None:
+            await self._do_recreate(client, user)
+            return "recreated"
+        return await self._sync_user_verified(client, user, deferred=deferred, force=force)
 
     async def _do_create(self, client: AuthServiceClient, user: User) -> None:
         """Create token in Auth Service and store auth_token_id."""
-        channels = await self.user_service.resolve_channels(user.id)
-        allowed_streams = self._build_allowed_streams(channels)
+        allowed_streams = await self._resolve_allowed_streams(user)
 
         data = AuthTokenCreate(
             token=user.token,
@@ -94,17 +419,20 @@ class AuthSyncService:
         )
 
         auth_token_id = await client.create_token(data)
-        await self.user_service.set_auth_token_id(user.id, auth_token_id)
+        if self._token_index is not None:
+            self._token_index.add({"id": auth_token_id, **data.model_dump(mode="json")})
+        await self._store_auth_token_id(user.id, auth_token_id)
+        user.auth_sync_fingerprint = self._fingerprint(user, allowed_streams)
         logger.info("Synced user %d to Auth Service with token_id %d", user.id, auth_token_id)
 
     async def _do_recreate(self, client: AuthServiceClient, user: User) -> None:
         """Recreate the Auth Service token using the existing playlist token value."""
         deleted_ids: set[int] = set()
         if user.auth_token_id is not None:
-            await client.delete_token(user.auth_token_id)
+            await self._delete_token(client, user.auth_token_id)
             deleted_ids.add(user.auth_token_id)
 
-        existing_token = await client.find_token_by_value(user.token)
+        existing_token = await self._find_token_by_value(client, user.token)
         if existing_token is not None:
             existing_token_id = existing_token.get("id")
             if isinstance(existing_token_id, int) and existing_token_id not in deleted_ids:
@@ -113,7 +441,7 @@ class AuthSyncService:
                     user.id,
                     existing_token_id,
                 )
-                await client.delete_token(existing_token_id)
+                await self._delete_token(client, existing_token_id)
 
         await self._do_create(client, user)
 
@@ -123,6 +451,9 @@ class AuthSyncService:
         Creates token and stores auth_token_id.
         Failures are logged but don't prevent user creation.
         """
+        if get_settings().auth_outbox_enabled:
+            await self.enqueue([user.id])
+            return
         try:
             async with AuthServiceClient() as client:
                 await self._do_create(client, user)
@@ -137,6 +468,10 @@ class AuthSyncService:
         endpoint need to be replaced, while keeping the playlist token stable.
         Failures are logged but don't prevent user update.
         """
+        if get_settings().auth_outbox_enabled:
+            action = AuthSyncAction.RECREATE if recreate_token else AuthSyncAction.SYNC
+            await self.enqueue([user.id], action)
+            return
         try:
             async with AuthServiceClient() as client:
                 if user.auth_token_id is None:
@@ -158,6 +493,12 @@ class AuthSyncService:
         Remove user token from Auth Service.
         Failures are logged but don't prevent user deletion.
         """
+        if get_settings().auth_outbox_enabled:
+            if user.auth_token_id is not None:
+                await self.enqueue(
+                    [user.id], AuthSyncAction.DELETE, auth_token_id=user.auth_token_id
+                )
+            return
         try:
             if user.auth_token_id is not None:
                 async with AuthServiceClient() as client:
@@ -172,6 +513,9 @@ class AuthSyncService:
         Deletes old token and creates new one.
         Failures are logged but don't prevent token regeneration.
         """
+        if get_settings().auth_outbox_enabled:
+            await self.enqueue([user.id], AuthSyncAction.RECREATE)
+            return
         try:
             async with AuthServiceClient() as client:
                 await self._do_recreate(client, user)
@@ -180,33 +524,50 @@ class AuthSyncService:
             logger.warning("Failed to regenerate token for user %d in Auth Service: %s", user.id, e)
 
     async def sync_all_users(self) -> dict[str, int]:
-        """Resync all Playlist users to Auth Service and return summary counts."""
-        result = await self.db.execute(select(User).order_by(User.id))
-        users = list(result.scalars().all())
-        summary = {
-            "total": len(users),
-            "patched": 0,
-            "recreated": 0,
-            "recovered": 0,
-            "mismatched": 0,
-            "failed": 0,
-        }
-        playlist_tokens = {user.token for user in users}
+        """
+        Resync all Playlist users to Auth Service and return summary counts.
 
+        Users are pushed with bounded concurrency like ``sync_users_by_ids``
+        and always verified against Auth Service, ignoring fingerprints, so
+        drift made outside this service is repaired. Every Auth token is
+        fetched once up front into an ``AuthTokenIndex``, so verifying and
+        recovering a user needs no per-user lookups.
+        """
+        result = await self.db.execute(select(User.id, User.token).order_by(User.id))
+        rows = result.all()
+        playlist_tokens = {row.token for row in rows}
         async with AuthServiceClient() as client:
-            for user in users:
-                try:
-                    action = await self._sync_user_verified(
-                        client,
-                        user,
-                        playlist_tokens=playlist_tokens,
-                    )
-                    summary[action] += 1
-                except AuthServiceError as e:
-                    logger.warning("Failed full auth resync for user %d: %s", user.id, e)
-                    summary["failed"] += 1
+            token_index = await AuthTokenIndex.load(client)
+
+        async def sync_one(
+            client: AuthServiceClient,
+            user: User,
+            *,
+            deferred: list[tuple[User, AuthTokenUpdate]],
+        ) -> str:
+            return await self._sync_user_verified(
+                client, user, playlist_tokens=playlist_tokens, deferred=deferred, force=True
+            )
+
+        with self.using_token_index(token_index):
+            actions = await self._sync_in_batches(
+                [row.id for row in rows],
+                sync_one,
+                "Failed full auth resync for user %d: %s",
+            )
+        return self._summarize(len(rows), actions)
+
+    async def repair_user(
+        self, client: AuthServiceClient, user: User, *, playlist_tokens: set[str]
+    ) -> str:
+        """Verify one user's Auth token, ignoring its fingerprint, and fix any drift."""
+        return await self._sync_user_verified(
+            client, user, playlist_tokens=playlist_tokens, force=True
+        )
 
-        return summary
+    async def delete_auth_token(self, client: AuthServiceClient, auth_token_id: int) -> None:
+        """Delete an Auth token no Playlist user owns, keeping the active token index current."""
+        await self._delete_token(client, auth_token_id)
 
     async def _sync_user_verified(
         self,
@@ -214,13 +575,26 @@ class AuthSyncService:
         user: User,
         *,
         playlist_tokens: set[str] | None = None,
+        deferred: list[tuple[User, AuthTokenUpdate]] | None = None,
+        force: bool = False,
     ) -> str:
-        """Patch a verified Auth token or recreate/recover when ownership is stale."""
+        """
+        Patch a verified Auth token or recreate/recover when ownership is stale.
+
+        Returns ``"unchanged"`` without calling Auth Service when the user
+        matches the fingerprint of its last push, unless ``force`` is set.
+        With ``deferred`` the patch is queued there for a bulk update and
+        ``"deferred"`` is returned instead of ``"patched"``.
+        """
         expected_user_id = str(user.id)
 
         if user.auth_token_id is not None:
+            allowed_streams = await self._resolve_allowed_streams(user)
+            if not force and user.auth_sync_fingerprint == self._fingerprint(user, allowed_streams):
+                return "unchanged"
+
             try:
-                auth_token = await client.get_token(user.auth_token_id)
+                auth_token = await self._get_token(client, user.auth_token_id)
             except AuthServiceNotFoundError:
                 await self._do_recreate(client, user)
                 return "recreated"
@@ -234,14 +608,14 @@ class AuthSyncService:
                     stale_auth_token_id,
                     user.id,
                 )
-                existing_token = await client.find_token_by_value(user.token)
+                existing_token = await self._find_token_by_value(client, user.token)
                 if existing_token is not None:
                     existing_token_id = existing_token.get("id")
                     if isinstance(existing_token_id, int):
-                        await client.delete_token(existing_token_id)
+                        await self._delete_token(client, existing_token_id)
                 await self._do_create(client, user)
                 if playlist_tokens is not None and token_value not in playlist_tokens:
-                    await client.delete_token(stale_auth_token_id)
+                    await self._delete_token(client, stale_auth_token_id)
                 return "recovered"
 
             if auth_user_id != expected_user_id:
@@ -277,17 +651,30 @@ class AuthSyncService:
             await self._do_recreate(client, user)
             return "recreated"
 
-        channels = await self.user_service.resolve_channels(user.id)
         data = AuthTokenUpdate(
             status=self._map_status(user.status),
             max_sessions=user.max_sessions,
             valid_until=user.valid_until,
-            allowed_streams=self._build_allowed_streams(channels),
+            allowed_streams=allowed_streams,
         )
+        if deferred is not None:
+            deferred.append((user, data))
+            return "deferred"
         try:
             await client.update_token(user.auth_token_id, data)
         except AuthServiceNotFoundError:
             await self._do_recreate(client, user)
             return "recreated"
 
+        user.auth_sync_fingerprint = self._fingerprint(user, allowed_streams)
         return "patched"
+
+
+async def resync_users(
+    session_factory: async_sessionmaker[AsyncSession], user_ids: list[int]
+) -> None:
+    """Push users through ``sync_users_by_ids`` in a session of their own."""
+    async with session_factory() as session:
+        summary = await AuthSyncService(session).sync_users_by_ids(user_ids)
+        await session.commit()
+    logger.info("Debounced Auth resync finished: %s", summary)
@@ -1,6 +1,5 @@
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.exceptions import NotFoundError, ValidationError
 from app.models import (
@@ -13,7 +12,16 @@ from app.models import (
     package_channels,
     user_channels,
 )
+from app.services.load_profiles import BARE, CHANNEL_DETAIL, CHANNEL_LIST, CHANNEL_PLAYLIST, LoadProfile
+from app.utils.keyset import SortKey, paginate
 from app.utils.pagination import PaginatedResult, PaginationParams
+from app.utils.search import matches, relevance
+
+
+# Text columns matched and ranked by the channel lookup search.
+SEARCH_COLUMNS = [Channel.stream_name, Channel.display_name, Channel.tvg_name]
+# Tables the filtered channel count reads; writing any of them recounts it.
+COUNT_TABLES = (Channel.__tablename__, group_channels.name, package_channels.name)
 
 
 class ChannelService:
@@ -44,21 +52,12 @@ class ChannelService:
         sort_by: str = "channel_number",
         sort_dir: str = "asc",
     ) -> PaginatedResult[Channel]:
-        """Get paginated channels with filters."""
-        stmt = select(Channel).options(
-            selectinload(Channel.groups),
-            selectinload(Channel.packages),
-        )
+        """Get a page of channels with filters, by offset or after a cursor."""
+        stmt = select(Channel).options(*CHANNEL_LIST)
 
         # Apply filters
         if search:
-            search_filter = f"%{search}%"
-            search_conditions = [
-                Channel.stream_name.ilike(search_filter),
-                Channel.display_name.ilike(search_filter),
-                Channel.tvg_name.ilike(search_filter),
-                Channel.tvg_id.ilike(search_filter),
-            ]
+            search_conditions = [matches([*SEARCH_COLUMNS, Channel.tvg_id], search)]
             if search.isdigit():
                 search_number = int(search)
                 search_conditions.extend(
@@ -85,55 +84,44 @@ class ChannelService:
         if sync_status is not None:
             stmt = stmt.where(Channel.sync_status == sync_status)
 
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        result = await self.db.execute(count_stmt)
-        total = result.scalar() or 0
-
-        # Apply sorting
-        sort_column = getattr(Channel, sort_by, Channel.sort_order)
-        if sort_by == "channel_number":
-            sort_column = (
-                sort_column.desc().nulls_last()
-                if sort_dir == "desc"
-                else sort_column.asc().nulls_last()
-            )
-        elif sort_dir == "desc":
-            sort_column = sort_column.desc()
-
-        # For grouped sorting: group.sort_order (nulls last), then channel.sort_order.
+        filtered = stmt
         if sort_by == "sort_order":
+            # Grouped order: group.sort_order (nulls last), then channel.sort_order.
             group_sort = self._group_sort_subquery()
-            stmt = stmt.outerjoin(group_sort, group_sort.c.channel_id == Channel.id).order_by(
-                group_sort.c.group_sort.asc().nulls_last(),
-                Channel.sort_order.asc(),
-            )
+            stmt = stmt.outerjoin(group_sort, group_sort.c.channel_id == Channel.id)
+            keys = [
+                SortKey("group_sort", group_sort.c.group_sort),
+                SortKey("sort_order", Channel.sort_order),
+            ]
         else:
-            stmt = stmt.order_by(sort_column)
-
-        # Apply pagination
-        stmt = stmt.offset(pagination.offset).limit(pagination.limit)
-
-        result = await self.db.execute(stmt)
-        items = list(result.scalars().all())
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=pagination.page,
-            per_page=pagination.per_page,
+            column = Channel.__table__.c.get(sort_by)
+            sort_column = Channel.sort_order if column is None else getattr(Channel, column.key)
+            keys = [SortKey(sort_by, sort_column, sort_dir == "desc")]
+        keys.append(SortKey("id", Channel.id))
+
+        count_key = (
+            "channels",
+            search.lower() if search else None,
+            group_id,
+            package_id,
+            without_group and group_id is None,
+            without_package and package_id is None,
+            source,
+            sync_status,
         )
-
-    async def get_by_id(self, channel_id: int) -> Channel:
-        """Get channel by ID."""
-        stmt = (
-            select(Channel)
-            .where(Channel.id == channel_id)
-            .options(
-                selectinload(Channel.groups),
-                selectinload(Channel.packages),
-            )
+        return await paginate(
+            self.db,
+            stmt,
+            keys,
+            pagination,
+            count_stmt=filtered,
+            count_key=count_key,
+            count_tables=COUNT_TABLES,
         )
+
+    async def get_by_id(self, channel_id: int, profile: LoadProfile = CHANNEL_DETAIL) -> Channel:
+        """Get channel by ID, loading the relationships of ``profile``."""
+        stmt = select(Channel).where(Channel.id == channel_id).options(*profile)
         result = await self.db.execute(stmt)
         channel = result.scalar_one_or_none()
 
@@ -150,7 +138,7 @@ class ChannelService:
         channel_number: int | None = None,
     ) -> Channel:
         """Update channel (UI-managed fields only)."""
-        channel = await self.get_by_id(channel_id)
+        channel = await self.get_by_id(channel_id, BARE)
 
         if tvg_id is not None:
             channel.tvg_id = tvg_id if tvg_id else None
@@ -167,16 +155,10 @@ class ChannelService:
         updates: list[dict],
     ) -> int:
         """Bulk update multiple channels. Returns count of updated channels."""
+        channels = await self._get_many([item.get("id") for item in updates])
         updated_count = 0
         for item in updates:
-            channel_id = item.get("id")
-            if not channel_id:
-                continue
-
-            stmt = select(Channel).where(Channel.id == channel_id)
-            result = await self.db.execute(stmt)
-            channel = result.scalar_one_or_none()
-
+            channel = channels.get(item.get("id"))
             if channel is None:
                 continue
 
@@ -223,7 +205,7 @@ class ChannelService:
 
     async def delete(self, channel_id: int, force: bool = False) -> None:
         """Delete a channel. By default only orphaned channels can be deleted."""
-        channel = await self.get_by_id(channel_id)
+        channel = await self.get_by_id(channel_id, BARE)
 
         if not force and channel.sync_status != SyncStatus.ORPHANED:
             raise ValidationError("Can only delete orphaned channels")
@@ -262,7 +244,7 @@ class ChannelService:
         stmt = (
             select(Channel)
             .outerjoin(group_sort, group_sort.c.channel_id == Channel.id)
-            .options(selectinload(Channel.groups))
+            .options(*CHANNEL_PLAYLIST)
             .order_by(
                 group_sort.c.group_sort.asc().nulls_last(),
                 Channel.sort_order.asc(),
@@ -282,13 +264,9 @@ class ChannelService:
         if source is not None:
             stmt = stmt.where(Channel.source == source)
         if search:
-            search_filter = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    Channel.stream_name.ilike(search_filter),
-                    Channel.display_name.ilike(search_filter),
-                    Channel.tvg_name.ilike(search_filter),
-                )
+            dialect = self.db.get_bind().dialect.name
+            stmt = stmt.where(matches(SEARCH_COLUMNS, search)).order_by(
+                relevance(dialect, SEARCH_COLUMNS, search)
             )
         stmt = stmt.order_by(
             Channel.display_name.asc().nulls_last(),
@@ -300,10 +278,17 @@ class ChannelService:
 
     async def reorder(self, order: list[dict[str, int]]) -> None:
         """Reorder channels, preserving current behavior of ignoring missing IDs."""
+        channels = await self._get_many([item["id"] for item in order])
         for item in order:
-            stmt = select(Channel).where(Channel.id == item["id"])
-            result = await self.db.execute(stmt)
-            channel = result.scalar_one_or_none()
+            channel = channels.get(item["id"])
             if channel:
                 channel.sort_order = item["sort_order"]
         await self.db.flush()
+
+    async def _get_many(self, channel_ids: list[int | None]) -> dict[int, Channel]:
+        """Load channels by ID in one query; unknown IDs are left out."""
+        ids = {channel_id for channel_id in channel_ids if channel_id}
+        if not ids:
+            return {}
+        result = await self.db.execute(select(Channel).where(Channel.id.in_(ids)))
+        return {channel.id: channel for channel in result.scalars().all()}
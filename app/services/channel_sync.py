@@ -1,12 +1,14 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.clients.stream_provider import get_stream_provider
+from app.config import get_settings
 from app.models import Channel, StreamSource, SyncStatus
+from app.services.auth_sync import AuthSyncService
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,10 @@ class SyncResult:
     new: int
     updated: int
     orphaned: int
+    revived: int = 0
+    changed_channel_ids: set[int] = field(default_factory=set)
+    auth_users_synced: int = 0
+    auth_propagation_skipped: bool = False
 
 
 class ChannelSyncService:
@@ -38,6 +44,12 @@ class ChannelSyncService:
            - If exists in DB: update provider-managed fields only
            - If not in DB: create new channel
         3. Mark channels missing from the provider as orphaned within that provider only
+        4. Commit, then push Auth updates to users entitled to orphaned or
+           revived channels
+
+        Propagation is skipped when the provider returned no streams or the
+        share of newly orphaned channels exceeds ``channel_sync_max_orphan_ratio``,
+        since a truncated listing would otherwise revoke access for every user.
         """
         provider = get_stream_provider(source)
         logger.info("Starting channel sync from %s", source.value)
@@ -48,14 +60,14 @@ class ChannelSyncService:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         new_count = 0
         updated_count = 0
+        changed_channel_ids: set[int] = set()
+        revived_count = 0
+
+        result = await self.db.execute(select(Channel).where(Channel.source == source))
+        channels = {channel.stream_name: channel for channel in result.scalars().all()}
 
         for stream in streams:
-            stmt = select(Channel).where(
-                Channel.source == source,
-                Channel.stream_name == stream.name,
-            )
-            result = await self.db.execute(stmt)
-            channel = result.scalar_one_or_none()
+            channel = channels.get(stream.name)
 
             if channel is None:
                 channel = Channel(
@@ -68,8 +80,12 @@ class ChannelSyncService:
                     last_seen_at=now,
                 )
                 self.db.add(channel)
+                channels[stream.name] = channel
                 new_count += 1
             else:
+                if channel.sync_status == SyncStatus.ORPHANED:
+                    changed_channel_ids.add(channel.id)
+                    revived_count += 1
                 channel.tvg_name = stream.title
                 channel.display_name = stream.title
                 channel.catchup_days = stream.catchup_days
@@ -77,27 +93,49 @@ class ChannelSyncService:
                 channel.last_seen_at = now
                 updated_count += 1
 
-        stmt = select(Channel).where(Channel.source == source)
-        if stream_names:
-            stmt = stmt.where(Channel.stream_name.notin_(stream_names))
-        result = await self.db.execute(stmt)
-        orphaned_channels = result.scalars().all()
-
         orphaned_count = 0
-        for channel in orphaned_channels:
-            if channel.sync_status != SyncStatus.ORPHANED:
+        for name, channel in channels.items():
+            if name not in stream_names and channel.sync_status != SyncStatus.ORPHANED:
                 channel.sync_status = SyncStatus.ORPHANED
+                changed_channel_ids.add(channel.id)
                 orphaned_count += 1
 
         await self.db.flush()
+        # Auth must only see channel changes that are actually persisted.
+        await self.db.commit()
+
+        auth_users_synced = 0
+        auth_propagation_skipped = False
+        if changed_channel_ids:
+            previously_synced = updated_count - revived_count + orphaned_count
+            orphan_ratio = orphaned_count / previously_synced if previously_synced else 0.0
+            max_orphan_ratio = get_settings().channel_sync_max_orphan_ratio
+            if not streams or orphan_ratio > max_orphan_ratio:
+                auth_propagation_skipped = True
+                logger.warning(
+                    "Skipping Auth propagation for %s sync: %d streams returned, "
+                    "%d of %d channels orphaned (limit %.0f%%)",
+                    source.value,
+                    len(streams),
+                    orphaned_count,
+                    previously_synced,
+                    max_orphan_ratio * 100,
+                )
+            else:
+                auth_users_synced = await AuthSyncService(self.db).propagate_channel_changes(
+                    changed_channel_ids
+                )
 
         logger.info(
-            "Channel sync complete for %s: total=%d, new=%d, updated=%d, orphaned=%d",
+            "Channel sync complete for %s: total=%d, new=%d, updated=%d, orphaned=%d, "
+            "revived=%d, auth_users_synced=%d",
             source.value,
             len(streams),
             new_count,
             updated_count,
             orphaned_count,
+            revived_count,
+            auth_users_synced,
         )
 
         return SyncResult(
@@ -106,4 +144,8 @@ class ChannelSyncService:
             new=new_count,
             updated=updated_count,
             orphaned=orphaned_count,
+            revived=revived_count,
+            changed_channel_ids=changed_channel_ids,
+            auth_users_synced=auth_users_synced,
+            auth_propagation_skipped=auth_propagation_skipped,
         )
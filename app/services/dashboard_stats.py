@@ -0,0 +1,226 @@
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models import Channel, Group, Package, SyncStatus, Tariff, User, UserStatus
+
+logger = logging.getLogger(__name__)
+
+_DELTAS_KEY = "dashboard_counter_deltas"
+_LAST_SEEN_KEY = "dashboard_counter_last_seen"
+
+
+@dataclass(frozen=True)
+class DashboardCounts:
+    channels_total: int
+    channels_synced: int
+    groups: int
+    packages: int
+    tariffs: int
+    users: int
+    users_enabled: int
+    last_sync: datetime | None
+
+    @property
+    def channels_orphaned(self) -> int:
+        return self.channels_total - self.channels_synced
+
+    @property
+    def users_disabled(self) -> int:
+        return self.users - self.users_enabled
+
+
+class DashboardService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_counts(self) -> DashboardCounts:
+        """Get dashboard counters, from the in-memory cache when it is enabled."""
+        settings = get_settings()
+        if not settings.dashboard_counters_enabled:
+            return await self.count_all()
+        return await dashboard_counters.get(self, settings.dashboard_counters_resync_seconds)
+
+    async def count_all(self) -> DashboardCounts:
+        """Count every dashboard entity in a single aggregate statement."""
+        stmt = select(
+            select(func.count()).select_from(Channel).scalar_subquery().label("channels_total"),
+            select(func.count())
+            .select_from(Channel)
+            .where(Channel.sync_status == SyncStatus.SYNCED)
+            .scalar_subquery()
+            .label("channels_synced"),
+            select(func.count()).select_from(Group).scalar_subquery().label("groups"),
+            select(func.count()).select_from(Package).scalar_subquery().label("packages"),
+            select(func.count()).select_from(Tariff).scalar_subquery().label("tariffs"),
+            select(func.count()).select_from(User).scalar_subquery().label("users"),
+            select(func.count())
+            .select_from(User)
+            .where(User.status == UserStatus.ENABLED)
+            .scalar_subquery()
+            .label("users_enabled"),
+            select(func.max(Channel.last_seen_at)).scalar_subquery().label("last_sync"),
+        )
+        row = (await self.db.execute(stmt)).one()
+        return DashboardCounts(
+            channels_total=row.channels_total or 0,
+            channels_synced=row.channels_synced or 0,
+            groups=row.groups or 0,
+            packages=row.packages or 0,
+            tariffs=row.tariffs or 0,
+            users=row.users or 0,
+            users_enabled=row.users_enabled or 0,
+            last_sync=row.last_sync,
+        )
+
+
+class DashboardCounters:
+    """
+    In-memory dashboard counters kept current by committed ORM writes.
+
+    Deltas are collected from each flush and applied only when the transaction
+    commits. Writes made by other workers are not seen, so the counters are
+    reloaded with one aggregate query every ``resync_seconds``.
+    """
+
+    def __init__(self) -> None:
+        self._counts: DashboardCounts | None = None
+        self._expires_at = 0.0
+        self._version = 0
+
+    async def get(self, service: DashboardService, resync_seconds: float) -> DashboardCounts:
+        if self._counts is not None and time.monotonic() < self._expires_at:
+            return self._counts
+
+        version = self._version
+        counts = await service.count_all()
+        self._counts = counts
+        # A commit that landed while counting may or may not be included; recount next time.
+        self._expires_at = time.monotonic() + resync_seconds if version == self._version else 0.0
+        return counts
+
+    def apply(self, deltas: Counter[str], last_seen: datetime | None) -> None:
+        self._version += 1
+        if self._counts is None:
+            return
+
+        counts = self._counts
+        last_sync = counts.last_sync
+        if last_seen is not None and (last_sync is None or last_seen > last_sync):
+            last_sync = last_seen
+        self._counts = replace(
+            counts,
+            channels_total=counts.channels_total + deltas["channels_total"],
+            channels_synced=counts.channels_synced + deltas["channels_synced"],
+            groups=counts.groups + deltas["groups"],
+            packages=counts.packages + deltas["packages"],
+            tariffs=counts.tariffs + deltas["tariffs"],
+            users=counts.users + deltas["users"],
+            users_enabled=counts.users_enabled + deltas["users_enabled"],
+            last_sync=last_sync,
+        )
+
+    def reset(self) -> None:
+        self._counts = None
+        self._expires_at = 0.0
+
+
+dashboard_counters = DashboardCounters()
+
+_TOTAL_KEYS: dict[type, str] = {
+    Channel: "channels_total",
+    Group: "groups",
+    Package: "packages",
+    Tariff: "tariffs",
+    User: "users",
+}
+
+
+def _is_synced(value: Any) -> bool:
+    return value == SyncStatus.SYNCED
+
+
+def _is_enabled(value: Any) -> bool:
+    return value == UserStatus.ENABLED
+
+
+def _status_change(obj: Any, attr: str) -> tuple[Any, Any] | None:
+    history = inspect(obj).attrs[attr].history
+    if not history.has_changes():
+        return None
+    old = history.deleted[0] if history.deleted else None
+    new = history.added[0] if history.added else None
+    return old, new
+
+
+def _collect_deltas(session: Session, _flush_context: Any) -> None:
+    deltas: Counter[str] = session.info.setdefault(_DELTAS_KEY, Counter())
+
+    for obj in session.new:
+        key = _TOTAL_KEYS.get(type(obj))
+        if key is None:
+            continue
+        deltas[key] += 1
+        if isinstance(obj, Channel):
+            deltas["channels_synced"] += _is_synced(obj.sync_status)
+            _track_last_seen(session, obj.last_seen_at)
+        elif isinstance(obj, User):
+            deltas["users_enabled"] += _is_enabled(obj.status)
+
+    for obj in session.deleted:
+        key = _TOTAL_KEYS.get(type(obj))
+        if key is None:
+            continue
+        deltas[key] -= 1
+        if isinstance(obj, Channel):
+            deltas["channels_synced"] -= _is_synced(obj.sync_status)
+        elif isinstance(obj, User):
+            deltas["users_enabled"] -= _is_enabled(obj.status)
+
+    for obj in session.dirty:
+        if isinstance(obj, Channel):
+            change = _status_change(obj, "sync_status")
+            if change is not None:
+                deltas["channels_synced"] += _is_synced(change[1]) - _is_synced(change[0])
+            if _status_change(obj, "last_seen_at") is not None:
+                _track_last_seen(session, obj.last_seen_at)
+        elif isinstance(obj, User):
+            change = _status_change(obj, "status")
+            if change is not None:
+                deltas["users_enabled"] += _is_enabled(change[1]) - _is_enabled(change[0])
+
+
+def _track_last_seen(session: Session, value: datetime | None) -> None:
+    current = session.info.get(_LAST_SEEN_KEY)
+    if value is not None and (current is None or value > current):
+        session.info[_LAST_SEEN_KEY] = value
+
+
+def _apply_deltas(session: Session) -> None:
+    deltas = session.info.pop(_DELTAS_KEY, None)
+    last_seen = session.info.pop(_LAST_SEEN_KEY, None)
+    if deltas or last_seen is not None:
+        dashboard_counters.apply(deltas or Counter(), last_seen)
+
+
+def _discard_deltas(session: Session, *_args: Any) -> None:
+    session.info.pop(_DELTAS_KEY, None)
+    session.info.pop(_LAST_SEEN_KEY, None)
+
+
+def install_dashboard_counter_listeners() -> None:
+    """Feed committed Channel/Group/Package/Tariff/User writes into ``dashboard_counters``."""
+    if event.contains(Session, "after_flush", _collect_deltas):
+        return
+    event.listen(Session, "after_flush", _collect_deltas)
+    event.listen(Session, "after_commit", _apply_deltas)
+    event.listen(Session, "after_rollback", _discard_deltas)
+    logger.info("Dashboard counter cache enabled")
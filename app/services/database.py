@@ -1,8 +1,11 @@
+import asyncio
 import logging
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import get_settings
 
@@ -24,6 +27,85 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+read_engine: AsyncEngine | None = (
+    create_async_engine(
+        settings.async_database_read_url,
+        pool_size=settings.db_read_pool_size,
+        max_overflow=settings.db_read_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        echo=settings.db_echo,
+    )
+    if settings.async_database_read_url
+    else None
+)
+
+# Seconds the replica is behind; 0 when it has replayed everything it received.
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReadRouter:
+    """
+    Route read-only sessions to the replica while it is reachable and caught up.
+
+    Replica lag is checked at most every ``DB_READ_CHECK_SECONDS``; while it
+    exceeds ``DB_READ_MAX_LAG_SECONDS`` or the check fails, reads go to the
+    primary. Without ``DATABASE_READ_URL`` every read uses the primary.
+    """
+
+    def __init__(self, replica: AsyncEngine | None) -> None:
+        self.replica = replica
+        self._replica_factory = (
+            async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+            if replica is not None
+            else None
+        )
+        self._use_replica: bool | None = None  # unknown until the first check
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._replica_factory is None:
+            return async_session_factory
+        if time.monotonic() - self._checked_at >= get_settings().db_read_check_seconds:
+            async with self._lock:
+                if time.monotonic() - self._checked_at >= get_settings().db_read_check_seconds:
+                    await self._check()
+        return self._replica_factory if self._use_replica else async_session_factory
+
+    async def _check(self) -> None:
+        max_lag = get_settings().db_read_max_lag_seconds
+        try:
+            lag = await asyncio.wait_for(self._replica_lag(self.replica), timeout=max_lag)
+        except (SQLAlchemyError, OSError, TimeoutError) as e:
+            healthy, reason = False, f"check failed: {e}"
+        else:
+            healthy, reason = lag <= max_lag, f"lag {lag:.1f}s"
+        if healthy and self._use_replica is not True:
+            logger.info("Reading from replica (%s)", reason)
+        elif not healthy and self._use_replica is not False:
+            logger.warning("Read replica bypassed, reading from primary (%s)", reason)
+        self._use_replica = healthy
+        self._checked_at = time.monotonic()
+
+    @staticmethod
+    async def _replica_lag(replica: AsyncEngine) -> float:
+        async with replica.connect() as conn:
+            if replica.dialect.name != "postgresql":
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            return float((await conn.execute(REPLICA_LAG_SQL)).scalar() or 0)
+
+
+read_router = ReadRouter(read_engine)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
@@ -34,3 +116,10 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             logger.error("Database error, rolling back transaction: %s", e)
             await session.rollback()
             raise
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only requests: the replica when usable, never committed."""
+    factory = await read_router.session_factory()
+    async with factory() as session:
+        yield session
@@ -85,10 +85,11 @@ class GroupService:
 
     async def reorder(self, order: list[dict[str, int]]) -> None:
         """Reorder groups, preserving current behavior of ignoring missing IDs."""
+        ids = {item["id"] for item in order}
+        result = await self.db.execute(select(Group).where(Group.id.in_(ids)))
+        groups = {group.id: group for group in result.scalars().all()}
         for item in order:
-            stmt = select(Group).where(Group.id == item["id"])
-            result = await self.db.execute(stmt)
-            group = result.scalar_one_or_none()
+            group = groups.get(item["id"])
             if group:
                 group.sort_order = item["sort_order"]
         await self.db.flush()
@@ -0,0 +1,43 @@
+"""
+Named eager-loading profiles, one per use case.
+
+Every relationship in ``app.models`` is ``lazy="raise"``: touching a
+collection the query did not load raises instead of quietly issuing more
+queries. Queries pass the profile matching what their caller reads.
+"""
+
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.models import Channel, Package, Tariff, User
+
+LoadProfile = tuple[ExecutableOption, ...]
+
+# Columns only.
+BARE: LoadProfile = ()
+
+# ChannelResponse: groups and packages of each channel.
+CHANNEL_LIST: LoadProfile = (selectinload(Channel.groups), selectinload(Channel.packages))
+CHANNEL_DETAIL: LoadProfile = CHANNEL_LIST
+# Playlist entries need the group title of each channel.
+CHANNEL_PLAYLIST: LoadProfile = (selectinload(Channel.groups),)
+
+# PackageDetail: the package's channels.
+PACKAGE_DETAIL: LoadProfile = (selectinload(Package.channels),)
+
+# TariffResponse and the tariff list: the tariff's packages.
+TARIFF_LIST: LoadProfile = (selectinload(Tariff.packages),)
+TARIFF_DETAIL: LoadProfile = TARIFF_LIST
+
+# UserListItem shows tariffs only.
+USER_LIST: LoadProfile = (selectinload(User.tariffs),)
+# UserResponse: direct tariffs, packages and channels (not their contents).
+USER_DETAIL: LoadProfile = (
+    selectinload(User.tariffs),
+    selectinload(User.packages),
+    selectinload(User.channels),
+)
+# Playlists and Auth pushes read user columns; channels and allowed streams
+# are resolved with dedicated queries (UserService.resolve_channels*).
+USER_PLAYLIST: LoadProfile = BARE
+USER_AUTH_SYNC: LoadProfile = BARE
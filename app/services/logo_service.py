@@ -3,9 +3,9 @@ from pathlib import Path
 from urllib.parse import urlparse
 from uuid import uuid4
 
-import httpx
 from fastapi import UploadFile
 
+from app.clients import http
 from app.exceptions import ValidationError
 
 BASE_DIR = Path(__file__).resolve().parents[2]
@@ -125,20 +125,19 @@ async def save_logo_url(
     if not url:
         raise ValidationError("Logo URL is required")
 
-    timeout = httpx.Timeout(10.0, connect=5.0)
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        async with client.stream("GET", url) as response:
-            if response.status_code >= 400:
-                raise ValidationError("Failed to download logo")
-
-            content_type = response.headers.get("Content-Type", "")
-            if content_type and not content_type.startswith("image/"):
-                raise ValidationError("Logo URL must point to an image")
-
-            data = bytearray()
-            async for chunk in response.aiter_bytes():
-                data.extend(chunk)
-                if len(data) > MAX_LOGO_BYTES:
-                    raise ValidationError("Logo exceeds 2MB limit")
+    client = http.http_clients.get(http.LOGOS)
+    async with client.stream("GET", url) as response:
+        if response.status_code >= 400:
+            raise ValidationError("Failed to download logo")
+
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.startswith("image/"):
+            raise ValidationError("Logo URL must point to an image")
+
+        data = bytearray()
+        async for chunk in response.aiter_bytes():
+            data.extend(chunk)
+            if len(data) > MAX_LOGO_BYTES:
+                raise ValidationError("Logo exceeds 2MB limit")
 
     return await save_logo_bytes(bytes(data), stream_name=stream_name, channel_id=channel_id)
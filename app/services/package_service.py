@@ -1,9 +1,9 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.exceptions import DuplicateEntryError, NotFoundError
 from app.models import Package, package_channels, tariff_packages, user_packages
+from app.services.load_profiles import BARE, PACKAGE_DETAIL, LoadProfile
 
 
 class PackageService:
@@ -25,13 +25,9 @@ class PackageService:
         if result.scalar_one_or_none() is not None:
             raise DuplicateEntryError(f"Package '{name}' already exists")
 
-    async def get_by_id(self, package_id: int) -> Package:
-        """Get package by ID with channels."""
-        stmt = (
-            select(Package)
-            .where(Package.id == package_id)
-            .options(selectinload(Package.channels))
-        )
+    async def get_by_id(self, package_id: int, profile: LoadProfile = PACKAGE_DETAIL) -> Package:
+        """Get package by ID, with its channels unless ``profile`` says otherwise."""
+        stmt = select(Package).where(Package.id == package_id).options(*profile)
         result = await self.db.execute(stmt)
         package = result.scalar_one_or_none()
 
@@ -42,7 +38,7 @@ class PackageService:
 
     async def get_all(self) -> list[Package]:
         """Get all packages."""
-        stmt = select(Package).options(selectinload(Package.channels)).order_by(Package.name)
+        stmt = select(Package).order_by(Package.name)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
@@ -64,7 +60,7 @@ class PackageService:
         package = Package(name=name, description=description)
         self.db.add(package)
         await self.db.flush()
-        return await self.get_by_id(package.id)
+        return await self.get_by_id(package.id, BARE)
 
     async def update(
         self,
@@ -73,7 +69,7 @@ class PackageService:
         description: str | None = None,
     ) -> Package:
         """Update a package."""
-        package = await self.get_by_id(package_id)
+        package = await self.get_by_id(package_id, BARE)
 
         if name is not None:
             await self._ensure_name_available(name, exclude_id=package_id)
@@ -83,11 +79,11 @@ class PackageService:
             package.description = description
 
         await self.db.flush()
-        return await self.get_by_id(package_id)
+        return await self.get_by_id(package_id, BARE)
 
     async def delete(self, package_id: int) -> dict[str, int]:
         """Delete a package. Returns affected counts."""
-        package = await self.get_by_id(package_id)
+        package = await self.get_by_id(package_id, BARE)
 
         # Count affected tariffs
         stmt = (
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "auth_resync_pending_user_ids"
+
+
+@dataclass(frozen=True)
+class ResyncQueueStats:
+    enabled: bool
+    depth: int
+    requested: int
+    pushed: int
+    merge_ratio: float | None
+
+
+class ResyncQueue:
+    """
+    Debounced, coalescing queue of users waiting for an Auth resync.
+
+    User IDs are collected until no new ones arrived for
+    ``AUTH_RESYNC_DEBOUNCE_SECONDS`` (or ``AUTH_RESYNC_MAX_WAIT_SECONDS`` passed
+    since the first one), then pushed once each. A burst of admin edits
+    touching the same users therefore costs one push per user, made with the
+    state after the last edit.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._push: Callable[[list[int]], Awaitable[None]] | None = None
+        self._pending: dict[int, None] = {}
+        self._first_added_at = 0.0
+        self._last_added_at = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._requested = 0
+        self._pushed = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._push is not None
+
+    def start(self, push: Callable[[list[int]], Awaitable[None]]) -> None:
+        if get_settings().auth_resync_debounce_seconds <= 0 or self._push is not None:
+            return
+        self._push = push
+        if not event.contains(Session, "after_commit", _enqueue_committed):
+            event.listen(Session, "after_commit", _enqueue_committed)
+            event.listen(Session, "after_rollback", _discard_pending)
+        logger.info(
+            "Auth resync debounce enabled (%gs)", get_settings().auth_resync_debounce_seconds
+        )
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        self._push = None
+
+    def add_after_commit(self, db: AsyncSession, user_ids: Iterable[int]) -> None:
+        """Queue users once ``db`` commits, so the push sees the committed state."""
+        db.sync_session.info.setdefault(_PENDING_KEY, {}).update(dict.fromkeys(user_ids))
+
+    def add(self, user_ids: Iterable[int]) -> None:
+        now = self._clock()
+        for user_id in user_ids:
+            self._requested += 1
+            if not self._pending:
+                self._first_added_at = now
+            self._pending[user_id] = None
+            self._last_added_at = now
+        if self._pending and self._task is None and self._push is not None:
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Push everything pending now."""
+        user_ids, self._pending = list(self._pending), {}
+        if not user_ids or self._push is None:
+            return
+        self._pushed += len(user_ids)
+        try:
+            await self._push(user_ids)
+        except Exception:
+            logger.exception("Debounced Auth resync of %d users failed", len(user_ids))
+
+    def stats(self) -> ResyncQueueStats:
+        return ResyncQueueStats(
+            enabled=self.enabled,
+            depth=len(self._pending),
+            requested=self._requested,
+            pushed=self._pushed,
+            merge_ratio=(
+                1 - (self._pushed + len(self._pending)) / self._requested
+                if self._requested
+                else None
+            ),
+        )
+
+    async def _run(self) -> None:
+        settings = get_settings()
+        try:
+            while self._pending:
+                now = self._clock()
+                due_at = min(
+                    self._last_added_at + settings.auth_resync_debounce_seconds,
+                    self._first_added_at + settings.auth_resync_max_wait_seconds,
+                )
+                if now < due_at:
+                    await asyncio.sleep(due_at - now)
+                    continue
+                await self.flush()
+        finally:
+            if asyncio.current_task() is self._task:
+                self._task = None
+
+
+def _enqueue_committed(session: Session) -> None:
+    user_ids = session.info.pop(_PENDING_KEY, None)
+    if user_ids:
+        auth_resync_queue.add(user_ids)
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+auth_resync_queue = ResyncQueue()
@@ -1,9 +1,9 @@
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.exceptions import DuplicateEntryError, NotFoundError
 from app.models import Package, Tariff, package_channels, tariff_packages, user_tariffs
+from app.services.load_profiles import BARE, TARIFF_DETAIL, TARIFF_LIST, LoadProfile
 
 
 class TariffService:
@@ -25,13 +25,9 @@ class TariffService:
         if result.scalar_one_or_none() is not None:
             raise DuplicateEntryError(f"Tariff '{name}' already exists")
 
-    async def get_by_id(self, tariff_id: int) -> Tariff:
-        """Get tariff by ID with packages."""
-        stmt = (
-            select(Tariff)
-            .where(Tariff.id == tariff_id)
-            .options(selectinload(Tariff.packages))
-        )
+    async def get_by_id(self, tariff_id: int, profile: LoadProfile = TARIFF_DETAIL) -> Tariff:
+        """Get tariff by ID, with its packages unless ``profile`` says otherwise."""
+        stmt = select(Tariff).where(Tariff.id == tariff_id).options(*profile)
         result = await self.db.execute(stmt)
         tariff = result.scalar_one_or_none()
 
@@ -42,7 +38,7 @@ class TariffService:
 
     async def get_all(self) -> list[Tariff]:
         """Get all tariffs."""
-        stmt = select(Tariff).options(selectinload(Tariff.packages)).order_by(Tariff.name)
+        stmt = select(Tariff).order_by(Tariff.name)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
@@ -58,7 +54,7 @@ class TariffService:
             .outerjoin(package_channels, tariff_packages.c.package_id == package_channels.c.package_id)
             .group_by(Tariff.id)
             .order_by(Tariff.name)
-            .options(selectinload(Tariff.packages))
+            .options(*TARIFF_LIST)
         )
         result = await self.db.execute(stmt)
         return [(row.Tariff, row.package_count, row.channel_count) for row in result.all()]
@@ -110,7 +106,7 @@ class TariffService:
 
     async def delete(self, tariff_id: int) -> dict[str, int]:
         """Delete a tariff. Returns affected user count."""
-        tariff = await self.get_by_id(tariff_id)
+        tariff = await self.get_by_id(tariff_id, BARE)
 
         # Count affected users
         stmt = (
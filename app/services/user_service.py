@@ -1,13 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import func, or_, select, union
+from sqlalchemy import or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.exceptions import DuplicateEntryError, NotFoundError
 from app.models import (
     Channel,
     Package,
+    SyncStatus,
     Tariff,
     User,
     UserStatus,
@@ -17,11 +17,27 @@ from app.models import (
     user_packages,
     user_tariffs,
 )
+from app.services.load_profiles import (
+    BARE,
+    CHANNEL_PLAYLIST,
+    USER_AUTH_SYNC,
+    USER_DETAIL,
+    USER_LIST,
+    LoadProfile,
+)
 from app.services.playlist_generator import PlaylistGenerator
+from app.utils.keyset import SortKey, paginate
 from app.utils.pagination import PaginatedResult, PaginationParams
+from app.utils.search import matches
 from app.utils.token import generate_token
 
 
+RESOLVE_CHUNK_SIZE = 500
+
+# Tables the filtered user count reads; writing any of them recounts it.
+COUNT_TABLES = (User.__tablename__, user_tariffs.name)
+
+
 class UserService:
     not_found_message = "User not found"
 
@@ -41,17 +57,9 @@ class UserService:
         if result.scalar_one_or_none() is not None:
             raise DuplicateEntryError(f"Agreement number '{agreement_number}' already exists")
 
-    async def get_by_id(self, user_id: int) -> User:
-        """Get user by ID with all relationships."""
-        stmt = (
-            select(User)
-            .where(User.id == user_id)
-            .options(
-                selectinload(User.tariffs).selectinload(Tariff.packages),
-                selectinload(User.packages).selectinload(Package.channels),
-                selectinload(User.channels),
-            )
-        )
+    async def get_by_id(self, user_id: int, profile: LoadProfile = USER_DETAIL) -> User:
+        """Get user by ID, loading the relationships of ``profile``."""
+        stmt = select(User).where(User.id == user_id).options(*profile)
         result = await self.db.execute(stmt)
         user = result.scalar_one_or_none()
 
@@ -82,20 +90,13 @@ class UserService:
         sort_by: str = "name",
         sort_dir: str = "asc",
     ) -> PaginatedResult[User]:
-        """Get paginated users with filters."""
-        stmt = select(User).options(
-            selectinload(User.tariffs),
-            selectinload(User.packages),
-            selectinload(User.channels),
-        )
+        """Get a page of users with filters, by offset or after a cursor."""
+        stmt = select(User).options(*USER_LIST)
 
         # Apply filters
         if search:
-            search_filter = f"%{search}%"
             search_conditions = [
-                User.first_name.ilike(search_filter),
-                User.last_name.ilike(search_filter),
-                User.agreement_number.ilike(search_filter),
+                matches([User.first_name, User.last_name, User.agreement_number], search)
             ]
             if search.isdigit():
                 search_conditions.append(User.id == int(search))
@@ -107,12 +108,6 @@ class UserService:
         if tariff_id is not None:
             stmt = stmt.join(User.tariffs).where(Tariff.id == tariff_id)
 
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        result = await self.db.execute(count_stmt)
-        total = result.scalar() or 0
-
-        # Apply sorting and pagination
         sort_map = {
             "name": (User.last_name, User.first_name),
             "agreement_number": (User.agreement_number,),
@@ -120,23 +115,16 @@ class UserService:
             "status": (User.status,),
             "created_at": (User.created_at,),
         }
-        sort_columns = sort_map.get(sort_by, sort_map["name"])
-        if sort_dir == "desc":
-            sort_columns = tuple(column.desc() for column in sort_columns)
-        else:
-            sort_columns = tuple(column.asc() for column in sort_columns)
-
-        stmt = stmt.order_by(*sort_columns)
-        stmt = stmt.offset(pagination.offset).limit(pagination.limit)
-
-        result = await self.db.execute(stmt)
-        items = list(result.scalars().unique().all())
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=pagination.page,
-            per_page=pagination.per_page,
+        if sort_by not in sort_map:
+            sort_by = "name"
+        keys = [
+            SortKey(column.key, column, sort_dir == "desc") for column in sort_map[sort_by]
+        ]
+        keys.append(SortKey("id", User.id))
+
+        count_key = ("users", search.lower() if search else None, status, tariff_id)
+        return await paginate(
+            self.db, stmt, keys, pagination, count_key=count_key, count_tables=COUNT_TABLES
         )
 
     async def create(
@@ -259,14 +247,14 @@ class UserService:
 
     async def delete(self, user_id: int) -> User:
         """Delete a user. Returns the user for auth service cleanup."""
-        user = await self.get_by_id(user_id)
+        user = await self.get_by_id(user_id, USER_AUTH_SYNC)
         await self.db.delete(user)
         await self.db.flush()
         return user
 
     async def regenerate_token(self, user_id: int) -> User:
         """Regenerate user's token."""
-        user = await self.get_by_id(user_id)
+        user = await self.get_by_id(user_id, BARE)
         user.token = generate_token()
         await self.db.flush()
         return await self.get_by_id(user_id)
@@ -322,7 +310,7 @@ class UserService:
         stmt = (
             select(Channel)
             .where(Channel.id.in_(channel_ids))
-            .options(selectinload(Channel.groups))
+            .options(*CHANNEL_PLAYLIST)
             .order_by(
                 Channel.channel_number.asc().nulls_last(),
                 Channel.sort_order.asc(),
@@ -332,8 +320,66 @@ class UserService:
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def resolve_channels_for_users(
+        self, user_ids: list[int], *, exclude_orphaned: bool = False
+    ) -> dict[int, list[str]]:
+        """
+        Resolve the stream names of many users at once.
+
+        Same sources and order as ``resolve_channels``, but one query per
+        ``RESOLVE_CHUNK_SIZE`` users returning plain rows, without loading
+        Channel objects. Every requested user is in the result; users without
+        channels map to an empty list. Stream names repeated across providers
+        are listed once.
+        """
+        streams: dict[int, dict[str, None]] = {user_id: {} for user_id in user_ids}
+        unique_ids = list(streams)
+        for start in range(0, len(unique_ids), RESOLVE_CHUNK_SIZE):
+            chunk = unique_ids[start : start + RESOLVE_CHUNK_SIZE]
+            user_channel_ids = union(
+                select(user_channels.c.user_id, user_channels.c.channel_id).where(
+                    user_channels.c.user_id.in_(chunk)
+                ),
+                select(user_packages.c.user_id, package_channels.c.channel_id)
+                .select_from(
+                    user_packages.join(
+                        package_channels,
+                        user_packages.c.package_id == package_channels.c.package_id,
+                    )
+                )
+                .where(user_packages.c.user_id.in_(chunk)),
+                select(user_tariffs.c.user_id, package_channels.c.channel_id)
+                .select_from(
+                    user_tariffs.join(
+                        tariff_packages,
+                        user_tariffs.c.tariff_id == tariff_packages.c.tariff_id,
+                    ).join(
+                        package_channels,
+                        tariff_packages.c.package_id == package_channels.c.package_id,
+                    )
+                )
+                .where(user_tariffs.c.user_id.in_(chunk)),
+            ).subquery()
+
+            stmt = (
+                select(user_channel_ids.c.user_id, Channel.stream_name)
+                .join(Channel, Channel.id == user_channel_ids.c.channel_id)
+                .order_by(
+                    user_channel_ids.c.user_id,
+                    Channel.channel_number.asc().nulls_last(),
+                    Channel.sort_order.asc(),
+                    Channel.id.asc(),
+                )
+            )
+            if exclude_orphaned:
+                stmt = stmt.where(Channel.sync_status != SyncStatus.ORPHANED)
+            result = await self.db.execute(stmt)
+            for user_id, stream_name in result:
+                streams[user_id][stream_name] = None
+        return {user_id: list(names) for user_id, names in streams.items()}
+
     async def set_auth_token_id(self, user_id: int, auth_token_id: int | None) -> None:
         """Set the auth service token ID for a user."""
-        user = await self.get_by_id(user_id)
+        user = await self.get_by_id(user_id, USER_AUTH_SYNC)
         user.auth_token_id = auth_token_id
         await self.db.flush()
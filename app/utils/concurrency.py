@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def run_bounded(
+    items: Iterable[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> list[R]:
+    """Run ``worker`` over ``items`` with at most ``concurrency`` calls in flight.
+
+    Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run_one(item: T) -> R:
+        async with semaphore:
+            return await worker(item)
+
+    return list(await asyncio.gather(*(run_one(item) for item in items)))
+
+
+async def within_budget(
+    awaitable: Awaitable[T],
+    timeout: float,
+    operation: str,
+    error: Callable[[str], Exception],
+) -> T:
+    """Await one part of a fan-out, failing only that part once its budget is spent.
+
+    A timeout is raised as ``error`` so callers can treat it like any other
+    failure of that integration.
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except TimeoutError:
+        logger.warning("Timeout during %s after %gs", operation, timeout)
+        raise error(f"Timeout during {operation} after {timeout:g}s") from None
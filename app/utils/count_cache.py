@@ -0,0 +1,110 @@
+"""
+Totals of filtered list queries, reused until a table they read is written.
+
+Every committed (or rolled back) ORM write bumps an in-process revision of
+the tables it touched: the mapped table plus the association tables of the
+object's relationships, and the target of DML run through the session. A cached
+total remembers the revisions of its tables and is recounted once any of
+them moved, so paging through one filter costs only the page query. Writes
+made by other workers are not seen; entries expire after
+``LIST_COUNT_CACHE_SECONDS`` to pick them up.
+"""
+
+import logging
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_WRITTEN_KEY = "count_cache_written_tables"
+
+
+class CountCache:
+    def __init__(self, max_entries: int = 512) -> None:
+        self.max_entries = max_entries
+        self._revisions: Counter[str] = Counter()
+        self._entries: OrderedDict[Hashable, tuple[tuple[int, ...], float, Any]] = OrderedDict()
+
+    def _revision(self, tables: Sequence[str]) -> tuple[int, ...]:
+        return tuple(self._revisions[table] for table in tables)
+
+    async def get(
+        self, key: Hashable, tables: Sequence[str], load: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Cached result of ``load`` for ``key`` while ``tables`` are unchanged."""
+        ttl = get_settings().list_count_cache_seconds
+        if ttl <= 0:
+            return await load()
+
+        revision = self._revision(tables)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == revision and time.monotonic() < entry[1]:
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        # Stored under the revision seen before counting: a commit landing
+        # meanwhile makes the entry stale rather than wrongly current.
+        value = await load()
+        self._entries[key] = (revision, time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def bump(self, tables: set[str]) -> None:
+        for table in tables:
+            self._revisions[table] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+list_counts = CountCache()
+
+
+def _written_tables(session: Session) -> set[str]:
+    return session.info.setdefault(_WRITTEN_KEY, set())
+
+
+def _collect_flushed(session: Session, _flush_context: Any) -> None:
+    written = _written_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        mapper = inspect(obj).mapper
+        written.update(table.name for table in mapper.tables)
+        written.update(
+            rel.secondary.name for rel in mapper.relationships if rel.secondary is not None
+        )
+
+
+def _collect_executed(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _written_tables(state.session).add(table.name)
+
+
+def _bump_written(session: Session) -> None:
+    # Also on rollback: a total counted inside the transaction saw its writes.
+    written = session.info.pop(_WRITTEN_KEY, None)
+    if written:
+        list_counts.bump(written)
+
+
+def install_count_cache_listeners() -> None:
+    """Bump ``list_counts`` revisions when writes end; idempotent."""
+    if event.contains(Session, "after_flush", _collect_flushed):
+        return
+    event.listen(Session, "after_flush", _collect_flushed)
+    event.listen(Session, "do_orm_execute", _collect_executed)
+    event.listen(Session, "after_commit", _bump_written)
+    event.listen(Session, "after_rollback", _bump_written)
+    logger.info("List count cache enabled")
@@ -0,0 +1,56 @@
+import bisect
+import hashlib
+from collections.abc import Iterable
+from functools import lru_cache
+
+DEFAULT_VIRTUAL_NODES = 160
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hash ring over a set of nodes.
+
+    Each node is placed on the ring ``virtual_nodes`` times so keys spread
+    evenly; removing a node only moves the keys that node owned.
+    """
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = DEFAULT_VIRTUAL_NODES) -> None:
+        self.nodes = tuple(dict.fromkeys(nodes))
+        if not self.nodes:
+            raise ValueError("Hash ring needs at least one node")
+
+        points = sorted(
+            (_hash(f"{node}#{replica}"), node)
+            for node in self.nodes
+            for replica in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _node in points]
+        self._owners = [node for _point, node in points]
+
+    def node_for(self, key: str) -> str:
+        return self._owners[self._index(key)]
+
+    def iter_nodes(self, key: str) -> Iterable[str]:
+        """Yield every node once, in ring order starting at the owner of ``key``."""
+        start = self._index(key)
+        seen: set[str] = set()
+        for offset in range(len(self._owners)):
+            node = self._owners[(start + offset) % len(self._owners)]
+            if node not in seen:
+                seen.add(node)
+                yield node
+                if len(seen) == len(self.nodes):
+                    return
+
+    def _index(self, key: str) -> int:
+        return bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+
+
+@lru_cache(maxsize=16)
+def get_hash_ring(nodes: tuple[str, ...]) -> HashRing:
+    """Reuse one ring per node list, since clients are built per request."""
+    return HashRing(nodes)
@@ -0,0 +1,184 @@
+"""
+Keyset (cursor) pagination over an ordered select.
+
+A list sorts by a tuple of ``SortKey``s ending in the primary key. Each page
+is fetched with one extra row; when it exists, the sort values of the last
+row are returned as an opaque cursor, and the next page continues strictly
+after them instead of skipping ``OFFSET`` rows. Nullable keys sort last in
+both directions so the cursor condition matches the ``ORDER BY``.
+
+Totals are counted separately (``count_total``): exactly, capped at
+``PAGINATION_COUNT_CAP`` matching rows, or not at all, optionally through
+the ``list_counts`` cache.
+"""
+
+import base64
+import binascii
+import enum
+import json
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import ColumnElement, Select, and_, false, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.exceptions import ValidationError
+from app.utils.count_cache import list_counts
+from app.utils.pagination import CountMode, PaginatedResult, PaginationParams
+
+
+@dataclass(frozen=True)
+class SortKey:
+    name: str
+    column: Any
+    descending: bool = False
+
+    @property
+    def nullable(self) -> bool:
+        return getattr(self.column, "nullable", True)
+
+    def order_by(self) -> ColumnElement:
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+
+def _signature(keys: Sequence[SortKey]) -> str:
+    return ",".join(f"-{key.name}" if key.descending else key.name for key in keys)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        {"s": _signature(keys), "v": [_encode_value(value) for value in values]},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> list[Any]:
+    """Sort values stored in ``cursor``; rejects cursors issued for another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != _signature(keys) or len(payload["v"]) != len(keys):
+            raise ValueError("cursor belongs to another sort")
+        return [_decode_value(key, value) for key, value in zip(keys, payload["v"])]
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise ValidationError("Invalid or outdated cursor") from e
+
+
+def _decode_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    python_type = key.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, enum.Enum):
+        return python_type(value)
+    if not isinstance(value, python_type):
+        raise TypeError(f"{key.name} cursor value has the wrong type")
+    return value
+
+
+def after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement[bool]:
+    """Rows strictly after ``values`` in the order of ``keys``."""
+    branches = []
+    for i, (key, value) in enumerate(zip(keys, values)):
+        if value is None:
+            continue  # NULL sorts last: nothing comes after it on this key
+        beyond = key.column < value if key.descending else key.column > value
+        if key.nullable:
+            beyond = or_(beyond, key.column.is_(None))
+        equal = [
+            prior.column.is_(None) if prior_value is None else prior.column == prior_value
+            for prior, prior_value in zip(keys[:i], values[:i])
+        ]
+        branches.append(and_(*equal, beyond))
+    return or_(*branches) if branches else false()
+
+
+async def count_total(
+    db: AsyncSession,
+    stmt: Select,
+    mode: CountMode,
+    cache_key: Hashable | None = None,
+    tables: Sequence[str] = (),
+) -> tuple[int | None, bool]:
+    """
+    Row count of the filtered ``stmt`` per ``mode``, and whether it hit the cap.
+
+    With ``cache_key`` (the normalized filters) the count is shared through
+    ``list_counts`` until one of ``tables`` is written.
+    """
+    if mode == "none":
+        return None, False
+    cap = get_settings().pagination_count_cap if mode == "capped" else None
+
+    async def load() -> tuple[int, bool]:
+        counted = stmt if cap is None else stmt.limit(cap + 1)
+        total = (await db.execute(select(func.count()).select_from(counted.subquery()))).scalar()
+        if cap is not None and (total or 0) > cap:
+            return cap, True
+        return total or 0, False
+
+    if cache_key is None:
+        return await load()
+    return await list_counts.get((cache_key, cap), tables, load)
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    keys: Sequence[SortKey],
+    pagination: PaginationParams,
+    count_stmt: Select | None = None,
+    count_key: Hashable | None = None,
+    count_tables: Sequence[str] = (),
+) -> PaginatedResult:
+    """
+    One page of the filtered ``stmt`` ordered by ``keys``, continuing after
+    ``pagination.cursor`` when given and at ``pagination.offset`` otherwise.
+
+    ``count_stmt`` is counted instead of ``stmt`` when the latter carries
+    joins needed only for sorting; ``count_key`` and ``count_tables`` cache
+    the count (see ``count_total``).
+    """
+    total, total_capped = await count_total(
+        db,
+        stmt if count_stmt is None else count_stmt,
+        pagination.count,
+        count_key,
+        count_tables,
+    )
+
+    stmt = stmt.add_columns(*(key.column.label(f"keyset_{i}") for i, key in enumerate(keys)))
+    stmt = stmt.order_by(*(key.order_by() for key in keys))
+    if pagination.cursor:
+        stmt = stmt.where(after(keys, decode_cursor(keys, pagination.cursor)))
+    else:
+        stmt = stmt.offset(pagination.offset)
+    stmt = stmt.limit(pagination.limit + 1)
+
+    rows = (await db.execute(stmt)).unique().all()
+    has_more = len(rows) > pagination.limit
+    rows = rows[: pagination.limit]
+
+    return PaginatedResult(
+        items=[row[0] for row in rows],
+        total=total,
+        page=pagination.page,
+        per_page=pagination.per_page,
+        has_more=has_more,
+        next_cursor=encode_cursor(keys, tuple(rows[-1])[1:]) if has_more else None,
+        total_capped=total_capped,
+    )
@@ -1,11 +1,22 @@
 """Mapping and sorting utilities for Auth Service session/access-log responses."""
 
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Self
 
 ACCESS_LOG_SORT_FIELDS = {"accessed_at", "ip", "channel", "action"}
+ACCESS_LOG_EXPORT_FIELDS = ("accessed_at", "ip", "channel", "action", "user_agent")
 SESSION_LOG_SORT_FIELDS = {"started_at", "ended_at", "duration", "ip", "channel"}
 
+# Auth Service session fields behind each sortable session column. Duration
+# runs opposite to started_at; ended_at is never reported, so it has no sort.
+SESSION_SORT_PUSHDOWN = {
+    "started_at": "started_at",
+    "duration": "started_at",
+    "ip": "client_ip",
+    "channel": "stream_name",
+}
+
 
 def normalize_sort_dir(sort_dir: str) -> str:
     return "asc" if sort_dir and sort_dir.lower() == "asc" else "desc"
@@ -55,6 +66,70 @@ def sort_items(
     return [item for _, item in with_value] + without_value
 
 
+def session_started_at(log: dict[str, Any]) -> datetime | None:
+    started_at = log.get("started_at")
+    if isinstance(started_at, str):
+        return normalize_datetime(parse_datetime(started_at))
+    if isinstance(started_at, datetime):
+        return normalize_datetime(started_at)
+    return None
+
+
+@dataclass
+class SessionList:
+    """
+    A user's Auth sessions with ``started_at`` parsed once.
+
+    Orderings are computed on first use per sort and kept, so paging through
+    the same list does not re-sort it.
+    """
+
+    sessions: list[dict[str, Any]]
+    started: list[datetime | None]
+    _orders: dict[tuple[str, str], list[int]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def parse(cls, sessions: list[dict[str, Any]]) -> Self:
+        return cls(sessions=sessions, started=[session_started_at(s) for s in sessions])
+
+    def select(
+        self,
+        sort_by: str,
+        sort_dir: str,
+        from_dt: datetime | None = None,
+        to_dt: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Sessions started within the range (or with no start time), sorted."""
+        selected: list[dict[str, Any]] = []
+        for index in self._order(sort_by, sort_dir):
+            started_dt = self.started[index]
+            if from_dt and started_dt and started_dt < from_dt:
+                continue
+            if to_dt and started_dt and started_dt > to_dt:
+                continue
+            selected.append(self.sessions[index])
+        return selected
+
+    def _order(self, sort_by: str, sort_dir: str) -> list[int]:
+        key = (sort_by, sort_dir)
+        order = self._orders.get(key)
+        if order is None:
+            if sort_by == "duration":
+                sort_by, sort_dir = "started_at", "asc" if sort_dir == "desc" else "desc"
+            rows = [
+                {
+                    "index": index,
+                    "started_at": self.started[index],
+                    "ip": session.get("client_ip"),
+                    "channel": session.get("stream_name"),
+                }
+                for index, session in enumerate(self.sessions)
+            ]
+            order = [row["index"] for row in sort_items(rows, sort_by, sort_dir, set())]
+            self._orders[key] = order
+        return order
+
+
 def map_access_log_entry(log: dict[str, Any]) -> dict[str, Any]:
     result = log.get("result")
     reason = log.get("reason")
@@ -77,12 +152,7 @@ def map_access_log_entry(log: dict[str, Any]) -> dict[str, Any]:
 def map_session_log_entry(log: dict[str, Any]) -> dict[str, Any]:
     started_at = log.get("started_at")
     duration = None
-    if isinstance(started_at, str):
-        started_dt = normalize_datetime(parse_datetime(started_at))
-    elif isinstance(started_at, datetime):
-        started_dt = normalize_datetime(started_at)
-    else:
-        started_dt = None
+    started_dt = session_started_at(log)
     if started_dt:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
         duration = max(0, int((now - started_dt).total_seconds()))
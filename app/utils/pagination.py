@@ -1,13 +1,19 @@
 from dataclasses import dataclass
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 
 T = TypeVar("T")
 
+# exact: count(*) of every match; capped: count up to PAGINATION_COUNT_CAP;
+# none: no count, only has_more.
+CountMode = Literal["exact", "capped", "none"]
+
 
 @dataclass
 class PaginationParams:
     page: int = 1
     per_page: int = 20
+    cursor: str | None = None
+    count: CountMode = "exact"
 
     @property
     def offset(self) -> int:
@@ -21,12 +27,17 @@ class PaginationParams:
 @dataclass
 class PaginatedResult(Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     per_page: int
+    has_more: bool = False
+    next_cursor: str | None = None
+    total_capped: bool = False
 
     @property
-    def pages(self) -> int:
+    def pages(self) -> int | None:
+        if self.total is None:
+            return None
         if self.total == 0:
             return 1
         return (self.total + self.per_page - 1) // self.per_page
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class _Entry(Generic[T]):
+    value: T
+    fetched_at: float
+
+
+class ProbeCache(Generic[T]):
+    """
+    Process-wide stale-while-revalidate cache for slow external probes.
+
+    An entry younger than ``ttl`` is returned as is. A stale entry is returned
+    immediately while a single background task refreshes it. Missing entries and
+    entries older than ``max_stale`` are awaited, with concurrent callers sharing
+    one fetch. A ``ttl`` of zero or less disables caching.
+
+    Invalidating a key bumps its generation, so a probe that was already in
+    flight still answers its waiters but does not store its (older) result.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_stale: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_stale = max(max_stale, ttl)
+        self._clock = clock
+        self._entries: dict[str, _Entry[T]] = {}
+        self._refreshes: dict[str, asyncio.Task[T]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        if self.ttl <= 0:
+            return await fetch()
+
+        entry = self._entries.get(key)
+        age = self._clock() - entry.fetched_at if entry is not None else None
+        if entry is not None and age < self.ttl:
+            return entry.value
+
+        refresh = self._start_refresh(key, fetch)
+        if entry is not None and age < self.max_stale:
+            return entry.value
+
+        # A caller's timeout must not cancel the fetch other callers are sharing.
+        return await asyncio.shield(refresh)
+
+    def invalidate(self, key: str) -> None:
+        """Drop an entry so the next caller waits for a fresh probe."""
+        self._entries.pop(key, None)
+        self._refreshes.pop(key, None)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._refreshes.clear()
+        self._epoch += 1
+
+    def _start_refresh(self, key: str, fetch: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        loop = asyncio.get_running_loop()
+        task = self._refreshes.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            generation = (self._epoch, self._generations.get(key, 0))
+            task = loop.create_task(self._fetch(key, fetch, generation))
+            task.add_done_callback(self._log_failure)
+            self._refreshes[key] = task
+        return task
+
+    async def _fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        generation: tuple[int, int],
+    ) -> T:
+        value = await fetch()
+        if generation == (self._epoch, self._generations.get(key, 0)):
+            self._entries[key] = _Entry(value=value, fetched_at=self._clock())
+        return value
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task[T]) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("Probe refresh failed: %s", error)
@@ -0,0 +1,25 @@
+"""Substring search over text columns, trigram-ranked on PostgreSQL.
+
+``ILIKE '%term%'`` is served by the ``gin_trgm_ops`` indexes from migration
+008 on PostgreSQL (terms of three or more characters). Ranking uses
+``pg_trgm`` similarity there; other databases, such as the SQLite test
+database, rank prefix matches first instead.
+"""
+
+from sqlalchemy import ColumnElement, case, func, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+def matches(columns: list[InstrumentedAttribute], term: str) -> ColumnElement[bool]:
+    """Rows where any of ``columns`` contains ``term``, case-insensitively."""
+    pattern = f"%{term}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+
+def relevance(dialect: str, columns: list[InstrumentedAttribute], term: str) -> ColumnElement:
+    """Sort key, best match first when ordered ascending."""
+    if dialect == "postgresql":
+        # greatest() skips NULL similarities of empty optional columns.
+        return -func.greatest(*(func.similarity(column, term) for column in columns))
+    prefix = f"{term}%"
+    return case((or_(*(column.ilike(prefix) for column in columns)), 0), else_=1)
@@ -0,0 +1,134 @@
+"""Per-request SQL statement counting and timing.
+
+Engine-wide cursor listeners record every statement into the trackers active
+in the current context. ``SqlTimingMiddleware`` opens one tracker per request,
+reports it in a ``Server-Timing`` header and logs slow or chatty requests with
+their most repeated statements. Tests use ``track_statements`` directly.
+"""
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_active: ContextVar[tuple["SqlStats", ...]] = ContextVar("sql_stats", default=())
+_STARTED_KEY = "sql_stats_started"
+
+
+@dataclass
+class SqlStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def top(self, limit: int = 3) -> list[tuple[str, int]]:
+        """Most repeated statements, the usual sign of a per-row query loop."""
+        return [(sql, n) for sql, n in self.statements.most_common(limit) if n > 1]
+
+    def describe_top(self, limit: int = 3) -> str:
+        return "\n".join(f"{n}x {' '.join(sql.split())[:200]}" for sql, n in self.top(limit))
+
+
+def install_sql_listeners() -> None:
+    """Listen on every engine; idempotent."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_statements() -> Iterator[SqlStats]:
+    """Record the statements run in this context (nested trackers all see them)."""
+    install_sql_listeners()
+    stats = SqlStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _active.get():
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    trackers = _active.get()
+    started = conn.info.get(_STARTED_KEY)
+    if not trackers or not started:
+        return
+    elapsed = time.perf_counter() - started.pop()
+    for stats in trackers:
+        stats.count += 1
+        stats.duration += elapsed
+        stats.statements[statement] += 1
+
+
+class SqlTimingMiddleware:
+    """
+    Add ``Server-Timing`` (db time and statement count, render time) to HTTP
+    responses and log requests over ``SQL_SLOW_REQUEST_MS`` or
+    ``SQL_STATEMENT_WARN_COUNT`` with their most repeated statements.
+
+    Render time is the handler time not spent in the database. Statements
+    run while a streaming body is sent are logged but not in the header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        install_sql_listeners()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not get_settings().sql_instrumentation_enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total = time.perf_counter() - started
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} statements", '
+                    f"render;dur={max(total - stats.duration, 0) * 1000:.1f}",
+                )
+            await send(message)
+
+        with track_statements() as stats:
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log_if_expensive(scope, stats, time.perf_counter() - started)
+
+    @staticmethod
+    def _log_if_expensive(scope: Scope, stats: SqlStats, total: float) -> None:
+        settings = get_settings()
+        too_slow = total * 1000 >= settings.sql_slow_request_ms > 0
+        too_chatty = stats.count >= settings.sql_statement_warn_count > 0
+        if not (too_slow or too_chatty):
+            return
+        top = stats.describe_top()
+        logger.warning(
+            "%s %s took %.0f ms with %d SQL statements (%.0f ms in the database)%s",
+            scope["method"],
+            scope["path"],
+            total * 1000,
+            stats.count,
+            stats.duration * 1000,
+            f"; most repeated:\n{top}" if top else "",
+        )
@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class TTLCache(Generic[T]):
+    """
+    Size-capped LRU of short-lived values.
+
+    Entries older than ``ttl`` are dropped when read and by a sweep that runs
+    at most once per ``ttl``; beyond ``max_entries`` the least recently used
+    entry is evicted. A ``ttl`` of zero or less disables caching.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max(max_entries, 1)
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self._swept_at = clock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        if self.ttl <= 0:
+            return await fetch()
+
+        now = self._clock()
+        if now - self._swept_at >= self.ttl:
+            self._sweep(now)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[1]
+            del self._entries[key]
+
+        value = await fetch()
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def _sweep(self, now: float) -> None:
+        self._swept_at = now
+        expired = [
+            key for key, (stored_at, _) in self._entries.items() if now - stored_at >= self.ttl
+        ]
+        for key in expired:
+            del self._entries[key]
@@ -1,34 +1,12 @@
 import { fetchMessage, get } from "./client";
-import type {
-  AuthDashboardStats,
-  DashboardStats,
-  EpgDashboardStats,
-  RutvDashboardStats,
-  StreamProviderDashboardStats,
-} from "./types";
+import type { DashboardOverview, DashboardStats } from "./types";
 
 export function getStats(): Promise<DashboardStats> {
   return get<DashboardStats>("/api/v1/dashboard/stats");
 }
 
-export function getFlussonicStats(): Promise<StreamProviderDashboardStats> {
-  return get<StreamProviderDashboardStats>("/api/v1/dashboard/flussonic");
-}
-
-export function getNimbleStats(): Promise<StreamProviderDashboardStats> {
-  return get<StreamProviderDashboardStats>("/api/v1/dashboard/nimble");
-}
-
-export function getAuthStats(): Promise<AuthDashboardStats> {
-  return get<AuthDashboardStats>("/api/v1/dashboard/auth");
-}
-
-export function getEpgStats(): Promise<EpgDashboardStats> {
-  return get<EpgDashboardStats>("/api/v1/dashboard/epg");
-}
-
-export function getRutvStats(): Promise<RutvDashboardStats> {
-  return get<RutvDashboardStats>("/api/v1/dashboard/rutv");
+export function getOverview(): Promise<DashboardOverview> {
+  return get<DashboardOverview>("/api/v1/dashboard/overview");
 }
 
 export function triggerEpgUpdate(): Promise<string> {
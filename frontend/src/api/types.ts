@@ -43,6 +43,16 @@ export interface ActiveSourceCounters {
   other: number;
 }
 
+export interface StreamProviderNodeStats {
+  name: string;
+  health: ServiceHealth;
+  url: string | null;
+  incoming_kbit: number | null;
+  outgoing_kbit: number | null;
+  total_clients: number | null;
+  error: string | null;
+}
+
 export interface StreamProviderDashboardStats {
   health: ServiceHealth;
   checked_at: string;
@@ -54,6 +64,7 @@ export interface StreamProviderDashboardStats {
   broken_sources: number | null;
   active_source_counters: ActiveSourceCounters | null;
   error: string | null;
+  nodes: StreamProviderNodeStats[];
 }
 
 export interface AuthDashboardStats {
@@ -85,6 +96,30 @@ export interface RutvDashboardStats {
   error: string | null;
 }
 
+export type DashboardSectionStatus = "ok" | "error" | "timeout";
+
+export interface DashboardSection<T> {
+  status: DashboardSectionStatus;
+  data: T | null;
+  error: string | null;
+}
+
+export interface CircuitBreakerStatus {
+  service: string;
+  state: "closed" | "open" | "half_open";
+  consecutive_failures: number;
+  retry_in: number | null;
+}
+
+export interface DashboardOverview {
+  flussonic: DashboardSection<StreamProviderDashboardStats>;
+  nimble: DashboardSection<StreamProviderDashboardStats>;
+  auth: DashboardSection<AuthDashboardStats>;
+  epg: DashboardSection<EpgDashboardStats>;
+  rutv: DashboardSection<RutvDashboardStats>;
+  circuits: CircuitBreakerStatus[];
+}
+
 // Lookup types (used in dropdowns and nested responses)
 export interface GroupLookup {
   id: number;
@@ -185,6 +220,9 @@ export interface SyncResultResponse {
   new: number;
   updated: number;
   orphaned: number;
+  revived: number;
+  auth_users_synced: number;
+  auth_propagation_skipped: boolean;
 }
 
 export interface ChannelBulkUpdateItem {
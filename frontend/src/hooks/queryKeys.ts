@@ -1,11 +1,7 @@
 export const queryKeys = {
   dashboard: {
     stats: () => ["dashboard-stats"] as const,
-    provider: (source: "flussonic" | "nimble") =>
-      ["dashboard-provider-stats", source] as const,
-    auth: () => ["dashboard-auth-stats"] as const,
-    epg: () => ["dashboard-epg-stats"] as const,
-    rutv: () => ["dashboard-rutv-stats"] as const,
+    overview: () => ["dashboard-overview"] as const,
   },
   channels: {
     all: () => ["channels"] as const,
@@ -92,13 +92,13 @@ export function useSyncChannels() {
   const qc = useQueryClient();
   return useMutation({
     mutationFn: (source: StreamSource) => syncChannels(source),
-    onSuccess: (_, source) => {
+    onSuccess: () => {
       qc.invalidateQueries({ queryKey: queryKeys.channels.all() });
       qc.invalidateQueries({ queryKey: queryKeys.lookup.channels() });
       qc.invalidateQueries({ queryKey: queryKeys.packages.all() });
       qc.invalidateQueries({ queryKey: queryKeys.users.all() });
       qc.invalidateQueries({ queryKey: queryKeys.dashboard.stats() });
-      qc.invalidateQueries({ queryKey: queryKeys.dashboard.provider(source) });
+      qc.invalidateQueries({ queryKey: queryKeys.dashboard.overview() });
     },
   });
 }
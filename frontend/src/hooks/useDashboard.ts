@@ -1,17 +1,33 @@
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
-import {
-  getAuthStats,
-  getEpgStats,
-  getFlussonicStats,
-  getNimbleStats,
-  getRutvStats,
-  getStats,
-  triggerEpgUpdate,
-} from "../api/dashboard";
+import { getOverview, getStats, triggerEpgUpdate } from "../api/dashboard";
+import type { DashboardOverview } from "../api/types";
 import { queryKeys } from "./queryKeys";
 
 const SERVICE_REFRESH_MS = 30000;
 
+// External service cards read their section (status, error and data) from one
+// shared overview query, so probing every service is a single request. The DB
+// stats keep their own query so the page renders without waiting on probes.
+function useDashboardOverview<T>(select: (overview: DashboardOverview) => T) {
+  return useQuery({
+    queryKey: queryKeys.dashboard.overview(),
+    queryFn: getOverview,
+    select,
+    refetchInterval: SERVICE_REFRESH_MS,
+    refetchIntervalInBackground: true,
+    refetchOnWindowFocus: true,
+    refetchOnReconnect: true,
+  });
+}
+
+const selectFlussonic = (overview: DashboardOverview) => overview.flussonic;
+const selectNimble = (overview: DashboardOverview) => overview.nimble;
+const selectAuth = (overview: DashboardOverview) => overview.auth;
+const selectEpg = (overview: DashboardOverview) => overview.epg;
+const selectRutv = (overview: DashboardOverview) => overview.rutv;
+const selectOpenCircuits = (overview: DashboardOverview) =>
+  overview.circuits.filter((circuit) => circuit.state !== "closed");
+
 export function useDashboardStats() {
   return useQuery({
     queryKey: queryKeys.dashboard.stats(),
@@ -20,58 +36,27 @@ export function useDashboardStats() {
 }
 
 export function useFlussonicDashboardStats() {
-  return useQuery({
-    queryKey: queryKeys.dashboard.provider("flussonic"),
-    queryFn: getFlussonicStats,
-    refetchInterval: SERVICE_REFRESH_MS,
-    refetchIntervalInBackground: true,
-    refetchOnWindowFocus: true,
-    refetchOnReconnect: true,
-  });
+  return useDashboardOverview(selectFlussonic);
 }
 
 export function useNimbleDashboardStats() {
-  return useQuery({
-    queryKey: queryKeys.dashboard.provider("nimble"),
-    queryFn: getNimbleStats,
-    refetchInterval: SERVICE_REFRESH_MS,
-    refetchIntervalInBackground: true,
-    refetchOnWindowFocus: true,
-    refetchOnReconnect: true,
-  });
+  return useDashboardOverview(selectNimble);
 }
 
 export function useAuthDashboardStats() {
-  return useQuery({
-    queryKey: queryKeys.dashboard.auth(),
-    queryFn: getAuthStats,
-    refetchInterval: SERVICE_REFRESH_MS,
-    refetchIntervalInBackground: true,
-    refetchOnWindowFocus: true,
-    refetchOnReconnect: true,
-  });
+  return useDashboardOverview(selectAuth);
 }
 
 export function useEpgDashboardStats() {
-  return useQuery({
-    queryKey: queryKeys.dashboard.epg(),
-    queryFn: getEpgStats,
-    refetchInterval: SERVICE_REFRESH_MS,
-    refetchIntervalInBackground: true,
-    refetchOnWindowFocus: true,
-    refetchOnReconnect: true,
-  });
+  return useDashboardOverview(selectEpg);
 }
 
 export function useRutvDashboardStats() {
-  return useQuery({
-    queryKey: queryKeys.dashboard.rutv(),
-    queryFn: getRutvStats,
-    refetchInterval: SERVICE_REFRESH_MS,
-    refetchIntervalInBackground: true,
-    refetchOnWindowFocus: true,
-    refetchOnReconnect: true,
-  });
+  return useDashboardOverview(selectRutv);
+}
+
+export function useOpenCircuits() {
+  return useDashboardOverview(selectOpenCircuits);
 }
 
 export function useTriggerEpgUpdate() {
@@ -79,7 +64,7 @@ export function useTriggerEpgUpdate() {
   return useMutation({
     mutationFn: () => triggerEpgUpdate(),
     onSuccess: () => {
-      qc.invalidateQueries({ queryKey: queryKeys.dashboard.epg() });
+      qc.invalidateQueries({ queryKey: queryKeys.dashboard.overview() });
     },
   });
 }
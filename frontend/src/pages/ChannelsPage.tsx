@@ -119,8 +119,10 @@ export function ChannelsPage() {
 
   const { data: groups } = useLookupGroups();
   const { data: packages } = useLookupPackages();
-  const { data: flussonicStats } = useFlussonicDashboardStats();
-  const { data: nimbleStats } = useNimbleDashboardStats();
+  const { data: flussonicSection } = useFlussonicDashboardStats();
+  const { data: nimbleSection } = useNimbleDashboardStats();
+  const flussonicStats = flussonicSection?.data;
+  const nimbleStats = nimbleSection?.data;
 
   // Mutations
   const bulkUpdate = useBulkUpdateChannels();
@@ -256,7 +258,7 @@ export function ChannelsPage() {
     try {
       const result = await syncMut.mutateAsync(source);
       showToast(
-        `${formatStreamSource(result.source)} sync complete: ${result.new} new, ${result.updated} updated, ${result.orphaned} orphaned`,
+        `${formatStreamSource(result.source)} sync complete: ${result.new} new, ${result.updated} updated, ${result.orphaned} orphaned, ${result.auth_propagation_skipped ? "Auth propagation skipped (too many channels orphaned)" : `${result.auth_users_synced} users re-synced`}`,
         "success"
       );
       updateParams({ page: "1" });
@@ -6,6 +6,7 @@ import {
   useEpgDashboardStats,
   useFlussonicDashboardStats,
   useNimbleDashboardStats,
+  useOpenCircuits,
   useRutvDashboardStats,
   useTriggerEpgUpdate,
 } from "../hooks/useDashboard";
@@ -17,7 +18,7 @@ import { Card } from "../components/ui/Card";
 import { Badge } from "../components/ui/Badge";
 import { PageHeader } from "../components/ui/PageHeader";
 import { SectionCard } from "../components/ui/SectionCard";
-import type { StreamSource } from "../api/types";
+import type { DashboardSection, StreamSource } from "../api/types";
 import { formatStreamSource } from "../utils/channels";
 
 function StatCard({
@@ -80,13 +81,33 @@ function getHealthBadgeVariant(
   return "gray";
 }
 
+function getSectionLabel(
+  section: DashboardSection<unknown> | undefined,
+  isLoading: boolean
+): string {
+  if (section?.status === "timeout") return "TIMEOUT";
+  if (section?.status === "error") return "ERROR";
+  return isLoading ? "LOADING" : "N/A";
+}
+
 export function DashboardPage() {
   const { data: stats, isLoading } = useDashboardStats();
-  const { data: flussonicStats, isLoading: isFlussonicLoading } = useFlussonicDashboardStats();
-  const { data: nimbleStats, isLoading: isNimbleLoading } = useNimbleDashboardStats();
-  const { data: authStats, isLoading: isAuthLoading } = useAuthDashboardStats();
-  const { data: epgStats, isLoading: isEpgLoading } = useEpgDashboardStats();
-  const { data: rutvStats, isLoading: isRutvLoading } = useRutvDashboardStats();
+  const { data: flussonicSection, isLoading: isFlussonicLoading } = useFlussonicDashboardStats();
+  const { data: nimbleSection, isLoading: isNimbleLoading } = useNimbleDashboardStats();
+  const { data: authSection, isLoading: isAuthLoading } = useAuthDashboardStats();
+  const { data: epgSection, isLoading: isEpgLoading } = useEpgDashboardStats();
+  const { data: rutvSection, isLoading: isRutvLoading } = useRutvDashboardStats();
+  const flussonicStats = flussonicSection?.data;
+  const flussonicError = flussonicStats?.error ?? flussonicSection?.error;
+  const nimbleStats = nimbleSection?.data;
+  const nimbleError = nimbleStats?.error ?? nimbleSection?.error;
+  const authStats = authSection?.data;
+  const authError = authStats?.error ?? authSection?.error;
+  const epgStats = epgSection?.data;
+  const epgError = epgStats?.error ?? epgSection?.error;
+  const rutvStats = rutvSection?.data;
+  const rutvError = rutvStats?.error ?? rutvSection?.error;
+  const { data: openCircuits } = useOpenCircuits();
   const epgUpdateMutation = useTriggerEpgUpdate();
   const syncMutation = useSyncChannels();
   const { showToast } = useToast();
@@ -95,7 +116,7 @@ export function DashboardPage() {
   async function handleSync(source: StreamSource) {
     try {
       const result = await syncMutation.mutateAsync(source);
-      const message = `${formatStreamSource(result.source)} sync completed: ${result.total} total, ${result.new} new, ${result.updated} updated, ${result.orphaned} orphaned`;
+      const message = `${formatStreamSource(result.source)} sync completed: ${result.total} total, ${result.new} new, ${result.updated} updated, ${result.orphaned} orphaned, ${result.revived} revived, ${result.auth_propagation_skipped ? "Auth propagation skipped (too many channels orphaned)" : `${result.auth_users_synced} users re-synced`}`;
       setSyncMessage(message);
       showToast(message, "success");
     } catch {
@@ -183,13 +204,28 @@ export function DashboardPage() {
         />
       </div>
 
+      {openCircuits && openCircuits.length > 0 && (
+        <div className="status-warning rounded-lg border p-4">
+          <p className="text-sm">
+            Failing fast for:{" "}
+            {openCircuits
+              .map((circuit) =>
+                circuit.state === "half_open"
+                  ? `${circuit.service} (probing)`
+                  : `${circuit.service} (retry in ${Math.ceil(circuit.retry_in ?? 0)}s)`
+              )
+              .join(", ")}
+          </p>
+        </div>
+      )}
+
       <div className="grid grid-cols-1 gap-6 md:grid-cols-2 xl:grid-cols-4">
         <SectionCard
           className="xl:col-span-1"
           title={(
             <div className="flex items-center gap-2">
               <Badge variant={getHealthBadgeVariant(epgStats?.health)}>
-                {epgStats?.health?.toUpperCase() ?? (isEpgLoading ? "LOADING" : "N/A")}
+                {epgStats?.health?.toUpperCase() ?? getSectionLabel(epgSection, isEpgLoading)}
               </Badge>
               <span>EPG Service</span>
             </div>
@@ -226,9 +262,9 @@ export function DashboardPage() {
               </div>
             </div>
           </div>
-          {epgStats?.error && (
+          {epgError && (
             <div className="status-danger w-full rounded-lg border p-4">
-              <p className="text-sm">{epgStats.error}</p>
+              <p className="text-sm">{epgError}</p>
             </div>
           )}
         </SectionCard>
@@ -238,7 +274,7 @@ export function DashboardPage() {
           title={(
             <div className="flex items-center gap-2">
               <Badge variant={getHealthBadgeVariant(rutvStats?.health)}>
-                {rutvStats?.health?.toUpperCase() ?? (isRutvLoading ? "LOADING" : "N/A")}
+                {rutvStats?.health?.toUpperCase() ?? getSectionLabel(rutvSection, isRutvLoading)}
               </Badge>
               <span>RUTV Site</span>
             </div>
@@ -269,9 +305,9 @@ export function DashboardPage() {
               </div>
             </div>
           </div>
-          {rutvStats?.error && (
+          {rutvError && (
             <div className="status-danger w-full rounded-lg border p-4">
-              <p className="text-sm">{rutvStats.error}</p>
+              <p className="text-sm">{rutvError}</p>
             </div>
           )}
         </SectionCard>
@@ -283,7 +319,7 @@ export function DashboardPage() {
               <Badge variant={getHealthBadgeVariant(flussonicStats?.health, flussonicStats?.error)}>
                 {isNotConfigured(flussonicStats?.error)
                   ? "NOT CONFIGURED"
-                  : flussonicStats?.health?.toUpperCase() ?? (isFlussonicLoading ? "LOADING" : "N/A")}
+                  : flussonicStats?.health?.toUpperCase() ?? getSectionLabel(flussonicSection, isFlussonicLoading)}
               </Badge>
               <span>Flussonic</span>
             </div>
@@ -354,9 +390,9 @@ export function DashboardPage() {
               </div>
             </div>
           )}
-          {flussonicStats?.error && !isNotConfigured(flussonicStats.error) && (
+          {flussonicError && !isNotConfigured(flussonicError) && (
             <div className="status-danger w-full rounded-lg border p-4">
-              <p className="text-sm">{flussonicStats.error}</p>
+              <p className="text-sm">{flussonicError}</p>
             </div>
           )}
         </SectionCard>
@@ -368,7 +404,7 @@ export function DashboardPage() {
               <Badge variant={getHealthBadgeVariant(nimbleStats?.health, nimbleStats?.error)}>
                 {isNotConfigured(nimbleStats?.error)
                   ? "NOT CONFIGURED"
-                  : nimbleStats?.health?.toUpperCase() ?? (isNimbleLoading ? "LOADING" : "N/A")}
+                  : nimbleStats?.health?.toUpperCase() ?? getSectionLabel(nimbleSection, isNimbleLoading)}
               </Badge>
               <span>Nimble</span>
             </div>
@@ -421,9 +457,9 @@ export function DashboardPage() {
               </div>
             </div>
           )}
-          {nimbleStats?.error && !isNotConfigured(nimbleStats.error) && (
+          {nimbleError && !isNotConfigured(nimbleError) && (
             <div className="status-danger w-full rounded-lg border p-4">
-              <p className="text-sm">{nimbleStats.error}</p>
+              <p className="text-sm">{nimbleError}</p>
             </div>
           )}
         </SectionCard>
@@ -433,7 +469,7 @@ export function DashboardPage() {
           title={(
             <div className="flex items-center gap-2">
               <Badge variant={getHealthBadgeVariant(authStats?.health)}>
-                {authStats?.health?.toUpperCase() ?? (isAuthLoading ? "LOADING" : "N/A")}
+                {authStats?.health?.toUpperCase() ?? getSectionLabel(authSection, isAuthLoading)}
               </Badge>
               <span>Auth Service</span>
             </div>
@@ -454,9 +490,9 @@ export function DashboardPage() {
               </div>
             </div>
           </div>
-          {authStats?.error && (
+          {authError && (
             <div className="status-danger w-full rounded-lg border p-4">
-              <p className="text-sm">{authStats.error}</p>
+              <p className="text-sm">{authError}</p>
             </div>
           )}
         </SectionCard>
@@ -1,7 +1,17 @@
-"""Normalize Auth Backend user_id values and run full Auth resync.
+"""Normalize Auth Backend user_id values, reconcile tokens and run full Auth resync.
 
 Run from the Playlist Service environment. For normalization modes, provide
 AUTH_DATABASE_URL for direct access to the Auth Backend database.
+
+Token reconciliation goes through the Auth API. ``--plan`` writes the
+create/patch/recreate/delete steps as JSON lines without changing anything;
+``--reconcile`` applies a fresh plan, or the one given with ``--plan-file``,
+and records finished steps in ``--checkpoint`` so an interrupted run can be
+started again with the same arguments. A checkpoint only resumes the plan it
+was started with, so pass ``--plan-file`` when resuming:
+
+    python scripts/auth_identity_maintenance.py --plan --output plan.jsonl
+    python scripts/auth_identity_maintenance.py --reconcile --plan-file plan.jsonl --checkpoint plan.done
 """
 
 from __future__ import annotations
@@ -9,12 +19,19 @@ from __future__ import annotations
 import argparse
 import asyncio
 import os
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from app.clients.auth_service import AuthServiceClient, AuthTokenIndex
+from app.services.auth_reconcile import AuthReconciler, Checkpoint, ReconcileAction
 from app.services.auth_sync import AuthSyncService
 from app.services.database import async_session_factory
 
@@ -62,20 +79,18 @@ async def load_playlist_users() -> list[PlaylistUser]:
         ]
 
 
-async def load_auth_state(engine: AsyncEngine) -> AuthState:
+async def load_rows(engine: AsyncEngine, query: str) -> list[dict[str, Any]]:
     async with engine.connect() as conn:
-        tokens = [
-            dict(row._mapping)
-            for row in (await conn.execute(text("SELECT id, token, user_id, meta FROM tokens ORDER BY id")))
-        ]
-        sessions = [
-            dict(row._mapping)
-            for row in (await conn.execute(text("SELECT id, token_id, user_id FROM active_sessions ORDER BY id")))
-        ]
-        logs = [
-            dict(row._mapping)
-            for row in (await conn.execute(text("SELECT id, user_id FROM access_logs ORDER BY id")))
-        ]
+        return [dict(row._mapping) for row in await conn.execute(text(query))]
+
+
+async def load_auth_state(engine: AsyncEngine) -> AuthState:
+    # Separate connections, so the three tables are read concurrently.
+    tokens, sessions, logs = await asyncio.gather(
+        load_rows(engine, "SELECT id, token, user_id, meta FROM tokens ORDER BY id"),
+        load_rows(engine, "SELECT id, token_id, user_id FROM active_sessions ORDER BY id"),
+        load_rows(engine, "SELECT id, user_id FROM access_logs ORDER BY id"),
+    )
     return AuthState(tokens=tokens, sessions=sessions, logs=logs)
 
 
@@ -158,7 +173,8 @@ async def apply_normalization(engine: AsyncEngine, users: list[PlaylistUser], st
             if playlist_user is None:
                 if token_id in referenced_token_ids:
                     print(
-                        f"mismatch: auth token {token_id} is referenced by Playlist but has unknown token value; keeping for resync"
+                        f"mismatch: auth token {token_id} is referenced by Playlist but has unknown token value; keeping for resync",
+                        file=sys.stderr,
                     )
                     continue
                 await conn.execute(
@@ -203,9 +219,10 @@ async def apply_normalization(engine: AsyncEngine, users: list[PlaylistUser], st
 
 
 def print_counts(title: str, counts: dict[str, int]) -> None:
-    print(title)
+    # Status goes to stderr so a plan written to stdout stays machine-readable.
+    print(title, file=sys.stderr)
     for key in sorted(counts):
-        print(f"{key}: {counts[key]}")
+        print(f"{key}: {counts[key]}", file=sys.stderr)
 
 
 async def normalize_auth_db(*, apply: bool) -> None:
@@ -234,16 +251,64 @@ async def full_resync() -> None:
     print_counts("Full Auth resync result", summary)
 
 
+async def write_plan(output: Path | None) -> None:
+    async with async_session_factory() as session:
+        plan = await AuthReconciler(session).plan()
+    lines = "".join(f"{step.to_json()}\n" for step in plan)
+    if output is None:
+        sys.stdout.write(lines)
+    else:
+        output.write_text(lines)
+    counts: dict[str, int] = {}
+    for step in plan:
+        counts[step.action] = counts.get(step.action, 0) + 1
+    print_counts("Auth reconciliation plan", counts)
+
+
+def print_progress(done: int, total: int) -> None:
+    print(f"applied {done}/{total} steps", file=sys.stderr, flush=True)
+
+
+async def reconcile(plan_file: Path | None, checkpoint_path: Path | None) -> None:
+    async with async_session_factory() as session:
+        reconciler = AuthReconciler(session)
+        index: AuthTokenIndex | None = None
+        if plan_file is not None:
+            plan = [
+                ReconcileAction.from_json(line)
+                for line in plan_file.read_text().splitlines()
+                if line.strip()
+            ]
+        else:
+            # A fresh plan is applied against the same token pull it was made from.
+            async with AuthServiceClient() as client:
+                index = await AuthTokenIndex.load(client)
+            plan = await reconciler.plan(index)
+        counts = await reconciler.apply(
+            plan, checkpoint=Checkpoint(checkpoint_path), progress=print_progress, index=index
+        )
+    print_counts("Auth reconciliation result", dict(counts))
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Maintain Auth Backend Playlist user identity")
     mode = parser.add_mutually_exclusive_group(required=True)
     mode.add_argument("--dry-run", action="store_true", help="Report Auth DB normalization actions")
     mode.add_argument("--apply", action="store_true", help="Apply Auth DB normalization actions")
     mode.add_argument("--full-resync", action="store_true", help="Resync all users through Auth API")
+    mode.add_argument("--plan", action="store_true", help="Write the Auth token reconciliation plan")
+    mode.add_argument("--reconcile", action="store_true", help="Apply an Auth token reconciliation plan")
+    parser.add_argument("--output", type=Path, help="File for --plan (default: stdout)")
+    parser.add_argument("--plan-file", type=Path, help="Plan written by --plan to apply with --reconcile")
+    parser.add_argument("--checkpoint", type=Path, help="Resumable progress file for --reconcile")
     args = parser.parse_args()
 
     if args.full_resync:
         await full_resync()
+    elif args.plan:
+        await write_plan(args.output)
+    elif args.reconcile:
+        await reconcile(args.plan_file, args.checkpoint)
     else:
         await normalize_auth_db(apply=args.apply)
 
@@ -0,0 +1,108 @@
+"""Measure Auth fan-out throughput of AuthSyncService.sync_users_by_ids.
+
+Users live in a throwaway in-memory SQLite database and Auth Service is the
+in-process fake from scripts/fake_auth_service.py with a fixed per-request
+latency, so only the fan-out is measured. Each --concurrency value is run
+against the same users; --no-bulk makes the fake reject bulk token updates so
+the per-token PATCH fallback is measured:
+
+    python scripts/benchmark_auth_sync.py --users 2000 --latency-ms 20 --concurrency 1 8 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.clients.auth_service import AuthServiceClient
+from app.clients.http import AUTH, http_clients
+from app.config import get_settings
+from app.models import Base, User, UserStatus
+from app.services.auth_sync import AuthSyncService
+from scripts.fake_auth_service import FakeAuthService
+
+
+async def seed_users(session: AsyncSession, auth: FakeAuthService, count: int) -> list[int]:
+    users = [
+        User(
+            first_name="Bench",
+            last_name=str(index),
+            agreement_number=f"BENCH-{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"bench-token-{index}",
+            auth_token_id=index,
+        )
+        for index in range(1, count + 1)
+    ]
+    session.add_all(users)
+    await session.flush()
+    for user in users:
+        auth.add_token(id=user.auth_token_id, token=user.token, user_id=str(user.id))
+    return [user.id for user in users]
+
+
+async def run(concurrency: int, user_ids: list[int], session: AsyncSession, auth: FakeAuthService) -> None:
+    os.environ["AUTH_SYNC_CONCURRENCY"] = str(concurrency)
+    get_settings.cache_clear()
+    auth.requests.clear()
+    AuthServiceClient.bulk_update_supported = None
+
+    started = time.perf_counter()
+    summary = await AuthSyncService(session).sync_users_by_ids(user_ids)
+    elapsed = time.perf_counter() - started
+
+    print(
+        f"concurrency={concurrency:<4} users={len(user_ids)} patched={summary['patched']} "
+        f"failed={summary['failed']} requests={auth.requests.total()} "
+        f"elapsed={elapsed:7.3f}s users/s={len(user_ids) / elapsed:8.1f}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark bounded Auth fan-out")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--no-bulk", action="store_true", help="Disable the fake bulk update endpoint")
+    args = parser.parse_args()
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    auth = FakeAuthService(args.latency_ms / 1000, bulk=not args.no_bulk)
+    settings = get_settings()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=auth),
+        base_url=settings.auth_service_url,
+    ) as client:
+        http_clients.override(AUTH, client)
+        try:
+            session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+            async with session_factory() as session:
+                user_ids = await seed_users(session, auth, args.users)
+                for concurrency in args.concurrency:
+                    await run(concurrency, user_ids, session, auth)
+        finally:
+            http_clients.override(AUTH, None)
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
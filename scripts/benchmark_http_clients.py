@@ -0,0 +1,108 @@
+"""Compare per-call httpx clients with the pooled client registry against a local stub.
+
+The stub is a minimal HTTP/1.1 keep-alive server on 127.0.0.1. Use
+--connect-delay-ms to emulate the cost of a remote TCP/TLS handshake, which the
+per-call mode pays on every request and the pooled mode pays once per connection.
+
+    python scripts/benchmark_http_clients.py --requests 500 --connect-delay-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+
+from app.clients.http import EPG, HttpClientRegistry
+
+RESPONSE_BODY = b'{"status": "ok"}'
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: " + str(len(RESPONSE_BODY)).encode() + b"\r\n"
+    b"Connection: keep-alive\r\n\r\n" + RESPONSE_BODY
+)
+
+
+async def start_stub_server(connect_delay: float) -> asyncio.Server:
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if connect_delay:
+            await asyncio.sleep(connect_delay)
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def run_per_call(url: str, count: int) -> list[float]:
+    latencies: list[float] = []
+    for _ in range(count):
+        started = time.perf_counter()
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(url)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def run_pooled(url: str, count: int) -> list[float]:
+    registry = HttpClientRegistry()
+    latencies: list[float] = []
+    try:
+        client = registry.get(EPG)
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+    finally:
+        await registry.aclose()
+    return latencies
+
+
+def describe(title: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{title:<10} mean={statistics.mean(ordered) * 1000:7.3f}ms "
+        f"p50={statistics.median(ordered) * 1000:7.3f}ms "
+        f"p95={p95 * 1000:7.3f}ms total={sum(ordered):6.3f}s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark outbound HTTP client pooling")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--connect-delay-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = await start_stub_server(args.connect_delay_ms / 1000)
+    host, port = server.sockets[0].getsockname()[:2]
+    url = f"http://{host}:{port}/stats"
+    try:
+        describe("per-call", await run_per_call(url, args.requests))
+        describe("pooled", await run_pooled(url, args.requests))
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
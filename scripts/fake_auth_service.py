@@ -0,0 +1,136 @@
+"""In-process stand-in for the Auth Service token API.
+
+An ASGI app serving the token and access-log endpoints AuthServiceClient uses, with a fixed
+per-request latency. Used by the Auth benchmarks and tests through
+``httpx.ASGITransport``:
+
+    auth = FakeAuthService(latency=0.01)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=auth), base_url=...) as client:
+        http_clients.override(AUTH, client)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections import Counter
+from typing import Any
+from urllib.parse import parse_qs
+
+TOKEN_PATH = re.compile(r"^/api/tokens/(\d+)$")
+TOKENS_PATH = "/api/tokens"
+BULK_PATH = "/api/tokens/bulk"
+ACCESS_LOGS_PATH = "/api/access-logs"
+
+
+class FakeAuthService:
+    """Token store behind a minimal Auth Service API.
+
+    ``bulk`` toggles ``POST /api/tokens/bulk``; without it the endpoint answers
+    404 like an Auth Service that predates bulk updates. ``bulk_error`` makes
+    it answer that status instead, like a failing Auth Service. ``requests``
+    counts calls per ``"METHOD /route"``.
+    """
+
+    def __init__(
+        self, latency: float = 0.0, *, bulk: bool = True, bulk_error: int | None = None
+    ) -> None:
+        self.latency = latency
+        self.bulk = bulk
+        self.bulk_error = bulk_error
+        self.tokens: dict[int, dict[str, Any]] = {}
+        self.access_logs: list[dict[str, Any]] = []
+        self.requests: Counter[str] = Counter()
+        self._next_id = 1
+
+    def add_token(self, **fields: Any) -> dict[str, Any]:
+        token_id = fields.pop("id", None) or self._next_id
+        self._next_id = max(self._next_id, token_id + 1)
+        token = {"id": token_id, **fields}
+        self.tokens[token_id] = token
+        return token
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        await asyncio.sleep(self.latency)
+
+        method, path = scope["method"], scope["path"]
+        body = await self._read_body(receive)
+        match = TOKEN_PATH.match(path)
+        if path == BULK_PATH and method == "POST" and self.bulk:
+            self.requests["POST /api/tokens/bulk"] += 1
+            if self.bulk_error is not None:
+                status, payload = self.bulk_error, {"detail": "Bulk update failed"}
+            else:
+                status, payload = self._bulk_update(json.loads(body))
+        elif path == TOKENS_PATH and method == "GET":
+            self.requests["GET /api/tokens"] += 1
+            status, payload = self._list(parse_qs(scope["query_string"].decode()))
+        elif path == ACCESS_LOGS_PATH and method == "GET":
+            self.requests["GET /api/access-logs"] += 1
+            status, payload = self._access_logs(parse_qs(scope["query_string"].decode()))
+        elif path == TOKENS_PATH and method == "POST":
+            self.requests["POST /api/tokens"] += 1
+            status, payload = 201, self.add_token(**json.loads(body))
+        elif match is not None:
+            self.requests[f"{method} /api/tokens/{{id}}"] += 1
+            status, payload = self._token(method, int(match.group(1)), body)
+        else:
+            self.requests[f"{method} {path}"] += 1
+            status, payload = 404, {"detail": "Not found"}
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": json.dumps(payload).encode()})
+
+    def _list(self, query: dict[str, list[str]]) -> tuple[int, list[dict[str, Any]]]:
+        skip = int(query.get("skip", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        ordered = [self.tokens[token_id] for token_id in sorted(self.tokens)]
+        return 200, ordered[skip : skip + limit]
+
+    def _access_logs(self, query: dict[str, list[str]]) -> tuple[int, list[dict[str, Any]]]:
+        skip = int(query.get("skip", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        user_id = query.get("user_id", [None])[0]
+        logs = [log for log in self.access_logs if user_id is None or log.get("user_id") == user_id]
+        return 200, logs[skip : skip + limit]
+
+    def _token(self, method: str, token_id: int, body: bytes) -> tuple[int, Any]:
+        token = self.tokens.get(token_id)
+        if method == "DELETE":
+            self.tokens.pop(token_id, None)
+            return 204, None
+        if token is None:
+            return 404, {"detail": "Token not found"}
+        if method == "PATCH":
+            token.update(json.loads(body))
+        return 200, token
+
+    def _bulk_update(self, payload: dict[str, Any]) -> tuple[int, dict[str, list[int]]]:
+        updated: list[int] = []
+        not_found: list[int] = []
+        for update in payload.get("updates", []):
+            token_id = update.pop("id")
+            token = self.tokens.get(token_id)
+            if token is None:
+                not_found.append(token_id)
+            else:
+                token.update(update)
+                updated.append(token_id)
+        return 200, {"updated": updated, "not_found": not_found}
+
+    async def _read_body(self, receive) -> bytes:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                return body
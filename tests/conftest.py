@@ -1,8 +1,13 @@
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+
+import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.models import Base
+from app.utils.sql_stats import SqlStats, track_statements
 
 
 @pytest_asyncio.fixture
@@ -21,3 +26,19 @@ async def db_session() -> AsyncSession:
         await session.rollback()
 
     await engine.dispose()
+
+
+@pytest.fixture
+def statement_budget() -> Callable[[int], AbstractContextManager[SqlStats]]:
+    """``with statement_budget(n):`` fails the test if the block runs more than n SQL statements."""
+
+    @contextmanager
+    def budget(limit: int) -> Iterator[SqlStats]:
+        with track_statements() as stats:
+            yield stats
+        if stats.count > limit:
+            pytest.fail(
+                f"{stats.count} SQL statements, budget {limit}; most repeated:\n{stats.describe_top()}"
+            )
+
+    return budget
@@ -33,8 +33,18 @@ os.environ.setdefault("LOG_LEVEL", "INFO")
 
 from app.dependencies import get_current_admin_id
 from app.main import app
-from app.models import User, UserStatus
-from app.services.database import get_db
+from app.models import Channel, Group, Package, Tariff, User, UserStatus
+from app.services.database import get_db, get_read_db
+from app.utils.sql_stats import track_statements
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions_cache():
+    from app.routes import users as users_route
+
+    users_route._get_sessions_cache.cache_clear()
+    yield
+    users_route._get_sessions_cache.cache_clear()
 
 
 async def _override_admin_id() -> int:
@@ -49,6 +59,7 @@ async def _client_with_db(db_session) -> AsyncIterator[httpx.AsyncClient]:
     previous_overrides = dict(app.dependency_overrides)
     app.dependency_overrides[get_current_admin_id] = _override_admin_id
     app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_read_db] = override_db
     transport = httpx.ASGITransport(app=app)
     try:
         async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
@@ -90,6 +101,9 @@ async def test_representative_paginated_response_envelope(db_session):
             "page": 1,
             "per_page": 20,
             "pages": 1,
+            "has_more": False,
+            "next_cursor": None,
+            "total_capped": False,
         },
     }
 
@@ -207,6 +221,148 @@ async def test_sessions_and_access_logs_query_auth_by_playlist_user_id(db_sessio
     assert calls["access_logs"][0]["user_id"] == str(user.id)
 
 
+@pytest.mark.asyncio
+async def test_session_pages_share_one_sorted_auth_fetch(db_session, monkeypatch):
+    from app.routes import users as users_route
+
+    calls = []
+
+    class ManySessionsAuthServiceClient(FakeAuthServiceClient):
+        async def get_user_sessions(self, **kwargs):
+            calls.append(kwargs)
+            return [
+                {"started_at": f"2026-01-0{day}T10:00:00Z", "client_ip": f"10.0.0.{day}"}
+                for day in (3, 1, 5, 2, 4)
+            ]
+
+    monkeypatch.setattr(users_route, "AuthServiceClient", ManySessionsAuthServiceClient)
+    user = User(
+        first_name="A",
+        last_name="B",
+        agreement_number="301",
+        status=UserStatus.ENABLED,
+        max_sessions=1,
+        token="token",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    async with _client_with_db(db_session) as client:
+        first = await client.get(f"/api/v1/users/{user.id}/sessions?per_page=2")
+        second = await client.get(f"/api/v1/users/{user.id}/sessions?per_page=2&page=2")
+        longest = await client.get(
+            f"/api/v1/users/{user.id}/sessions?sort_by=duration&per_page=2"
+            "&from_date=2026-01-02T00:00:00"
+        )
+
+    assert len(calls) == 1
+    assert [item["ip"] for item in first.json()["data"]["items"]] == ["10.0.0.5", "10.0.0.4"]
+    assert [item["ip"] for item in second.json()["data"]["items"]] == ["10.0.0.3", "10.0.0.2"]
+    assert first.json()["data"]["total"] == 5
+    assert first.json()["data"]["pages"] == 3
+    assert [item["ip"] for item in longest.json()["data"]["items"]] == ["10.0.0.2", "10.0.0.3"]
+    assert longest.json()["data"]["total"] == 4
+
+
+@pytest.mark.asyncio
+async def test_session_query_pushdown_passes_range_sort_and_page(db_session, monkeypatch):
+    from app.routes import users as users_route
+
+    calls = []
+
+    class PagingAuthServiceClient(FakeAuthServiceClient):
+        async def get_user_sessions(self, **kwargs):
+            calls.append(kwargs)
+            return [{"started_at": "2026-01-01T10:00:00", "client_ip": "10.0.0.1"}] * 3
+
+    from app.config import get_settings
+
+    settings = get_settings().model_copy(update={"auth_sessions_pushdown": True})
+    monkeypatch.setattr(users_route, "get_settings", lambda: settings)
+    monkeypatch.setattr(users_route, "AuthServiceClient", PagingAuthServiceClient)
+    user = User(
+        first_name="A",
+        last_name="B",
+        agreement_number="302",
+        status=UserStatus.ENABLED,
+        max_sessions=1,
+        token="token",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    async with _client_with_db(db_session) as client:
+        response = await client.get(
+            f"/api/v1/users/{user.id}/sessions?page=2&per_page=2&sort_by=ip&sort_dir=asc"
+            "&from_date=2026-01-01T00:00:00"
+        )
+
+    assert calls[0]["skip"] == 2
+    assert calls[0]["limit"] == 3
+    assert calls[0]["sort_by"] == "client_ip"
+    assert calls[0]["sort_dir"] == "asc"
+    assert calls[0]["start_time"].isoformat() == "2026-01-01T00:00:00"
+    data = response.json()["data"]
+    assert len(data["items"]) == 2
+    assert (data["total"], data["pages"]) == (5, 3)
+
+
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+@pytest.mark.asyncio
+async def test_access_log_export_streams_every_page_filtered(db_session, export_format):
+    import csv
+    import json
+
+    from app.clients.http import AUTH, http_clients
+    from scripts.fake_auth_service import FakeAuthService
+
+    user = User(
+        first_name="A",
+        last_name="B",
+        agreement_number="303",
+        status=UserStatus.ENABLED,
+        max_sessions=1,
+        token="token",
+    )
+    db_session.add(user)
+    await db_session.flush()
+    auth = FakeAuthService()
+    auth.access_logs = [
+        {
+            "user_id": str(user.id),
+            "timestamp": f"2026-01-01T10:{minute:02d}:00",
+            "client_ip": "10.0.0.1" if minute % 3 else "10.0.0.2",
+            "stream_name": "news",
+            "result": "allowed",
+            "protocol": "hls",
+        }
+        for minute in range(2500)
+    ]
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=auth), base_url="http://auth.test"
+    ) as auth_http:
+        http_clients.override(AUTH, auth_http)
+        try:
+            async with _client_with_db(db_session) as client:
+                response = await client.get(
+                    f"/api/v1/users/{user.id}/access-logs/export",
+                    params={"format": export_format, "ip": "10.0.0.2"},
+                )
+        finally:
+            http_clients.override(AUTH, None)
+
+    assert response.status_code == 200
+    if export_format == "csv":
+        rows = list(csv.DictReader(response.text.splitlines()))
+    else:
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 834
+    assert {row["ip"] for row in rows} == {"10.0.0.2"}
+    assert rows[0]["action"] == "allowed"
+    assert auth.requests["GET /api/access-logs"] == 3
+
+
 @pytest.mark.asyncio
 async def test_name_only_user_update_does_not_sync_auth(db_session, monkeypatch):
     from app.routes import users as users_route
@@ -279,3 +435,185 @@ async def test_auth_relevant_user_update_syncs_auth(db_session, monkeypatch):
 
     assert response.status_code == 200
     assert RecordingAuthSyncService.calls == [{"user_id": user.id, "recreate_token": False}]
+
+
+@pytest.mark.asyncio
+async def test_dashboard_overview_reports_each_section_within_global_deadline(
+    db_session, monkeypatch
+):
+    import asyncio
+    from datetime import UTC, datetime
+
+    from app.config import get_settings
+    from app.routes import dashboard as dashboard_route
+    from app.schemas import RutvDashboardStats, StreamProviderDashboardStats
+
+    settings = get_settings().model_copy(update={"dashboard_overview_timeout": 0.2})
+    checked_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    async def provider_stats(source):
+        return StreamProviderDashboardStats(health="up", checked_at=checked_at, total_clients=7)
+
+    async def failing_auth_stats():
+        raise RuntimeError("boom")
+
+    async def slow_epg_stats():
+        await asyncio.sleep(5)
+
+    async def rutv_stats():
+        return RutvDashboardStats(health="degraded", checked_at=checked_at)
+
+    monkeypatch.setattr(dashboard_route, "get_settings", lambda: settings)
+    monkeypatch.setattr(dashboard_route, "_get_provider_stats", provider_stats)
+    monkeypatch.setattr(dashboard_route, "_get_auth_stats", failing_auth_stats)
+    monkeypatch.setattr(dashboard_route, "_get_epg_stats", slow_epg_stats)
+    monkeypatch.setattr(dashboard_route, "_get_rutv_stats", rutv_stats)
+
+    async with _client_with_db(db_session) as client:
+        response = await client.get("/api/v1/dashboard/overview")
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert "stats" not in data
+    assert data["flussonic"]["status"] == "ok"
+    assert data["nimble"]["data"]["total_clients"] == 7
+    assert data["auth"] == {"status": "error", "data": None, "error": "Internal error"}
+    assert data["epg"] == {"status": "timeout", "data": None, "error": "Timed out after 0.2s"}
+    assert data["rutv"]["data"]["health"] == "degraded"
+
+
+async def _seed_catalog(db_session, size: int) -> dict[str, int]:
+    groups = [Group(name=f"group-{i}", sort_order=i) for i in range(size)]
+    channels = [
+        Channel(stream_name=f"stream-{i}", channel_number=i + 1, groups=[groups[i % size]])
+        for i in range(size * 3)
+    ]
+    packages = [Package(name=f"package-{i}", channels=channels[i::size]) for i in range(size)]
+    tariffs = [Tariff(name=f"tariff-{i}", packages=packages[i:]) for i in range(size)]
+    users = [
+        User(
+            first_name="U",
+            last_name=str(i),
+            agreement_number=f"LP-{i}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"lp-token-{i}",
+            tariffs=tariffs[i:],
+            packages=packages[:i],
+            channels=channels[:i],
+        )
+        for i in range(size)
+    ]
+    db_session.add_all([*groups, *channels, *packages, *tariffs, *users])
+    await db_session.flush()
+    ids = {"channel": channels[0].id, "package": packages[0].id, "user": users[-1].id}
+    # Endpoints must load what they read themselves, not find it in the identity map.
+    db_session.expunge_all()
+    return ids
+
+
+STATEMENT_BUDGETS = {
+    "/api/v1/channels": 4,
+    "/api/v1/channels/{channel}": 3,
+    "/api/v1/packages": 1,
+    "/api/v1/packages/{package}": 2,
+    "/api/v1/tariffs": 2,
+    "/api/v1/users": 3,
+    "/api/v1/users/{user}": 4,
+    "/api/v1/users/{user}/resolved-channels": 4,
+    "/api/v1/lookup/packages": 1,
+    "/api/v1/lookup/tariffs": 1,
+}
+
+
+@pytest.mark.parametrize("size", [2, 6])
+@pytest.mark.asyncio
+async def test_endpoint_statement_counts_stay_within_budget(db_session, size):
+    ids = await _seed_catalog(db_session, size)
+
+    counts = {}
+    async with _client_with_db(db_session) as client:
+        for route in STATEMENT_BUDGETS:
+            with track_statements() as stats:
+                response = await client.get(route.format(**ids))
+            assert response.status_code == 200, route
+            counts[route] = stats.count
+            db_session.expunge_all()
+
+    # The same budgets hold at both catalog sizes: no per-row queries.
+    over_budget = {route: n for route, n in counts.items() if n > STATEMENT_BUDGETS[route]}
+    assert over_budget == {}
+
+
+@pytest.mark.asyncio
+async def test_responses_report_sql_time_and_statement_count(db_session):
+    async with _client_with_db(db_session) as client:
+        response = await client.get("/api/v1/lookup/groups")
+
+    db_metric, render_metric = response.headers["server-timing"].split(", ")
+    assert db_metric.startswith("db;dur=")
+    assert db_metric.endswith('desc="1 statements"')
+    assert render_metric.startswith("render;dur=")
+
+
+@pytest.mark.asyncio
+async def test_channel_bulk_update_and_reorder_do_not_query_per_channel(
+    db_session, statement_budget
+):
+    channels = [Channel(stream_name=f"bulk-{i}", sort_order=i) for i in range(20)]
+    db_session.add_all(channels)
+    await db_session.flush()
+    ids = [channel.id for channel in channels]
+    db_session.expunge_all()
+
+    async with _client_with_db(db_session) as client:
+        with statement_budget(2):
+            response = await client.patch(
+                "/api/v1/channels",
+                json={"channels": [{"id": i, "tvg_id": f"tvg-{i}"} for i in ids + [999]]},
+            )
+        assert response.json()["message"] == "20 channels updated successfully"
+        with statement_budget(2):
+            await client.post(
+                "/api/v1/channels/reorder",
+                json={"order": [{"id": i, "sort_order": -i} for i in ids]},
+            )
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_fall_back_to_primary_while_the_replica_lags(monkeypatch):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from app.config import get_settings
+    from app.services import database
+
+    settings = get_settings().model_copy(
+        update={"db_read_check_seconds": 0, "db_read_max_lag_seconds": 5}
+    )
+    monkeypatch.setattr(database, "get_settings", lambda: settings)
+    primary = database.async_session_factory
+
+    assert await database.ReadRouter(None).session_factory() is primary
+
+    replica = create_async_engine("sqlite+aiosqlite://")
+    router = database.ReadRouter(replica)
+    try:
+        replica_factory = await router.session_factory()
+        assert replica_factory is not primary
+        async with replica_factory() as session:
+            assert session.get_bind() is replica.sync_engine
+
+        lags: list[float | Exception] = [30, OSError("connection refused"), 1]
+
+        async def replica_lag(_engine):
+            lag = lags.pop(0)
+            if isinstance(lag, Exception):
+                raise lag
+            return lag
+
+        monkeypatch.setattr(router, "_replica_lag", replica_lag)
+        assert await router.session_factory() is primary
+        assert await router.session_factory() is primary
+        assert await router.session_factory() is replica_factory
+    finally:
+        await replica.dispose()
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from app.clients.auth_service import BulkUpdateResult
+from app.config import Settings
+from app.exceptions import AuthServiceError
+from app.models import AuthSyncAction, AuthSyncOutbox, User, UserStatus
+from app.services import auth_outbox, auth_sync
+from app.services.auth_outbox import AuthOutboxService
+from app.services.auth_sync import AuthSyncService
+
+NOW = datetime(2026, 10, 19, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def outbox_settings(monkeypatch):
+    settings = Settings.model_construct(
+        auth_outbox_enabled=True,
+        auth_outbox_batch_size=100,
+        auth_outbox_retry_seconds=5,
+        auth_outbox_max_retry_seconds=600,
+        auth_sync_batch_size=10,
+        auth_sync_concurrency=2,
+    )
+    monkeypatch.setattr(auth_sync, "get_settings", lambda: settings)
+    monkeypatch.setattr(auth_outbox, "get_settings", lambda: settings)
+    return settings
+
+
+class RecordingAuthClient:
+    def __init__(self, failing_token_ids=()):
+        self.failing_token_ids = set(failing_token_ids)
+        self.calls: list[tuple[str, int]] = []
+        self.tokens: dict[int, dict] = {}
+        self._next_id = 100
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def get_token(self, token_id):
+        if token_id in self.failing_token_ids:
+            raise AuthServiceError("unavailable")
+        return self.tokens[token_id]
+
+    async def find_token_by_value(self, token):
+        return None
+
+    async def create_token(self, data):
+        self._next_id += 1
+        self.calls.append(("create", int(data.user_id)))
+        return self._next_id
+
+    async def delete_token(self, token_id):
+        self.calls.append(("delete", token_id))
+
+    async def bulk_update_tokens(self, updates):
+        self.calls.extend(("patch", token_id) for token_id, _data in updates)
+        return BulkUpdateResult(updated={token_id for token_id, _data in updates})
+
+
+async def add_users(db_session, count):
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"50{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            auth_token_id=index,
+        )
+        for index in range(1, count + 1)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_drain_collapses_entries_per_user_and_backs_off_failures(db_session, monkeypatch):
+    users = await add_users(db_session, 3)
+    client = RecordingAuthClient(failing_token_ids={3})
+    for user in users:
+        client.tokens[user.auth_token_id] = {
+            "id": user.auth_token_id,
+            "token": user.token,
+            "user_id": str(user.id),
+        }
+    monkeypatch.setattr(auth_sync, "AuthServiceClient", lambda: client)
+    monkeypatch.setattr(auth_outbox, "AuthServiceClient", lambda: client)
+
+    service = AuthSyncService(db_session)
+    # Writes made by routes: nothing reaches Auth Service until the outbox drains.
+    await service.request_users_sync([users[0].id, users[1].id, users[2].id])
+    await service.request_users_sync([users[0].id])
+    await service.sync_user_update(users[1], recreate_token=True)
+    await service.sync_user_delete(User(id=99, token="gone", auth_token_id=42))
+    assert client.calls == []
+
+    counts = await AuthOutboxService(db_session).drain(now=NOW)
+
+    assert counts == {"entries": 6, "users": 4, "synced": 3, "failed": 1}
+    assert sorted(client.calls) == [("create", users[1].id), ("delete", 2), ("delete", 42), ("patch", 1)]
+    remaining = (await db_session.execute(select(AuthSyncOutbox))).scalars().all()
+    assert [(entry.user_id, entry.attempts) for entry in remaining] == [(users[2].id, 1)]
+    assert remaining[0].next_attempt_at == NOW + timedelta(seconds=5)
+    assert remaining[0].last_error == "unavailable"
+
+    # Not due yet: the failed user waits for its backoff.
+    assert await AuthOutboxService(db_session).drain(now=NOW + timedelta(seconds=1)) == {}
+
+    stats = await AuthOutboxService(db_session).stats(now=NOW + timedelta(seconds=1))
+    assert (stats.pending, stats.pending_users, stats.retrying) == (1, 1, 1)
+    assert stats.last_error == "unavailable"
+    assert stats.lag_seconds is not None
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_part_of_the_callers_transaction(db_session):
+    users = await add_users(db_session, 1)
+
+    await AuthSyncService(db_session).enqueue([users[0].id], AuthSyncAction.RECREATE)
+    await db_session.rollback()
+
+    assert (await db_session.execute(select(AuthSyncOutbox))).scalars().all() == []
@@ -0,0 +1,118 @@
+import httpx
+import pytest
+
+from app.clients import auth_service
+from app.clients.auth_service import AuthServiceClient, AuthTokenIndex
+from app.clients.http import AUTH, http_clients
+from app.config import Settings
+from app.models import User, UserStatus
+from app.services import auth_reconcile, auth_sync
+from app.services.auth_reconcile import (
+    AuthReconciler,
+    Checkpoint,
+    CheckpointMismatchError,
+    ReconcileAction,
+)
+from scripts.fake_auth_service import FakeAuthService
+
+
+@pytest.fixture
+def auth(monkeypatch):
+    settings = Settings.model_construct(
+        auth_service_url="http://auth.test",
+        auth_service_api_key="key",
+        auth_sync_batch_size=2,
+        auth_sync_concurrency=3,
+        auth_token_page_size=2,
+    )
+    for module in (auth_service, auth_sync, auth_reconcile):
+        monkeypatch.setattr(module, "get_settings", lambda: settings)
+    monkeypatch.setattr(AuthServiceClient, "bulk_update_supported", None)
+    return FakeAuthService()
+
+
+@pytest.fixture
+async def auth_client(auth):
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=auth), base_url="http://auth.test"
+    ) as client:
+        http_clients.override(AUTH, client)
+        yield client
+        http_clients.override(AUTH, None)
+
+
+async def add_users(db_session, auth_token_ids):
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"70{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            auth_token_id=auth_token_id,
+        )
+        for index, auth_token_id in enumerate(auth_token_ids, start=1)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    return users
+
+
+def token_record(user, **overrides):
+    record = {
+        "id": user.auth_token_id,
+        "token": user.token,
+        "user_id": str(user.id),
+        "status": "active",
+        "max_sessions": 1,
+        "allowed_streams": [],
+    }
+    return {**record, **overrides}
+
+
+@pytest.mark.asyncio
+async def test_plan_diffs_users_against_auth_tokens_and_apply_resumes(
+    db_session, auth, auth_client, tmp_path
+):
+    in_sync, stale, missing, foreign_owner = await add_users(db_session, [1, 2, None, 4])
+    auth.add_token(**token_record(in_sync))
+    auth.add_token(**token_record(stale, max_sessions=5))
+    auth.add_token(**token_record(foreign_owner, user_id="A-704"))
+    auth.add_token(id=99, token="unknown", user_id="external")
+    reconciler = AuthReconciler(db_session)
+    async with AuthServiceClient() as client:
+        index = await AuthTokenIndex.load(client)
+
+    plan = await reconciler.plan(index)
+
+    assert [(step.action, step.user_id, step.auth_token_id) for step in plan] == [
+        ("patch", stale.id, 2),
+        ("create", missing.id, None),
+        ("recreate", foreign_owner.id, 4),
+        ("delete", None, 99),
+    ]
+    assert [ReconcileAction.from_json(step.to_json()) for step in plan] == plan
+    assert auth.requests == {"GET /api/tokens": 3}
+
+    checkpoint_path = tmp_path / "plan.done"
+    progress: list[tuple[int, int]] = []
+    counts = await reconciler.apply(
+        plan,
+        checkpoint=Checkpoint(checkpoint_path),
+        progress=lambda *p: progress.append(p),
+        index=index,
+    )
+
+    assert counts == {"patch": 1, "create": 1, "recreate": 1, "delete": 1, "skipped": 0}
+    assert progress == [(2, 4), (4, 4)]
+    assert auth.requests["GET /api/tokens/{id}"] == 0
+    assert auth.requests["GET /api/tokens"] == 3
+    assert await reconciler.plan() == []
+
+    resumed = await reconciler.apply(plan, checkpoint=Checkpoint(checkpoint_path))
+    assert resumed == {"skipped": 4}
+
+    # A fresh plan whose keys overlap the recorded ones must not be skipped.
+    with pytest.raises(CheckpointMismatchError):
+        await reconciler.apply(plan[:2], checkpoint=Checkpoint(checkpoint_path))
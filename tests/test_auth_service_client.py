@@ -0,0 +1,106 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients import auth_service
+from app.clients.auth_service import AuthServiceClient, AuthTokenIndex, AuthTokenUpdate
+from app.config import Settings
+from scripts.fake_auth_service import FakeAuthService
+
+
+@pytest.fixture(autouse=True)
+def auth_settings(monkeypatch):
+    settings = Settings.model_construct(
+        auth_service_url="http://auth.test",
+        auth_service_api_key="key",
+        auth_sync_concurrency=4,
+        auth_bulk_update_size=2,
+    )
+    monkeypatch.setattr(auth_service, "get_settings", lambda: settings)
+    monkeypatch.setattr(AuthServiceClient, "bulk_update_supported", None)
+
+
+def fake_auth_client(auth: FakeAuthService) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=auth), base_url="http://auth.test")
+
+
+@pytest.mark.parametrize("bulk", [True, False])
+@pytest.mark.asyncio
+async def test_bulk_update_tokens_uses_bulk_endpoint_or_falls_back_to_patch(bulk):
+    auth = FakeAuthService(bulk=bulk)
+    for token_id in (1, 2, 3):
+        auth.add_token(id=token_id, token=f"token-{token_id}", user_id=str(token_id), max_sessions=1)
+    updates = [(token_id, AuthTokenUpdate(max_sessions=5)) for token_id in (1, 2, 3, 9)]
+
+    async with fake_auth_client(auth) as http_client, AuthServiceClient(http_client) as client:
+        result = await client.bulk_update_tokens(updates)
+
+    assert result.updated == {1, 2, 3}
+    assert result.not_found == {9}
+    assert result.failed == {}
+    assert all(auth.tokens[token_id]["max_sessions"] == 5 for token_id in (1, 2, 3))
+    if bulk:
+        assert auth.requests == {"POST /api/tokens/bulk": 2}
+    else:
+        assert auth.requests == {"POST /api/tokens/bulk": 1, "PATCH /api/tokens/{id}": 4}
+        assert AuthServiceClient.bulk_update_supported is False
+
+
+@pytest.mark.asyncio
+async def test_failing_bulk_request_falls_back_to_patching_each_token():
+    auth = FakeAuthService(bulk_error=500)
+    for token_id in (1, 2, 3):
+        auth.add_token(id=token_id, token=f"token-{token_id}", user_id=str(token_id), max_sessions=1)
+    updates = [(token_id, AuthTokenUpdate(max_sessions=5)) for token_id in (1, 2, 3, 9)]
+
+    async with fake_auth_client(auth) as http_client, AuthServiceClient(http_client) as client:
+        result = await client.bulk_update_tokens(updates)
+
+    assert result.updated == {1, 2, 3}
+    assert result.not_found == {9}
+    assert result.failed == {}
+    assert all(auth.tokens[token_id]["max_sessions"] == 5 for token_id in (1, 2, 3))
+    assert auth.requests == {"POST /api/tokens/bulk": 2, "PATCH /api/tokens/{id}": 4}
+    # A failing request says nothing about support; later runs still try bulk first.
+    assert AuthServiceClient.bulk_update_supported is None
+
+
+@pytest.mark.asyncio
+async def test_token_lookups_page_past_the_first_page():
+    auth = FakeAuthService()
+    for token_id in range(1, 6):
+        auth.add_token(id=token_id, token=f"token-{token_id}", user_id=str(token_id))
+
+    async with fake_auth_client(auth) as http_client, AuthServiceClient(http_client) as client:
+        tokens = await client.list_tokens(page_size=2)
+        found = await client.find_token_by_value("token-5", page_size=2)
+        index = AuthTokenIndex(tokens)
+
+    assert [token["id"] for token in tokens] == [1, 2, 3, 4, 5]
+    assert found["id"] == 5
+    assert auth.requests == {"GET /api/tokens": 6}
+    assert index.find_by_value("token-4")["id"] == 4
+    assert [token["id"] for token in index.for_user("3")] == [3]
+
+    index.discard(4)
+    index.add({"id": 6, "token": "token-6", "user_id": "3"})
+    assert index.find_by_value("token-4") is None
+    assert [token["id"] for token in index.for_user("3")] == [3, 6]
+
+
+@pytest.mark.asyncio
+async def test_access_log_pages_prefetch_the_next_page():
+    auth = FakeAuthService()
+    auth.access_logs = [{"user_id": "7", "client_ip": f"10.0.0.{n}"} for n in range(5)]
+
+    async with fake_auth_client(auth) as http_client, AuthServiceClient(http_client) as client:
+        pages = client.access_log_pages(user_id="7", page_size=2)
+        first = await anext(pages)
+        # The second page is fetched while the caller is still on the first.
+        await asyncio.sleep(0.01)
+        assert auth.requests["GET /api/access-logs"] == 2
+        rest = [page async for page in pages]
+
+    assert [len(page) for page in [first, *rest]] == [2, 2, 1]
+    assert auth.requests["GET /api/access-logs"] == 3
@@ -1,11 +1,25 @@
+import asyncio
 from datetime import datetime
 
+import httpx
 import pytest
 
-from app.clients.auth_service import AuthTokenCreate
+from app.clients import auth_service
+from app.clients.auth_service import AuthServiceClient, AuthTokenCreate, BulkUpdateResult
+from app.clients.http import AUTH, http_clients
+from app.config import Settings
 from app.exceptions import AuthServiceError
 from app.models import User, UserStatus
+from app.services import auth_sync
 from app.services.auth_sync import AuthSyncService
+from scripts.fake_auth_service import FakeAuthService
+
+
+@pytest.fixture(autouse=True)
+def auth_sync_settings(monkeypatch):
+    settings = Settings.model_construct(auth_sync_batch_size=2, auth_sync_concurrency=3)
+    monkeypatch.setattr(auth_sync, "get_settings", lambda: settings)
+    return settings
 
 
 class FakeAuthClient:
@@ -26,6 +40,10 @@ class FakeAuthClient:
     async def update_token(self, token_id, data):
         self.updated.append((token_id, data))
 
+    async def bulk_update_tokens(self, updates):
+        self.updated.extend(updates)
+        return BulkUpdateResult(updated={token_id for token_id, _data in updates})
+
     async def get_token(self, token_id):
         return self.tokens_by_id[token_id]
 
@@ -35,6 +53,12 @@ class FakeAuthClient:
     async def find_token_by_value(self, token):
         return self.existing_token
 
+    async def list_tokens(self, **kwargs):
+        tokens = list(self.tokens_by_id.values())
+        if self.existing_token is not None:
+            tokens.append(self.existing_token)
+        return tokens
+
 
 class FakeAuthClientContext(FakeAuthClient):
     async def __aenter__(self):
@@ -287,3 +311,156 @@ async def test_auth_sync_update_swallows_recreate_failure(monkeypatch, db_sessio
     await AuthSyncService(db_session).sync_user_update(user, recreate_token=True)
 
     assert client.deleted == [10]
+
+
+class SlowAuthClientContext(FakeAuthClientContext):
+    def __init__(self, failing_token_ids: set[int]):
+        super().__init__()
+        self.failing_token_ids = failing_token_ids
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_token(self, token_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if token_id in self.failing_token_ids:
+                raise AuthServiceError("unavailable")
+            return self.tokens_by_id[token_id]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_sync_users_by_ids_runs_bounded_and_isolates_failures(db_session, monkeypatch):
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"30{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            auth_token_id=index,
+        )
+        for index in range(1, 8)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    client = SlowAuthClientContext(failing_token_ids={3})
+    for user in users:
+        client.tokens_by_id[user.auth_token_id] = {
+            "id": user.auth_token_id,
+            "token": user.token,
+            "user_id": str(user.id),
+        }
+    monkeypatch.setattr("app.services.auth_sync.AuthServiceClient", lambda: client)
+
+    summary = await AuthSyncService(db_session).sync_users_by_ids(
+        [user.id for user in users] + [users[0].id, 999]
+    )
+
+    assert summary == {
+        "total": 8,
+        "patched": 6,
+        "unchanged": 0,
+        "recreated": 0,
+        "recovered": 0,
+        "mismatched": 0,
+        "failed": 1,
+    }
+    assert sorted(token_id for token_id, _data in client.updated) == [1, 2, 4, 5, 6, 7]
+    assert 1 < client.max_in_flight <= 2
+
+
+@pytest.mark.asyncio
+async def test_full_resync_indexes_auth_tokens_once(db_session, monkeypatch):
+    settings = Settings.model_construct(
+        auth_service_url="http://auth.test",
+        auth_service_api_key="key",
+        auth_sync_batch_size=2,
+        auth_sync_concurrency=3,
+        auth_bulk_update_size=10,
+        auth_token_page_size=2,
+    )
+    monkeypatch.setattr(auth_sync, "get_settings", lambda: settings)
+    monkeypatch.setattr(auth_service, "get_settings", lambda: settings)
+    monkeypatch.setattr(AuthServiceClient, "bulk_update_supported", None)
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"40{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            auth_token_id=index,
+        )
+        for index in range(1, 5)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    auth = FakeAuthService()
+    for user in users[:3]:
+        auth.add_token(id=user.auth_token_id, token=user.token, user_id=str(user.id))
+    # The last user's record points at a foreign token; its own token sits on the last page.
+    auth.add_token(id=4, token="foreign-token", user_id="other")
+    auth.add_token(id=5, token="token-4", user_id=str(users[3].id))
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=auth), base_url="http://auth.test"
+    ) as client:
+        http_clients.override(AUTH, client)
+        try:
+            summary = await AuthSyncService(db_session).sync_all_users()
+        finally:
+            http_clients.override(AUTH, None)
+
+    assert summary["patched"] == 3
+    assert summary["recovered"] == 1
+    assert auth.requests["GET /api/tokens"] == 3
+    assert auth.requests["GET /api/tokens/{id}"] == 0
+    assert 5 not in auth.tokens and 4 not in auth.tokens
+    assert users[3].auth_token_id in auth.tokens
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_users_matching_last_pushed_fingerprint(db_session, monkeypatch):
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"41{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            auth_token_id=index,
+        )
+        for index in range(1, 4)
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    client = SlowAuthClientContext(failing_token_ids=set())
+    for user in users:
+        client.tokens_by_id[user.auth_token_id] = {
+            "id": user.auth_token_id,
+            "token": user.token,
+            "user_id": str(user.id),
+        }
+    monkeypatch.setattr("app.services.auth_sync.AuthServiceClient", lambda: client)
+    service = AuthSyncService(db_session)
+    user_ids = [user.id for user in users]
+
+    first = await service.sync_users_by_ids(user_ids)
+    client.updated.clear()
+    users[1].max_sessions = 3
+    second = await service.sync_users_by_ids(user_ids)
+
+    assert (first["patched"], first["unchanged"]) == (3, 0)
+    assert (second["patched"], second["unchanged"]) == (1, 2)
+    assert [token_id for token_id, _data in client.updated] == [2]
+
+    client.updated.clear()
+    forced = await service.sync_users_by_ids(user_ids, force=True)
+    assert (forced["patched"], forced["unchanged"]) == (3, 0)
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+
+from app.clients.auth_service import BulkUpdateResult
+from app.clients.stream_provider import ProviderStream
+from app.config import Settings
+from app.models import Channel, Package, StreamSource, SyncStatus, Tariff, User, UserStatus
+from app.services.auth_sync import AuthSyncService
+from app.services.channel_sync import ChannelSyncService
+
+
+class FakeProvider:
+    def __init__(self, streams: list[ProviderStream]) -> None:
+        self.streams = streams
+
+    async def get_streams(self) -> list[ProviderStream]:
+        return self.streams
+
+
+class RecordingAuthClient:
+    def __init__(self) -> None:
+        self.created = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def create_token(self, data):
+        self.created.append(data)
+        return 100 + len(self.created)
+
+    async def find_token_by_value(self, token):
+        return None
+
+    async def delete_token(self, token_id):
+        return None
+
+
+class PatchingAuthClient(RecordingAuthClient):
+    def __init__(self) -> None:
+        super().__init__()
+        self.updated = {}
+        self.bulk_calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_token(self, token_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"id": token_id, "token": f"token-{token_id}", "user_id": self.user_ids[token_id]}
+
+    async def bulk_update_tokens(self, updates):
+        self.bulk_calls.append(sorted(token_id for token_id, _data in updates))
+        for token_id, data in updates:
+            self.updated[token_id] = data.allowed_streams
+        return BulkUpdateResult(updated={token_id for token_id, _data in updates})
+
+
+def sync_settings(**overrides) -> Settings:
+    return Settings.model_construct(**overrides)
+
+
+def make_user(agreement_number: str, **kwargs) -> User:
+    return User(
+        first_name="A",
+        last_name="B",
+        agreement_number=agreement_number,
+        status=UserStatus.ENABLED,
+        max_sessions=1,
+        token=f"token-{agreement_number}",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_propagates_auth_only_to_users_of_orphaned_or_revived_channels(
+    db_session, monkeypatch
+):
+    gone = Channel(source=StreamSource.FLUSSONIC, stream_name="gone", sync_status=SyncStatus.SYNCED)
+    back = Channel(source=StreamSource.FLUSSONIC, stream_name="back", sync_status=SyncStatus.ORPHANED)
+    stable = Channel(source=StreamSource.FLUSSONIC, stream_name="stable", sync_status=SyncStatus.SYNCED)
+    back_package = Package(name="Back", channels=[back])
+    stable_tariff = Tariff(name="Stable", packages=[Package(name="Stable", channels=[stable])])
+    direct_user = make_user("1", channels=[gone, stable])
+    package_user = make_user("2", packages=[back_package])
+    unaffected_user = make_user("3", tariffs=[stable_tariff])
+    db_session.add_all([direct_user, package_user, unaffected_user])
+    await db_session.flush()
+
+    client = RecordingAuthClient()
+    monkeypatch.setattr("app.services.auth_sync.AuthServiceClient", lambda: client)
+    monkeypatch.setattr(
+        "app.services.channel_sync.get_stream_provider",
+        lambda source: FakeProvider([ProviderStream(name="back"), ProviderStream(name="stable")]),
+    )
+
+    result = await ChannelSyncService(db_session).sync(StreamSource.FLUSSONIC)
+
+    assert result.orphaned == 1
+    assert result.revived == 1
+    assert result.changed_channel_ids == {gone.id, back.id}
+    assert result.auth_users_synced == 2
+    created = {data.user_id: data.allowed_streams for data in client.created}
+    assert created == {str(direct_user.id): ["stable"], str(package_user.id): ["back"]}
+
+
+@pytest.mark.asyncio
+async def test_user_ids_for_channels_covers_direct_package_and_tariff_entitlements(db_session):
+    channel = Channel(source=StreamSource.NIMBLE, stream_name="news")
+    package = Package(name="News", channels=[channel])
+    direct_user = make_user("10", channels=[channel])
+    package_user = make_user("11", packages=[package])
+    tariff_user = make_user("12", tariffs=[Tariff(name="Basic", packages=[package])])
+    other_user = make_user("13")
+    db_session.add_all([direct_user, package_user, tariff_user, other_user])
+    await db_session.flush()
+
+    user_ids = await AuthSyncService(db_session).get_user_ids_for_channels([channel.id])
+
+    assert user_ids == sorted([direct_user.id, package_user.id, tariff_user.id])
+
+
+@pytest.mark.asyncio
+async def test_sync_patches_existing_auth_tokens_in_batches_with_bounded_concurrency(
+    db_session, monkeypatch
+):
+    news = Channel(source=StreamSource.FLUSSONIC, stream_name="news", sync_status=SyncStatus.ORPHANED)
+    sport = Channel(source=StreamSource.FLUSSONIC, stream_name="sport", sync_status=SyncStatus.SYNCED)
+    users = [
+        make_user(str(number), channels=[news, sport], auth_token_id=number)
+        for number in range(1, 6)
+    ]
+    for user in users:
+        user.token = f"token-{user.auth_token_id}"
+    db_session.add_all(users)
+    await db_session.flush()
+
+    client = PatchingAuthClient()
+    client.user_ids = {user.auth_token_id: str(user.id) for user in users}
+    settings = sync_settings(auth_sync_batch_size=2, auth_sync_concurrency=2)
+    monkeypatch.setattr("app.services.auth_sync.AuthServiceClient", lambda: client)
+    monkeypatch.setattr("app.services.auth_sync.get_settings", lambda: settings)
+    monkeypatch.setattr("app.services.channel_sync.get_settings", lambda: settings)
+    monkeypatch.setattr(
+        "app.services.channel_sync.get_stream_provider",
+        lambda source: FakeProvider([ProviderStream(name="news"), ProviderStream(name="sport")]),
+    )
+
+    result = await ChannelSyncService(db_session).sync(StreamSource.FLUSSONIC)
+
+    assert result.revived == 1
+    assert result.auth_users_synced == 5
+    assert client.created == []
+    assert client.updated == {number: ["news", "sport"] for number in range(1, 6)}
+    assert client.bulk_calls == [[1, 2], [3, 4], [5]]
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_auth_propagation_when_provider_listing_is_empty(db_session, monkeypatch):
+    channels = [
+        Channel(source=StreamSource.NIMBLE, stream_name=name, sync_status=SyncStatus.SYNCED)
+        for name in ("one", "two")
+    ]
+    db_session.add(make_user("20", channels=channels))
+    await db_session.flush()
+
+    client = RecordingAuthClient()
+    monkeypatch.setattr("app.services.auth_sync.AuthServiceClient", lambda: client)
+    monkeypatch.setattr(
+        "app.services.channel_sync.get_settings",
+        lambda: sync_settings(channel_sync_max_orphan_ratio=0.5),
+    )
+    monkeypatch.setattr(
+        "app.services.channel_sync.get_stream_provider", lambda source: FakeProvider([])
+    )
+
+    result = await ChannelSyncService(db_session).sync(StreamSource.NIMBLE)
+
+    assert result.orphaned == 2
+    assert result.auth_propagation_skipped is True
+    assert result.auth_users_synced == 0
+    assert client.created == []
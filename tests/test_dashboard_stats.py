@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import Settings
+from app.models import Channel, Group, StreamSource, SyncStatus, User, UserStatus
+from app.services import dashboard_stats
+from app.services.dashboard_stats import DashboardService, dashboard_counters
+
+
+def make_user(number: str, status: UserStatus = UserStatus.ENABLED) -> User:
+    return User(
+        first_name="A",
+        last_name="B",
+        agreement_number=number,
+        status=status,
+        max_sessions=1,
+        token=f"token-{number}",
+    )
+
+
+def make_channel(name: str, status: SyncStatus = SyncStatus.SYNCED, seen: datetime | None = None) -> Channel:
+    return Channel(source=StreamSource.FLUSSONIC, stream_name=name, sync_status=status, last_seen_at=seen)
+
+
+@pytest.fixture
+def counters_enabled(monkeypatch):
+    settings = Settings.model_construct(dashboard_counters_enabled=True, dashboard_counters_resync_seconds=3600)
+    monkeypatch.setattr(dashboard_stats, "get_settings", lambda: settings)
+    dashboard_counters.reset()
+    dashboard_stats.install_dashboard_counter_listeners()
+    yield
+    event.remove(Session, "after_flush", dashboard_stats._collect_deltas)
+    event.remove(Session, "after_commit", dashboard_stats._apply_deltas)
+    event.remove(Session, "after_rollback", dashboard_stats._discard_deltas)
+    dashboard_counters.reset()
+
+
+@pytest.mark.asyncio
+async def test_dashboard_counts_come_from_one_statement(db_session):
+    seen = datetime(2026, 1, 2, 3, 4, 5)
+    db_session.add_all(
+        [
+            make_channel("one", seen=seen),
+            make_channel("two", SyncStatus.ORPHANED),
+            Group(name="News"),
+            make_user("1"),
+            make_user("2", UserStatus.DISABLED),
+        ]
+    )
+    await db_session.flush()
+
+    statements = []
+
+    def record(*args):
+        statements.append(args[2])
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        counts = await DashboardService(db_session).count_all()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert (counts.channels_total, counts.channels_synced, counts.channels_orphaned) == (2, 1, 1)
+    assert (counts.groups, counts.packages, counts.tariffs) == (1, 0, 0)
+    assert (counts.users, counts.users_enabled, counts.users_disabled) == (2, 1, 1)
+    assert counts.last_sync == seen
+
+
+@pytest.mark.asyncio
+async def test_dashboard_counters_follow_committed_writes_without_recounting(db_session, counters_enabled):
+    service = DashboardService(db_session)
+    recounts = 0
+    count_all = service.count_all
+
+    async def counting_count_all():
+        nonlocal recounts
+        recounts += 1
+        return await count_all()
+
+    service.count_all = counting_count_all
+    assert (await service.get_counts()).users == 0
+
+    user = make_user("1")
+    channel = make_channel("one")
+    db_session.add_all([user, channel, make_user("2")])
+    await db_session.commit()
+
+    user.status = UserStatus.DISABLED
+    channel.sync_status = SyncStatus.ORPHANED
+    await db_session.commit()
+
+    db_session.add(Group(name="Rolled back"))
+    await db_session.flush()
+    await db_session.rollback()
+
+    counts = await service.get_counts()
+    assert (counts.users, counts.users_enabled) == (2, 1)
+    assert (counts.channels_total, counts.channels_synced) == (1, 0)
+    assert counts.groups == 0
+    assert recounts == 1
+    assert counts == await count_all()
@@ -0,0 +1,108 @@
+import httpx
+import pytest
+
+from app.clients import edge_load, flussonic
+from app.clients.edge_load import EdgeLoadRefresher, EdgeLoadTable
+from app.clients.flussonic import FlussonicClient
+from app.clients.stream_provider import ProviderNodeStats
+from app.config import Settings
+from app.exceptions import NimbleError
+from app.models import StreamSource
+from app.utils.hash_ring import HashRing
+
+EDGES = ["http://edge-1", "http://edge-2", "http://edge-3"]
+
+
+def use_settings(monkeypatch, **overrides) -> None:
+    values = {
+        "edge_load_refresh_seconds": 15,
+        "edge_max_outgoing_kbit": 1000,
+        "edge_max_clients": None,
+        "edge_resume_ratio": 0.8,
+        "edge_drain_urls": None,
+    }
+    settings = Settings.model_construct(**{**values, **overrides})
+    monkeypatch.setattr(edge_load, "get_settings", lambda: settings)
+
+
+def node(url: str, outgoing_kbit: int, health: str = "up") -> ProviderNodeStats:
+    return ProviderNodeStats(name=url, url=url, health=health, outgoing_kbit=outgoing_kbit)
+
+
+def test_hot_edge_hands_its_tokens_to_the_next_edge_until_it_cools_down(monkeypatch):
+    use_settings(monkeypatch)
+    table = EdgeLoadTable(clock=lambda: 100.0)
+    ring = HashRing(EDGES)
+    tokens = [token for token in (f"token-{index}" for index in range(200)) if ring.node_for(token) == EDGES[0]]
+
+    table.update([node(EDGES[0], 1200), node(EDGES[1], 100), node(EDGES[2], 100)])
+    assert all(table.pick(ring, token) != EDGES[0] for token in tokens)
+
+    table.update([node(EDGES[0], 900)])
+    assert not table.is_available(EDGES[0])
+
+    table.update([node(EDGES[0], 700)])
+    assert all(table.pick(ring, token) == EDGES[0] for token in tokens)
+
+
+def test_draining_down_and_stale_edges(monkeypatch):
+    use_settings(monkeypatch, edge_drain_urls="http://edge-2/")
+    now = [100.0]
+    table = EdgeLoadTable(clock=lambda: now[0])
+
+    table.update([node(EDGES[0], 0, health="down")])
+
+    assert not table.is_available(EDGES[0])
+    assert not table.is_available(EDGES[1])
+    assert table.is_available(EDGES[2])
+
+    now[0] += 46
+    assert table.is_available(EDGES[0])
+
+
+def test_pick_falls_back_to_token_edge_when_every_edge_is_out(monkeypatch):
+    use_settings(monkeypatch, edge_drain_urls=",".join(EDGES))
+    ring = HashRing(EDGES)
+
+    assert EdgeLoadTable().pick(ring, "token") == ring.node_for("token")
+
+
+@pytest.mark.asyncio
+async def test_refresh_probes_edge_nodes_without_listing_streams(monkeypatch):
+    use_settings(monkeypatch)
+    settings = Settings.model_construct(
+        flussonic_url="http://origin",
+        flussonic_username="admin",
+        flussonic_password="secret",
+        flussonic_edge_urls=",".join(EDGES[:2]),
+        flussonic_dashboard_readiness_timeout=1,
+        flussonic_dashboard_stats_timeout=1,
+    )
+    monkeypatch.setattr(flussonic, "get_settings", lambda: settings)
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(f"{request.url.host}{request.url.path}")
+        if request.url.path.endswith("/readiness"):
+            return httpx.Response(200)
+        output_kbit = 5000 if request.url.host == "edge-1" else 10
+        return httpx.Response(200, json={"streamer_status": "running", "output_kbit": output_kbit})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+
+        def provider(source: StreamSource) -> FlussonicClient:
+            if source != StreamSource.FLUSSONIC:
+                raise NimbleError("Not configured")
+            return FlussonicClient(http_client)
+
+        monkeypatch.setattr(edge_load, "get_stream_provider", provider)
+        table = EdgeLoadTable()
+        await EdgeLoadRefresher(table).refresh_once()
+
+    assert sorted(requested) == sorted(
+        f"{edge.removeprefix('http://')}{endpoint}"
+        for edge in EDGES[:2]
+        for endpoint in (flussonic.V3_READINESS_ENDPOINT, flussonic.V3_STATS_ENDPOINT)
+    )
+    assert not table.is_available(EDGES[0])
+    assert table.is_available(EDGES[1])
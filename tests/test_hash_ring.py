@@ -0,0 +1,31 @@
+import pytest
+
+from app.utils.hash_ring import HashRing
+
+
+def test_hash_ring_only_moves_keys_owned_by_a_removed_node():
+    nodes = ["http://edge-1", "http://edge-2", "http://edge-3", "http://edge-4"]
+    keys = [f"token-{index}" for index in range(2000)]
+    before = HashRing(nodes)
+    after = HashRing([node for node in nodes if node != "http://edge-3"])
+
+    moved = [key for key in keys if before.node_for(key) != after.node_for(key)]
+
+    assert moved
+    assert all(before.node_for(key) == "http://edge-3" for key in moved)
+    shares = {node: sum(before.node_for(key) == node for key in keys) for node in nodes}
+    assert min(shares.values()) > len(keys) / len(nodes) / 2
+
+
+def test_hash_ring_walks_every_node_once_from_the_owner():
+    ring = HashRing(["a", "b", "c"])
+
+    walk = list(ring.iter_nodes("token"))
+
+    assert walk[0] == ring.node_for("token")
+    assert sorted(walk) == ["a", "b", "c"]
+
+
+def test_hash_ring_requires_a_node():
+    with pytest.raises(ValueError):
+        HashRing([])
@@ -0,0 +1,58 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.epg_service import EpgServiceClient
+from app.clients.http import AUTH, EPG, HttpClientRegistry, http_clients
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_one_pool_per_service_until_closed():
+    registry = HttpClientRegistry()
+
+    auth_client = registry.get(AUTH)
+    assert registry.get(AUTH) is auth_client
+    assert registry.get(EPG) is not auth_client
+
+    await registry.aclose()
+
+    assert auth_client.is_closed
+    assert registry.get(AUTH) is not auth_client
+    await registry.aclose()
+
+
+def test_registry_closes_clients_replaced_for_another_event_loop():
+    registry = HttpClientRegistry()
+
+    async def get_client() -> httpx.AsyncClient:
+        return registry.get(AUTH)
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+    assert second is not first
+    assert not first.is_closed
+
+    asyncio.run(registry.aclose())
+
+    assert first.is_closed
+    assert second.is_closed
+
+
+@pytest.mark.asyncio
+async def test_clients_use_registry_override_for_outbound_requests():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"status": "up"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        http_clients.override(EPG, client)
+        try:
+            payload = await EpgServiceClient().get_health()
+        finally:
+            http_clients.override(EPG, None)
+
+    assert payload == {"status": "up"}
+    assert requests[0].url.path == "/health"
@@ -0,0 +1,174 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.config import Settings
+from app.exceptions import ValidationError
+from app.models import Channel, Group, User, UserStatus
+from app.services.channel_service import ChannelService
+from app.services.user_service import UserService
+from app.utils import count_cache as count_cache_module
+from app.utils import keyset
+from app.utils.count_cache import install_count_cache_listeners, list_counts
+from app.utils.pagination import PaginationParams
+from app.utils.sql_stats import track_statements
+
+
+@pytest.fixture(autouse=True)
+def list_settings(monkeypatch):
+    settings = Settings.model_construct(pagination_count_cap=5, list_count_cache_seconds=0)
+    monkeypatch.setattr(keyset, "get_settings", lambda: settings)
+    monkeypatch.setattr(count_cache_module, "get_settings", lambda: settings)
+    return settings
+
+
+async def _walk(fetch, per_page: int) -> list:
+    """Every item of a list, page by page through ``next_cursor``."""
+    items, cursor = [], None
+    while True:
+        result = await fetch(PaginationParams(per_page=per_page, cursor=cursor))
+        items.extend(result.items)
+        if not result.has_more:
+            return items
+        cursor = result.next_cursor
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("sort_by", "sort_dir"),
+    [
+        ("channel_number", "asc"),
+        ("channel_number", "desc"),
+        ("display_name", "desc"),
+        ("sort_order", "asc"),
+    ],
+)
+async def test_channel_cursor_pages_match_a_single_ordered_page(db_session, sort_by, sort_dir):
+    groups = [Group(name="b", sort_order=2), Group(name="a", sort_order=1)]
+    db_session.add_all(
+        [
+            Channel(
+                stream_name=f"stream-{i}",
+                # Repeated and missing numbers, names and groups exercise ties and NULLs.
+                channel_number=i % 4 or None,
+                display_name=None if i % 3 == 0 else f"name-{i % 5}",
+                sort_order=i % 3,
+                groups=[groups[i % 2]] if i % 5 else [],
+            )
+            for i in range(17)
+        ]
+    )
+    await db_session.flush()
+    service = ChannelService(db_session)
+
+    async def fetch(pagination):
+        return await service.get_paginated(pagination, sort_by=sort_by, sort_dir=sort_dir)
+
+    everything = (await fetch(PaginationParams(per_page=100))).items
+    walked = await _walk(fetch, per_page=4)
+
+    assert [c.id for c in walked] == [c.id for c in everything]
+    assert len(walked) == 17
+
+
+@pytest.mark.asyncio
+async def test_user_cursor_pages_follow_enum_and_datetime_sorts(db_session):
+    start = datetime(2026, 1, 1)
+    db_session.add_all(
+        [
+            User(
+                first_name="U",
+                last_name=f"L{i % 3}",
+                agreement_number=f"A-{i}",
+                token=f"t{i}",
+                status=UserStatus.DISABLED if i % 2 else UserStatus.ENABLED,
+                created_at=start + timedelta(days=i % 4),
+            )
+            for i in range(11)
+        ]
+    )
+    await db_session.flush()
+    service = UserService(db_session)
+
+    for sort_by in ("status", "created_at", "name"):
+
+        async def fetch(pagination):
+            return await service.get_paginated(pagination, sort_by=sort_by, sort_dir="desc")
+
+        everything = (await fetch(PaginationParams(per_page=100))).items
+        walked = await _walk(fetch, per_page=3)
+        assert [u.id for u in walked] == [u.id for u in everything], sort_by
+
+
+@pytest.mark.asyncio
+async def test_cursor_of_another_sort_is_rejected(db_session):
+    db_session.add_all([Channel(stream_name=f"s{i}", channel_number=i) for i in range(3)])
+    await db_session.flush()
+    service = ChannelService(db_session)
+
+    first = await service.get_paginated(PaginationParams(per_page=2))
+    with pytest.raises(ValidationError):
+        await service.get_paginated(
+            PaginationParams(per_page=2, cursor=first.next_cursor), sort_dir="desc"
+        )
+    with pytest.raises(ValidationError):
+        await service.get_paginated(PaginationParams(per_page=2, cursor="not-a-cursor"))
+
+
+@pytest.mark.asyncio
+async def test_count_modes(db_session):
+    db_session.add_all([Channel(stream_name=f"s{i}") for i in range(8)])
+    await db_session.flush()
+    service = ChannelService(db_session)
+
+    exact = await service.get_paginated(PaginationParams(per_page=3))
+    capped = await service.get_paginated(PaginationParams(per_page=3, count="capped"))
+    uncounted = await service.get_paginated(PaginationParams(per_page=3, count="none"))
+
+    assert (exact.total, exact.pages, exact.total_capped) == (8, 3, False)
+    assert (capped.total, capped.total_capped) == (5, True)
+    assert (uncounted.total, uncounted.pages, uncounted.has_more) == (None, None, True)
+
+
+@pytest.fixture
+def count_cache(list_settings):
+    list_settings.list_count_cache_seconds = 60
+    install_count_cache_listeners()
+    list_counts.clear()
+    yield list_counts
+    list_counts.clear()
+
+
+@pytest.mark.asyncio
+async def test_list_totals_are_cached_per_filter_until_a_counted_table_is_written(
+    db_session, count_cache
+):
+    db_session.add_all([Channel(stream_name=f"news-{i}") for i in range(3)])
+    db_session.add(User(first_name="A", last_name="B", agreement_number="A-1", token="t"))
+    await db_session.commit()
+    channels = ChannelService(db_session)
+
+    with track_statements() as first:
+        page = await channels.get_paginated(PaginationParams(per_page=2), search="News")
+    with track_statements() as second:
+        await channels.get_paginated(
+            PaginationParams(per_page=2, cursor=page.next_cursor), search="news"
+        )
+    assert page.total == 3
+    assert second.count == first.count - 1
+
+    # Another filter or count mode is counted on its own.
+    other = await channels.get_paginated(PaginationParams(per_page=2), search="news-1")
+    assert other.total == 1
+
+    # Users are not counted from channels: their writes leave the channel totals cached.
+    user = (await UserService(db_session).get_paginated(PaginationParams())).items[0]
+    user.max_sessions = 3
+    await db_session.commit()
+    with track_statements() as cached:
+        await channels.get_paginated(PaginationParams(per_page=2), search="news")
+    assert cached.count == second.count
+
+    db_session.add(Channel(stream_name="news-3"))
+    await db_session.commit()
+    assert (await channels.get_paginated(PaginationParams(per_page=2), search="news")).total == 4
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.utils.probe_cache import ProbeCache
+
+
+class CountingProbe:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        return call
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_probe_and_fresh_entries_are_reused():
+    cache: ProbeCache[int] = ProbeCache(ttl=60, max_stale=300)
+    probe = CountingProbe(delay=0.05)
+
+    results = await asyncio.gather(*(cache.get("auth", probe) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert await cache.get("auth", probe) == 1
+    assert probe.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_one_background_refresh_runs():
+    now = [1000.0]
+    cache: ProbeCache[int] = ProbeCache(ttl=10, max_stale=300, clock=lambda: now[0])
+    probe = CountingProbe(delay=0.05)
+    assert await cache.get("epg", probe) == 1
+
+    now[0] += 11
+    stale = await asyncio.gather(*(cache.get("epg", probe) for _ in range(5)))
+    assert stale == [1] * 5
+
+    await asyncio.sleep(0.1)
+    assert await cache.get("epg", probe) == 2
+    assert probe.calls == 2
+
+    now[0] += 301
+    assert await cache.get("epg", probe) == 3
+
+
+@pytest.mark.asyncio
+async def test_caller_timeout_does_not_cancel_shared_probe():
+    cache: ProbeCache[int] = ProbeCache(ttl=60, max_stale=300)
+    probe = CountingProbe(delay=0.1)
+
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(cache.get("flussonic", probe), 0.01)
+
+    await asyncio.sleep(0.15)
+    assert await cache.get("flussonic", probe) == 1
+    assert probe.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_discards_result_of_probe_already_in_flight():
+    cache: ProbeCache[int] = ProbeCache(ttl=60, max_stale=300)
+    probe = CountingProbe(delay=0.05)
+
+    in_flight = asyncio.create_task(cache.get("epg", probe))
+    await asyncio.sleep(0)
+    cache.invalidate("epg")
+
+    assert await in_flight == 1
+    assert await cache.get("epg", probe) == 2
+    assert probe.calls == 2
@@ -0,0 +1,165 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.clients import flussonic, nimble
+from app.clients.flussonic import FlussonicClient
+from app.clients.nimble import NimbleClient
+from app.config import Settings
+from app.exceptions import FlussonicError
+
+
+def provider_settings(**overrides) -> Settings:
+    return Settings.model_construct(
+        flussonic_url="http://flussonic.test",
+        flussonic_username="admin",
+        flussonic_password="secret",
+        wmspanel_api_url="http://wmspanel.test",
+        wmspanel_client_id="client",
+        wmspanel_api_key="key",
+        wmspanel_server_id="srv",
+        nimble_playback_url="http://nimble.test",
+        **overrides,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_stream_stats_cache():
+    flussonic._stream_stats_cache.clear()
+    yield
+    flussonic._stream_stats_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_flussonic_dashboard_fetches_parts_concurrently_and_keeps_traffic_on_listing_timeout(
+    monkeypatch,
+):
+    settings = provider_settings(
+        flussonic_dashboard_readiness_timeout=1,
+        flussonic_dashboard_stats_timeout=1,
+        flussonic_dashboard_streams_timeout=0.2,
+    )
+    monkeypatch.setattr(flussonic, "get_settings", lambda: settings)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/streams"):
+            await asyncio.sleep(5)
+        await asyncio.sleep(0.1)
+        if request.url.path.endswith("/readiness"):
+            return httpx.Response(200)
+        return httpx.Response(
+            200,
+            json={"streamer_status": "running", "input_kbit": 10, "output_kbit": 20, "total_clients": 3},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        started = time.perf_counter()
+        stats = await FlussonicClient(http_client).get_dashboard_stats()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.5
+    assert stats.health == "degraded"
+    assert (stats.incoming_kbit, stats.outgoing_kbit, stats.total_clients) == (10, 20, 3)
+    assert stats.total_sources is None
+    assert stats.active_source_counters is None
+    assert "fetch Flussonic streams" in stats.error
+
+
+@pytest.mark.asyncio
+async def test_flussonic_dashboard_raises_when_every_part_fails(monkeypatch):
+    monkeypatch.setattr(flussonic, "get_settings", provider_settings)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        with pytest.raises(FlussonicError):
+            await FlussonicClient(http_client).get_dashboard_stats()
+
+
+@pytest.mark.asyncio
+async def test_nimble_dashboard_keeps_stream_counts_when_server_details_fail(monkeypatch):
+    monkeypatch.setattr(nimble, "get_settings", provider_settings)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/live/streams"):
+            return httpx.Response(
+                200,
+                json={
+                    "streams": [
+                        {"application": "live", "stream": "one", "status": "online"},
+                        {"application": "live", "stream": "two", "status": "offline"},
+                        {"application": "other", "stream": "three", "status": "online"},
+                    ]
+                },
+            )
+        return httpx.Response(503)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        stats = await NimbleClient(http_client).get_dashboard_stats()
+
+    assert stats.health == "degraded"
+    assert (stats.total_sources, stats.good_sources, stats.broken_sources) == (2, 1, 1)
+    assert stats.incoming_kbit is None
+    assert "server details" in stats.error
+
+
+@pytest.mark.asyncio
+async def test_flussonic_stream_listing_keeps_filling_cache_after_dashboard_budget(monkeypatch):
+    settings = provider_settings(flussonic_dashboard_streams_timeout=0.05)
+    monkeypatch.setattr(flussonic, "get_settings", lambda: settings)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/streams"):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"streams": [{"name": "one"}, {"name": "two"}]})
+        if request.url.path.endswith("/readiness"):
+            return httpx.Response(200)
+        return httpx.Response(200, json={"streamer_status": "running"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = FlussonicClient(http_client)
+        first = await client.get_dashboard_stats()
+        await asyncio.sleep(0.3)
+        second = await client.get_dashboard_stats()
+
+    assert first.total_sources is None
+    assert second.total_sources == 2
+    assert second.health == "up"
+
+
+@pytest.mark.asyncio
+async def test_flussonic_edges_pin_tokens_and_sum_node_stats(monkeypatch):
+    settings = provider_settings(flussonic_edge_urls="http://edge-1.test, http://edge-2.test/")
+    monkeypatch.setattr(flussonic, "get_settings", lambda: settings)
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/streams"):
+            return httpx.Response(200, json={"streams": [{"name": "one"}]})
+        if request.url.host == "edge-2.test":
+            raise httpx.ConnectError("refused", request=request)
+        if request.url.path.endswith("/readiness"):
+            return httpx.Response(200)
+        return httpx.Response(
+            200,
+            json={"streamer_status": "running", "input_kbit": 10, "output_kbit": 20, "total_clients": 3},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = FlussonicClient(http_client)
+        stats = await client.get_dashboard_stats()
+
+    urls = {client.build_stream_url("news", f"token-{index}").split("/news")[0] for index in range(50)}
+    assert urls == {"http://edge-1.test", "http://edge-2.test"}
+    assert client.build_stream_url("news", "token-1") == client.build_stream_url("news", "token-1")
+    assert client.build_stream_url("sport", "token-1").startswith(client.edge_for("token-1"))
+
+    assert stats.health == "degraded"
+    assert (stats.outgoing_kbit, stats.total_clients, stats.total_sources) == (20, 3, 1)
+    assert [(node.name, node.health) for node in stats.nodes] == [
+        ("edge-1.test", "up"),
+        ("edge-2.test", "down"),
+    ]
+    assert stats.error.startswith("edge-2.test: ")
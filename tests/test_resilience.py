@@ -0,0 +1,100 @@
+import httpx
+import pytest
+
+from app.clients.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ResilientTransport,
+    RetryBudget,
+)
+
+
+async def no_sleep(_delay: float) -> None:
+    return None
+
+
+def resilient_client(handler, breaker: CircuitBreaker, budget: RetryBudget | None = None) -> httpx.AsyncClient:
+    transport = ResilientTransport(
+        httpx.MockTransport(handler),
+        breaker,
+        budget or RetryBudget(ratio=0.2),
+        max_retries=2,
+        backoff=0.01,
+        sleep=no_sleep,
+    )
+    return httpx.AsyncClient(transport=transport, base_url="http://upstream.test")
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried_on_connect_errors_but_post_is_not():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) % 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200)
+
+    async with resilient_client(handler, CircuitBreaker("svc", 10, 30)) as client:
+        response = await client.get("/items")
+        assert response.status_code == 200
+        assert calls == ["GET", "GET", "GET"]
+
+        with pytest.raises(httpx.ConnectError):
+            await client.post("/items")
+        assert calls[3:] == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_fails_fast_and_closes_after_half_open_probe():
+    now = [0.0]
+    breaker = CircuitBreaker("svc", failure_threshold=2, reset_timeout=30, clock=lambda: now[0])
+    healthy = [False]
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200 if healthy[0] else 503)
+
+    async with resilient_client(handler, breaker, RetryBudget(ratio=0, reserve=0)) as client:
+        assert (await client.get("/")).status_code == 503
+        assert (await client.get("/")).status_code == 503
+        assert breaker.status().state is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            await client.get("/")
+        assert calls == 2
+        assert breaker.status().retry_in == 30
+
+        now[0] = 31
+        healthy[0] = True
+        assert (await client.get("/")).status_code == 200
+        assert breaker.status().state is CircuitState.CLOSED
+
+
+def test_half_open_circuit_lets_one_probe_through():
+    now = [0.0]
+    breaker = CircuitBreaker("svc", failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    request = httpx.Request("GET", "http://upstream.test/")
+    breaker.record_failure()
+
+    now[0] = 10
+    breaker.before_request(request)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(request)
+
+    breaker.record_failure()
+    assert breaker.status().state is CircuitState.OPEN
+
+
+def test_retry_budget_caps_retries_to_a_share_of_requests():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert not budget.try_spend()
+    budget.deposit()
+    assert budget.try_spend()
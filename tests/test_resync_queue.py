@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from app.config import Settings
+from app.models import User, UserStatus
+from app.services import resync_queue
+from app.services.resync_queue import ResyncQueue
+
+
+@pytest.fixture(autouse=True)
+def queue_settings(monkeypatch):
+    settings = Settings.model_construct(
+        auth_resync_debounce_seconds=0.05, auth_resync_max_wait_seconds=5
+    )
+    monkeypatch.setattr(resync_queue, "get_settings", lambda: settings)
+    return settings
+
+
+class RecordingPush:
+    def __init__(self):
+        self.batches: list[list[int]] = []
+
+    async def __call__(self, user_ids):
+        self.batches.append(user_ids)
+
+
+@pytest.mark.asyncio
+async def test_burst_of_edits_pushes_each_user_once():
+    push = RecordingPush()
+    queue = ResyncQueue()
+    queue.start(push)
+
+    queue.add([1, 2])
+    await asyncio.sleep(0.01)
+    queue.add([2, 3])
+    queue.add([1])
+    assert queue.stats().depth == 3
+
+    await asyncio.sleep(0.2)
+
+    assert push.batches == [[1, 2, 3]]
+    stats = queue.stats()
+    assert (stats.depth, stats.requested, stats.pushed) == (0, 5, 3)
+    assert stats.merge_ratio == pytest.approx(0.4)
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_users_are_queued_only_when_the_transaction_commits(db_session, monkeypatch):
+    push = RecordingPush()
+    queue = ResyncQueue()
+    monkeypatch.setattr(resync_queue, "auth_resync_queue", queue)
+    queue.start(push)
+    user = User(
+        first_name="A",
+        last_name="B",
+        agreement_number="600",
+        status=UserStatus.ENABLED,
+        max_sessions=1,
+        token="token",
+    )
+    db_session.add(user)
+    await db_session.flush()
+
+    queue.add_after_commit(db_session, [user.id])
+    await db_session.rollback()
+    assert queue.stats().depth == 0
+
+    queue.add_after_commit(db_session, [7, 8])
+    await db_session.commit()
+    assert queue.stats().depth == 2
+
+    await queue.stop()
+    assert push.batches == [[7, 8]]
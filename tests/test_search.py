@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
+
+from app.models import Channel, User
+from app.services.channel_service import SEARCH_COLUMNS, ChannelService
+from app.services.user_service import UserService
+from app.utils.pagination import PaginationParams
+from app.utils.search import matches, relevance
+
+
+@pytest.mark.asyncio
+async def test_channel_lookup_ranks_prefix_matches_first_without_trigrams(db_session):
+    db_session.add_all(
+        [
+            Channel(stream_name="world-news", display_name="A World News"),
+            Channel(stream_name="news24", display_name="News 24"),
+            Channel(stream_name="sport", display_name="Sport"),
+            Channel(stream_name="newsroom", display_name=None),
+        ]
+    )
+    await db_session.flush()
+
+    channels = await ChannelService(db_session).search("news")
+
+    assert [channel.stream_name for channel in channels] == ["news24", "newsroom", "world-news"]
+
+
+@pytest.mark.asyncio
+async def test_user_search_matches_any_name_column(db_session):
+    db_session.add_all(
+        [
+            User(first_name="Anna", last_name="Petrova", agreement_number="A-1", token="t1"),
+            User(first_name="Ivan", last_name="Annenkov", agreement_number="A-2", token="t2"),
+            User(first_name="Oleg", last_name="Sidorov", agreement_number="ANN-3", token="t3"),
+            User(first_name="Petr", last_name="Ivanov", agreement_number="B-4", token="t4"),
+        ]
+    )
+    await db_session.flush()
+
+    result = await UserService(db_session).get_paginated(
+        PaginationParams(page=1, per_page=10), search="ann", sort_by="agreement_number"
+    )
+
+    assert [user.agreement_number for user in result.items] == ["A-1", "A-2", "ANN-3"]
+
+
+@pytest.mark.asyncio
+async def test_trigram_indexes_and_ranking_are_postgresql_only(db_session):
+    stmt = (
+        select(Channel)
+        .where(matches(SEARCH_COLUMNS, "news"))
+        .order_by(relevance("postgresql", SEARCH_COLUMNS, "news"))
+    )
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "greatest(similarity(channels.stream_name" in sql
+    assert "channels.stream_name ILIKE" in sql
+
+    indexes = await db_session.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE '%trgm'")
+    )
+    assert indexes.all() == []
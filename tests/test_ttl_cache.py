@@ -0,0 +1,46 @@
+import pytest
+
+from app.utils.ttl_cache import TTLCache
+
+
+class CountingFetch:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+@pytest.mark.asyncio
+async def test_cache_stays_within_its_cap_and_evicts_least_recently_used():
+    cache: TTLCache[int] = TTLCache(ttl=60, max_entries=3)
+    fetch = CountingFetch()
+
+    for user_id in range(10):
+        await cache.get(str(user_id), fetch)
+        assert len(cache) <= 3
+
+    await cache.get("7", fetch)  # hit; "8" is now the least recently used
+    await cache.get("10", fetch)
+
+    assert len(cache) == 3
+    assert fetch.calls == 11
+    assert await cache.get("7", fetch) == 8
+    assert await cache.get("8", fetch) == 12
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_refetched_and_swept():
+    now = [1000.0]
+    cache: TTLCache[int] = TTLCache(ttl=10, max_entries=100, clock=lambda: now[0])
+    fetch = CountingFetch()
+
+    for user_id in range(5):
+        await cache.get(str(user_id), fetch)
+    assert await cache.get("0", fetch) == 1
+
+    now[0] += 11
+    assert await cache.get("0", fetch) == 6
+    # The sweep dropped the other expired entries without them being read.
+    assert len(cache) == 1
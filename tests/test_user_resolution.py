@@ -1,6 +1,6 @@
 import pytest
 
-from app.models import Channel, Package, StreamSource, Tariff, User, UserStatus
+from app.models import Channel, Package, StreamSource, SyncStatus, Tariff, User, UserStatus
 from app.services.auth_sync import AuthSyncService
 from app.services.playlist_generator import PlaylistGenerator
 from app.services.user_service import UserService
@@ -63,6 +63,49 @@ async def test_resolve_channels_returns_empty_for_user_without_assignments(db_se
     assert await UserService(db_session).resolve_channels(user.id) == []
 
 
+
+@pytest.mark.asyncio
+async def test_resolve_channels_for_users_matches_per_user_resolution(db_session):
+    direct = Channel(source=StreamSource.FLUSSONIC, stream_name="direct", channel_number=2)
+    shared = Channel(source=StreamSource.FLUSSONIC, stream_name="shared", channel_number=1)
+    shared_nimble = Channel(source=StreamSource.NIMBLE, stream_name="shared", channel_number=3)
+    gone = Channel(
+        source=StreamSource.NIMBLE,
+        stream_name="gone",
+        channel_number=4,
+        sync_status=SyncStatus.ORPHANED,
+    )
+    package = Package(name="Base", channels=[shared, shared_nimble, gone])
+    tariff = Tariff(name="Premium", packages=[package])
+    users = [
+        User(
+            first_name="A",
+            last_name="B",
+            agreement_number=f"10{index}",
+            status=UserStatus.ENABLED,
+            max_sessions=1,
+            token=f"token-{index}",
+            **assignments,
+        )
+        for index, assignments in enumerate(
+            [{"channels": [direct, shared]}, {"tariffs": [tariff]}, {}], start=2
+        )
+    ]
+    db_session.add_all(users)
+    await db_session.flush()
+    service = UserService(db_session)
+    user_ids = [user.id for user in users]
+
+    streams = await service.resolve_channels_for_users(user_ids)
+    granted = await service.resolve_channels_for_users(user_ids, exclude_orphaned=True)
+
+    for user in users:
+        channels = await service.resolve_channels(user.id)
+        assert streams[user.id] == list(dict.fromkeys(channel.stream_name for channel in channels))
+    assert streams[users[1].id] == ["shared", "gone"]
+    assert granted == {users[0].id: ["shared", "direct"], users[1].id: ["shared"], users[2].id: []}
+
+
 def test_provider_variants_remain_playlist_rows_but_auth_sync_deduplicates_streams(monkeypatch):
     class FakeProvider:
         def build_stream_url(self, stream_name: str, token: str) -> str: